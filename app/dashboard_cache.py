@@ -0,0 +1,202 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from app.figures import load_dashboard_figures
+from app.redis_logic.breaker import BreakerRedis
+from app.summary_snapshot import SNAPSHOT_CHANNEL, current_version
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+_client: Optional[redis.Redis] = None
+_client_lock = threading.Lock()
+
+
+def get_page_client() -> redis.Redis:
+    """
+    Redis client for page loads and dashboard callbacks. Short timeouts, no
+    retries and the process's request breaker, so during an outage requests
+    fail fast without connecting at all. Nothing connects until the first page
+    is served.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            timeout = float(os.getenv("PAGE_REDIS_TIMEOUT", "0.5"))
+            _client = BreakerRedis.from_url(
+                os.getenv("REDIS_URL"),
+                socket_connect_timeout=timeout, socket_timeout=timeout,
+                retry=Retry(NoBackoff(), 0))
+        return _client
+
+
+class DashboardCache:
+    """
+    In-process cache of decoded dashboard figures in front of Redis, keyed by
+    (snapshot version, summary key). The refresh job publishes each new
+    version on SNAPSHOT_CHANNEL; a background subscriber swaps the version in
+    and drops the old entries, so between refreshes a callback never leaves
+    the process.
+
+    The version is also re-read from summary:current once it is `recheck`
+    seconds old (`unsubscribed_recheck` while the subscriber is down), which
+    covers messages missed across reconnects.
+    """
+
+    def __init__(self, client: redis.Redis, subscriber: Optional[redis.Redis] = None,
+                 recheck: float = 300.0, unsubscribed_recheck: float = 5.0):
+        self.client = client
+        self.subscriber = subscriber
+        self.recheck = recheck
+        self.unsubscribed_recheck = unsubscribed_recheck
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        self._entries: Dict[Tuple[Optional[str], str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._subscribed = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # --- Version tracking ---
+
+    def _set_version(self, version: Optional[str]) -> None:
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if version == self._version:
+                return
+            logger.info(f"Dashboard cache moving to snapshot {version} (was {self._version})")
+            self._version = version
+            self._entries = {key: value for key, value in self._entries.items() if key[0] == version}
+            self.invalidations += 1
+
+    def version(self) -> Optional[str]:
+        """Current snapshot version, from memory unless it is due for a recheck."""
+        self.start()
+        max_age = self.recheck if self._subscribed.is_set() else self.unsubscribed_recheck
+        with self._lock:
+            known = self._checked_at > 0
+            if known and time.monotonic() - self._checked_at < max_age:
+                return self._version
+        try:
+            version = current_version(self.client)
+        except redis.RedisError as e:
+            if not known:
+                raise
+            # Keep serving the snapshot we already hold; try again after max_age
+            logger.warning(f"Dashboard cache version check failed, keeping {self._version}: {e}")
+            with self._lock:
+                self._checked_at = time.monotonic()
+            return self._version
+        self._set_version(version)
+        return self._version
+
+    # --- Subscriber ---
+
+    def start(self) -> None:
+        """Start the subscriber thread on first use (in the worker, not at import)."""
+        if self.subscriber is None or self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._listen, name="dashboard-cache-subscriber", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _listen(self) -> None:
+        backoff = 1.0
+        while not self._stopped.is_set():
+            pubsub = self.subscriber.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(SNAPSHOT_CHANNEL)
+                self._subscribed.set()
+                # Anything published while we were disconnected is lost; re-read the pointer
+                with self._lock:
+                    self._checked_at = 0.0
+                backoff = 1.0
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message["type"] == "message":
+                        data = message["data"]
+                        self._set_version(data.decode("ascii") if isinstance(data, bytes) else data)
+            except redis.RedisError as e:
+                logger.warning(f"Dashboard cache subscriber disconnected: {e}")
+            finally:
+                self._subscribed.clear()
+                try:
+                    pubsub.close()
+                except redis.RedisError:
+                    pass
+            self._stopped.wait(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    # --- Reads ---
+
+    def figures(self, summary_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Decoded figures for `summary_key` in the current snapshot. Only a new
+        version (or a cold process) reaches Redis. None when Redis has neither
+        figures nor summary for the key.
+        """
+        version = self.version()
+        with self._lock:
+            cached = self._entries.get((version, summary_key))
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        figures = load_dashboard_figures(self.client, summary_key, version)
+        if figures is not None:
+            with self._lock:
+                # Skip the store if a newer version arrived while we were reading
+                if version == self._version:
+                    self._entries[(version, summary_key)] = figures
+        return figures
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "version": self._version,
+            "subscribed": self._subscribed.is_set(),
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+_cache: Optional[DashboardCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_dashboard_cache() -> DashboardCache:
+    """
+    Process-wide dashboard cache. Reads go through the short-timeout page
+    client; the subscriber gets its own connection, since it blocks.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            subscriber = None
+            if os.getenv("DASHBOARD_CACHE_PUBSUB", "1") != "0":
+                subscriber = redis.Redis.from_url(os.getenv("REDIS_URL"), health_check_interval=30)
+            _cache = DashboardCache(
+                get_page_client(), subscriber,
+                recheck=float(os.getenv("DASHBOARD_CACHE_RECHECK", "300")))
+        return _cache
@@ -3,32 +3,39 @@ from sqlalchemy.future import select
 from sqlalchemy import func, extract
 from datetime import datetime, timedelta
 from app.db_logic.db import engine
-from app.db_logic.models import NewsArticle
+from app.db_logic.models import NewsDailyRollup
 import asyncio
 
 
-async def get_daily_avg_sentiment(days: int = 30, category: str | None = None) -> dict[str, float]:
-    """
-    Returns a dict mapping date (YYYY-MM-DD) → average sentiment over the last 30 days.
-    If `category` is provided, only articles in that category are considered.
-    """
-    cutoff = datetime.utcnow() - timedelta(days=days)
+def build_daily_avg_sentiment_stmt(days: int = 30, category: str | None = None):
+    """Builds the per-day average sentiment query used by `get_daily_avg_sentiment`."""
+    cutoff = (datetime.utcnow() - timedelta(days=days)).date()
+    avg_sentiment = func.sum(NewsDailyRollup.sentiment_sum) / \
+        func.sum(NewsDailyRollup.article_count)
 
-    async with AsyncSession(engine) as session:
-        stmt = (
-            select(
-                func.date(NewsArticle.pubDate).label("day"),
-                func.avg(NewsArticle.sentiment).label("avg_sentiment")
-            )
-            .where(NewsArticle.pubDate >= cutoff)
+    stmt = (
+        select(
+            NewsDailyRollup.day,
+            avg_sentiment.label("avg_sentiment")
         )
+        .where(NewsDailyRollup.day >= cutoff)
+    )
+
+    if category:
+        stmt = stmt.where(NewsDailyRollup.category == category)
 
-        if category:
-            stmt = stmt.where(NewsArticle.category == category)
+    return stmt.group_by(NewsDailyRollup.day) \
+               .order_by(NewsDailyRollup.day)
 
-        stmt = stmt.group_by(func.date(NewsArticle.pubDate)) \
-                   .order_by(func.date(NewsArticle.pubDate))
 
+async def get_daily_avg_sentiment(days: int = 30, category: str | None = None) -> dict[str, float]:
+    """
+    Returns a dict mapping date (YYYY-MM-DD) → average sentiment over the last 30 days,
+    read from the daily rollup.
+    If `category` is provided, only articles in that category are considered.
+    """
+    async with AsyncSession(engine) as session:
+        stmt = build_daily_avg_sentiment_stmt(days=days, category=category)
         result = await session.execute(stmt)
         rows = result.all()
 
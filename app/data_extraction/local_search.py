@@ -0,0 +1,49 @@
+from sqlalchemy import func, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from datetime import datetime, timedelta
+from typing import List, Tuple
+import asyncio
+
+from app.db_logic.db import oneshot_engine
+from app.db_logic.models import NewsArticle
+
+
+def build_local_search_stmt(query: str, days: int = 30, limit: int = 500):
+    """Most recent articles whose title or description matches `query` (web-search syntax)."""
+    cutoff = datetime.utcnow() - timedelta(days=float(days))
+    return (
+        select(NewsArticle.pubDate, NewsArticle.sentiment)
+        # Inline config (not a bind) so the statement also compiles with literal_binds for EXPLAIN
+        .where(NewsArticle.search_vector.op("@@")(
+            func.websearch_to_tsquery(literal_column("'english'::regconfig"), query)))
+        .where(NewsArticle.pubDate >= cutoff)
+        .order_by(NewsArticle.pubDate.desc())
+        .limit(limit)
+    )
+
+
+async def search_local_articles(query: str, days: int = 30,
+                                limit: int = 500) -> Tuple[List[str], List[float]]:
+    """
+    Returns (dates, sentiments) of stored articles matching `query`, oldest first,
+    in the same shape custom search gets from the newsdata.io API.
+    """
+    async with AsyncSession(oneshot_engine) as session:
+        result = await session.execute(
+            build_local_search_stmt(query, days=days, limit=limit))
+        rows = result.all()
+
+    rows.reverse()
+    return ([pub_date.strftime("%Y-%m-%d %H:%M:%S") for pub_date, _ in rows],
+            [sentiment for _, sentiment in rows])
+
+
+def search_local_articles_sync(query: str, days: int = 30,
+                               limit: int = 500) -> Tuple[List[str], List[float]]:
+    """`search_local_articles` for synchronous callers such as Dash callbacks."""
+    return asyncio.run(search_local_articles(query, days=days, limit=limit))
+
+if __name__ == "__main__":
+    dates, sentiments = search_local_articles_sync("economy")
+    print(len(dates), list(zip(dates, sentiments))[:5])
@@ -1,44 +1,44 @@
-from sqlalchemy import func, case
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from datetime import datetime, timedelta
 import asyncio
 
 from app.db_logic.db import engine
-from app.db_logic.models import NewsArticle
+from app.db_logic.models import NewsDailyRollup
+
+
+def build_sentiment_pie_stmt(days: int = 30, category: str | None = None):
+    """Builds the good/okay/bad count query used by `get_sentiment_pie_data`."""
+    cutoff = (datetime.utcnow() - timedelta(days=days)).date()
+
+    stmt = (
+        select(
+            func.sum(NewsDailyRollup.good_count).label("good"),
+            func.sum(NewsDailyRollup.bad_count).label("bad"),
+            func.sum(NewsDailyRollup.okay_count).label("okay")
+        )
+        .where(NewsDailyRollup.day >= cutoff)
+    )
+
+    if category:
+        stmt = stmt.where(NewsDailyRollup.category == category)
+
+    return stmt
 
 
 async def get_sentiment_pie_data(days: int = 30, category: str | None = None) -> dict:
     """
     Returns a dictionary with sentiment class counts over the past `days`,
-    optionally filtered by category.
+    optionally filtered by category, read from the daily rollup.
 
     Categories:
         - good: sentiment > 0.4
         - okay: -0.4 <= sentiment <= 0.4
         - bad: sentiment < -0.4
     """
-    cutoff = datetime.utcnow() - timedelta(days=days)
-
     async with AsyncSession(engine) as session:
-        stmt = (
-            select(
-                func.sum(case((NewsArticle.sentiment > 0.4, 1), else_=0)).label(
-                    "good"),
-                func.sum(case((NewsArticle.sentiment < -0.4, 1),
-                         else_=0)).label("bad"),
-                func.sum(case(
-                    ((NewsArticle.sentiment >= -0.4) &
-                     (NewsArticle.sentiment <= 0.4), 1),
-                    else_=0
-                )).label("okay")
-            )
-            .where(NewsArticle.pubDate >= cutoff)
-        )
-
-        if category:
-            stmt = stmt.where(NewsArticle.category == category)
-
+        stmt = build_sentiment_pie_stmt(days=days, category=category)
         result = await session.execute(stmt)
         good, bad, okay = result.one()
 
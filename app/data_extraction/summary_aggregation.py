@@ -0,0 +1,136 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from datetime import datetime, timedelta, date
+from typing import Dict, Iterable, List, Optional, Any
+import asyncio
+
+from app.db_logic.db import engine
+from app.db_logic.models import NewsDailyRollup
+
+TOP_SOURCES_LIMIT = 10
+
+
+def build_aggregate_rows_stmt(days: int = 30):
+    """
+    Builds the single-scan query over the daily rollup for the last `days`.
+
+    Each row is one (day, category, source_id) with `article_count`,
+    `sentiment_sum` and `good_count`/`okay_count`/`bad_count`, which is
+    enough to rebuild the line graph, pie chart and top sources for any
+    shorter period or category.
+    """
+    cutoff = (datetime.utcnow() - timedelta(days=days)).date()
+
+    return (
+        select(
+            NewsDailyRollup.day,
+            NewsDailyRollup.category,
+            NewsDailyRollup.source_id,
+            NewsDailyRollup.article_count,
+            NewsDailyRollup.sentiment_sum,
+            NewsDailyRollup.good_count,
+            NewsDailyRollup.okay_count,
+            NewsDailyRollup.bad_count
+        )
+        .where(NewsDailyRollup.day >= cutoff)
+    )
+
+
+async def get_aggregate_rows(days: int = 30) -> List[Any]:
+    """Reads the last `days` of the daily rollup once; see `build_aggregate_rows_stmt`."""
+    async with AsyncSession(engine) as session:
+        result = await session.execute(build_aggregate_rows_stmt(days=days))
+        return result.all()
+
+
+class _SummaryAccumulator:
+    """Running totals for one (period, category) payload."""
+
+    def __init__(self):
+        self.day_counts: Dict[date, int] = {}
+        self.day_sums: Dict[date, float] = {}
+        self.pie = {"good": 0, "okay": 0, "bad": 0}
+        self.source_counts: Dict[str, int] = {}
+        self.source_sums: Dict[str, float] = {}
+
+    def add(self, row: Any) -> None:
+        day, source_id = row.day, row.source_id
+        count, total = int(row.article_count), float(row.sentiment_sum)
+        self.day_counts[day] = self.day_counts.get(day, 0) + count
+        self.day_sums[day] = self.day_sums.get(day, 0.0) + total
+        self.pie["good"] += row.good_count
+        self.pie["okay"] += row.okay_count
+        self.pie["bad"] += row.bad_count
+        self.source_counts[source_id] = self.source_counts.get(source_id, 0) + count
+        self.source_sums[source_id] = self.source_sums.get(source_id, 0.0) + total
+
+    def to_payload(self) -> dict:
+        line_graph = {
+            day.strftime("%Y-%m-%d %H:%M:%S"): self.day_sums[day] / self.day_counts[day]
+            for day in sorted(self.day_counts)
+        }
+        top = sorted(self.source_counts.items(),
+                     key=lambda item: item[1], reverse=True)[:TOP_SOURCES_LIMIT]
+        top_sources = [
+            {
+                "source": source_id,
+                "article_count": count,
+                "avg_sentiment": round(self.source_sums[source_id] / count, 4)
+            }
+            for source_id, count in top
+        ]
+        return {
+            "line_graph": line_graph,
+            "pie_chart": dict(self.pie),
+            "top_sources": top_sources,
+        }
+
+
+def build_summary_payloads(rows: Iterable[Any], periods: Dict[str, int],
+                           categories: Dict[str, Optional[str]],
+                           now: Optional[datetime] = None) -> Dict[str, dict]:
+    """
+    Builds every `{period}_{category}` payload from rollup rows in one pass.
+
+    `periods` maps a label to a number of days (e.g. {"weekly": 7}) and
+    `categories` maps a label to a category name, with None meaning all
+    categories (e.g. {"summary": None, "sports": "Sports"}). Periods are
+    aligned to whole days, so the oldest day is always reported in full.
+    """
+    now = now or datetime.utcnow()
+    windows = {label: (now - timedelta(days=days)).date()
+               for label, days in periods.items()}
+
+    accumulators: Dict[str, _SummaryAccumulator] = {}
+    by_category: Dict[Optional[str], List[tuple]] = {}
+    for period_label in periods:
+        for category_label, category in categories.items():
+            key = f"{period_label}_{category_label}"
+            accumulators[key] = _SummaryAccumulator()
+            by_category.setdefault(category, []).append(
+                (windows[period_label], accumulators[key]))
+
+    overall = by_category.get(None, [])
+    for row in rows:
+        targets = overall + by_category.get(row.category, [])
+        for since, accumulator in targets:
+            if row.day >= since:
+                accumulator.add(row)
+
+    return {key: accumulator.to_payload() for key, accumulator in accumulators.items()}
+
+
+async def get_summary_payloads(periods: Dict[str, int],
+                               categories: Dict[str, Optional[str]]) -> Dict[str, dict]:
+    """Scans the longest period once and returns every period × category payload."""
+    rows = await get_aggregate_rows(days=max(periods.values()))
+    return build_summary_payloads(rows, periods, categories)
+
+if __name__ == "__main__":
+    async def test():
+        payloads = await get_summary_payloads(
+            {"monthly": 30, "weekly": 7}, {"summary": None, "sports": "Sports"})
+        for key, payload in payloads.items():
+            print(key, payload["pie_chart"])
+
+    asyncio.run(test())
@@ -1,4 +1,4 @@
-import feedparser
+from app.feed_cache import get_feed_fetcher
 
 
 async def get_news_headlines(sector=None | str):
@@ -9,7 +9,8 @@ async def get_news_headlines(sector=None | str):
         #     return []
         link = f"https://news.google.com/rss/search?q={sector}&hl=en-US&gl=US&ceid=US:en"
 
-    feed = feedparser.parse(link)
+    # Conditional GET: unchanged feeds are answered with a 304 and the previous parse
+    feed = await get_feed_fetcher().afetch(link)
     top_headlines = []
 
     for entry in feed.entries[:10]:  # Get top 5
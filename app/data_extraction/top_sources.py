@@ -5,7 +5,30 @@ from datetime import datetime, timedelta
 import asyncio
 
 from app.db_logic.db import engine
-from app.db_logic.models import NewsArticle
+from app.db_logic.models import NewsDailyRollup
+
+
+def build_top_sources_stmt(days: int = 30, category: str | None = None):
+    """Builds the top sources query used by `get_top_sources_with_avg_sentiment`."""
+    cutoff = (datetime.utcnow() - timedelta(days=float(days))).date()
+    article_count = func.sum(NewsDailyRollup.article_count)
+
+    stmt = (
+        select(
+            NewsDailyRollup.source_id,
+            article_count.label("article_count"),
+            (func.sum(NewsDailyRollup.sentiment_sum) /
+             article_count).label("avg_sentiment")
+        )
+        .where(NewsDailyRollup.day >= cutoff)
+    )
+
+    if category:
+        stmt = stmt.where(NewsDailyRollup.category == category)
+
+    return stmt.group_by(NewsDailyRollup.source_id) \
+               .order_by(article_count.desc()) \
+               .limit(10)
 
 
 async def get_top_sources_with_avg_sentiment(days: int = 30, category: str | None = None):
@@ -13,27 +36,10 @@ async def get_top_sources_with_avg_sentiment(days: int = 30, category: str | Non
     Returns the top 5 sources by article count over the past `days`,
     along with their average sentiment scores.
 
-    Optionally filtered by `category`.
+    Optionally filtered by `category`. Reads from the daily rollup.
     """
-    cutoff = datetime.utcnow() - timedelta(days=float(days))
-
     async with AsyncSession(engine) as session:
-        stmt = (
-            select(
-                NewsArticle.source_id,
-                func.count(NewsArticle.id).label("article_count"),
-                func.avg(NewsArticle.sentiment).label("avg_sentiment")
-            )
-            .where(NewsArticle.pubDate >= cutoff)
-        )
-
-        if category:
-            stmt = stmt.where(NewsArticle.category == category)
-
-        stmt = stmt.group_by(NewsArticle.source_id) \
-                   .order_by(func.count(NewsArticle.id).desc()) \
-                   .limit(10)
-
+        stmt = build_top_sources_stmt(days=days, category=category)
         result = await session.execute(stmt)
         top_sources = result.all()
 
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import declarative_base
 # import asyncio
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from dotenv import load_dotenv
 import os
 
@@ -22,6 +23,17 @@ engine = create_async_engine(
     }
 )
 
+# For synchronous callers (Dash callbacks) that run each query under its own
+# asyncio.run(): pooled asyncpg connections can't outlive the loop that opened them
+oneshot_engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    poolclass=NullPool,
+    connect_args={
+        "timeout": 10
+    }
+)
+
 # Declarative base for defining models
 Base = declarative_base()
 
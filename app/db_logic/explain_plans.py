@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from typing import Any, Dict, List
+from sqlalchemy.ext.asyncio import AsyncConnection
+from app.db_logic.db import engine
+from app.data_extraction.line_graph_data import build_daily_avg_sentiment_stmt
+from app.data_extraction.pie_chart_data import build_sentiment_pie_stmt
+from app.data_extraction.top_sources import build_top_sources_stmt
+from app.data_extraction.summary_aggregation import build_aggregate_rows_stmt
+from app.data_extraction.local_search import build_local_search_stmt
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def dashboard_queries(days: int = 30, category: str = "Business") -> Dict[str, Any]:
+    """Every aggregation the refresh job runs, with and without a category filter, plus local search."""
+    return {
+        "line_graph": build_daily_avg_sentiment_stmt(days=days),
+        "line_graph_category": build_daily_avg_sentiment_stmt(days=days, category=category),
+        "pie_chart": build_sentiment_pie_stmt(days=days),
+        "pie_chart_category": build_sentiment_pie_stmt(days=days, category=category),
+        "top_sources": build_top_sources_stmt(days=days),
+        "top_sources_category": build_top_sources_stmt(days=days, category=category),
+        "summary_aggregation": build_aggregate_rows_stmt(days=days),
+        "local_search": build_local_search_stmt("economy", days=days),
+    }
+
+
+def _walk_plan(node: Dict[str, Any], scans: List[Dict[str, str]]) -> None:
+    """Collect every scan node (type, relation, index) from an EXPLAIN JSON plan."""
+    if "Relation Name" in node or "Index Name" in node:
+        scans.append({
+            "node": node["Node Type"],
+            "relation": node.get("Relation Name", ""),
+            "index": node.get("Index Name", ""),
+        })
+    for child in node.get("Plans", []):
+        _walk_plan(child, scans)
+
+
+async def explain_statement(conn: AsyncConnection, stmt) -> List[Dict[str, str]]:
+    """Run EXPLAIN (FORMAT JSON) on a SQLAlchemy statement and return its scan nodes."""
+    sql = stmt.compile(dialect=conn.dialect,
+                       compile_kwargs={"literal_binds": True})
+    # exec_driver_sql: the literal timestamps contain ":NN", which text() would read as binds
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    scans: List[Dict[str, str]] = []
+    _walk_plan(plan[0]["Plan"], scans)
+    return scans
+
+
+async def check_plans(days: int = 30, strict: bool = False) -> bool:
+    """
+    Print the scan strategy for each dashboard aggregation.
+    Returns False when `strict` is set and any query sequentially scans a table.
+    """
+    ok = True
+    async with engine.connect() as conn:
+        for name, stmt in dashboard_queries(days=days).items():
+            scans = await explain_statement(conn, stmt)
+            described = ", ".join(
+                f"{scan['node']} on {scan['relation'] or '?'}"
+                + (f" using {scan['index']}" if scan["index"] else "")
+                for scan in scans
+            )
+            seq_scan = any(scan["node"] == "Seq Scan" for scan in scans)
+            logger.info(f"{name}: {described}")
+            if seq_scan:
+                logger.warning(
+                    f"{name} uses a sequential scan (expected on small tables)")
+                if strict:
+                    ok = False
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Show which plans the dashboard aggregations use.")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--strict", action="store_true",
+                        help="exit non-zero if any query uses a sequential scan")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(check_plans(days=args.days, strict=args.strict)) else 1)
@@ -0,0 +1,138 @@
+import logging
+import asyncio
+from typing import Awaitable, Callable, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from app.db_logic.db import engine
+from app.db_logic.models import article_dedup_key, create_tables, GOOD_THRESHOLD, BAD_THRESHOLD
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Arbitrary key for pg_advisory_xact_lock so concurrent workers apply migrations one at a time
+MIGRATION_LOCK_ID = 724_911_305
+BACKFILL_BATCH_SIZE = 1000
+
+# --- Migrations ---
+# Every step must be idempotent: on a fresh database `create_all` has
+# already built the final schema and the step only has to no-op.
+
+
+async def _add_dedup_key(conn: AsyncConnection) -> None:
+    """Add news_articles.dedup_key, backfill it, drop duplicates and enforce uniqueness."""
+    await conn.execute(text(
+        "ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS dedup_key VARCHAR(64)"))
+
+    while True:
+        result = await conn.execute(text(
+            "SELECT id, link, title, source_id FROM news_articles "
+            "WHERE dedup_key IS NULL LIMIT :limit"
+        ), {"limit": BACKFILL_BATCH_SIZE})
+        rows = result.all()
+        if not rows:
+            break
+        await conn.execute(
+            text("UPDATE news_articles SET dedup_key = :key WHERE id = :id"),
+            [{"id": row.id, "key": article_dedup_key(row.link, row.title, row.source_id)}
+             for row in rows]
+        )
+
+    result = await conn.execute(text(
+        "DELETE FROM news_articles a USING news_articles b "
+        "WHERE a.dedup_key = b.dedup_key AND a.id > b.id"
+    ))
+    logger.info(f"Removed {result.rowcount} duplicate news articles")
+
+    await conn.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_news_articles_dedup_key "
+        "ON news_articles (dedup_key)"))
+    await conn.execute(text(
+        "ALTER TABLE news_articles ALTER COLUMN dedup_key SET NOT NULL"))
+
+
+async def _add_dashboard_indexes(conn: AsyncConnection) -> None:
+    """Indexes matching the pubDate/category filters used by app.data_extraction."""
+    await conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_news_articles_category_pubdate '
+        'ON news_articles (category, "pubDate") INCLUDE (sentiment, source_id)'))
+    await conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_news_articles_pubdate_covering '
+        'ON news_articles ("pubDate") INCLUDE (category, source_id, sentiment)'))
+    await conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_news_articles_pubdate_brin '
+        'ON news_articles USING brin ("pubDate")'))
+    # Refresh planner statistics so the new indexes are costed correctly
+    await conn.execute(text("ANALYZE news_articles"))
+
+
+async def _backfill_daily_rollup(conn: AsyncConnection) -> None:
+    """Seed news_daily_rollup from the articles stored before ingest started maintaining it."""
+    await conn.execute(text(
+        "INSERT INTO news_daily_rollup (day, category, source_id, article_count, "
+        "sentiment_sum, good_count, okay_count, bad_count) "
+        'SELECT date("pubDate"), category, source_id, count(*), sum(sentiment), '
+        "count(*) FILTER (WHERE sentiment > :good), "
+        "count(*) FILTER (WHERE sentiment BETWEEN :bad AND :good), "
+        "count(*) FILTER (WHERE sentiment < :bad) "
+        "FROM news_articles GROUP BY 1, 2, 3 "
+        "ON CONFLICT (day, category, source_id) DO NOTHING"
+    ), {"good": GOOD_THRESHOLD, "bad": BAD_THRESHOLD})
+
+
+async def _add_search_vector(conn: AsyncConnection) -> None:
+    """Store descriptions and index title + description for local full-text search."""
+    await conn.execute(text(
+        "ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS description TEXT"))
+    # Older rows have no description; their vector is built from the title alone
+    await conn.execute(text(
+        "ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', "
+        "coalesce(title, '') || ' ' || coalesce(description, ''))) STORED"))
+    await conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_news_articles_search_vector "
+        "ON news_articles USING gin (search_vector)"))
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[AsyncConnection], Awaitable[None]]]] = [
+    (1, "news_articles_dedup_key", _add_dedup_key),
+    (2, "news_articles_dashboard_indexes", _add_dashboard_indexes),
+    (3, "news_daily_rollup_backfill", _backfill_daily_rollup),
+    (4, "news_articles_search_vector", _add_search_vector),
+]
+
+
+async def run_migrations() -> None:
+    """Apply pending migrations in order, each in its own transaction."""
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version INTEGER PRIMARY KEY, name VARCHAR NOT NULL, "
+            "applied_at TIMESTAMP NOT NULL DEFAULT now())"
+        ))
+
+    for version, name, migrate in MIGRATIONS:
+        async with engine.begin() as conn:
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"),
+                               {"lock_id": MIGRATION_LOCK_ID})
+            applied = await conn.scalar(text(
+                "SELECT 1 FROM schema_migrations WHERE version = :version"
+            ), {"version": version})
+            if applied:
+                continue
+
+            logger.info(f"Applying migration {version}: {name}")
+            await migrate(conn)
+            await conn.execute(text(
+                "INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"
+            ), {"version": version, "name": name})
+
+
+async def migrate() -> None:
+    """Create missing tables, then bring existing ones up to date."""
+    await create_tables()
+    await run_migrations()
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
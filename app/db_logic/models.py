@@ -1,5 +1,9 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Text, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.db_logic.db import Base, engine
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Optional
+import hashlib
 import asyncio
 import logging
 
@@ -15,6 +19,83 @@ class NewsArticle(Base):
     sentiment = Column(Float, nullable=False)
     category = Column(String, nullable=False)
     link = Column(String)
+    # sha256 of the normalized link (or title + source when there is no link)
+    dedup_key = Column(String(64), nullable=False)
+    description = Column(Text)
+    # Maintained by Postgres; local custom search matches against it
+    search_vector = Column(TSVECTOR, Computed(
+        "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))",
+        persisted=True))
+
+    __table_args__ = (
+        Index("uq_news_articles_dedup_key", "dedup_key", unique=True),
+        # Dashboard queries filter on pubDate (optionally category) and group by
+        # day or source_id; INCLUDE lets them run as index-only scans
+        Index("ix_news_articles_category_pubdate", "category", "pubDate",
+              postgresql_include=["sentiment", "source_id"]),
+        Index("ix_news_articles_pubdate_covering", "pubDate",
+              postgresql_include=["category", "source_id", "sentiment"]),
+        # Rows arrive roughly in pubDate order, so a BRIN stays tiny as history grows
+        Index("ix_news_articles_pubdate_brin", "pubDate",
+              postgresql_using="brin"),
+        Index("ix_news_articles_search_vector", "search_vector",
+              postgresql_using="gin"),
+    )
+
+
+class NewsDailyRollup(Base):
+    """Per (day, category, source) totals, maintained at ingest time for the dashboard."""
+    __tablename__ = "news_daily_rollup"
+
+    day = Column(Date, primary_key=True)
+    category = Column(String, primary_key=True)
+    source_id = Column(String, primary_key=True)
+    article_count = Column(Integer, nullable=False, default=0)
+    sentiment_sum = Column(Float, nullable=False, default=0.0)
+    good_count = Column(Integer, nullable=False, default=0)
+    okay_count = Column(Integer, nullable=False, default=0)
+    bad_count = Column(Integer, nullable=False, default=0)
+
+
+# Sentiment buckets shared by the pie chart and the rollup
+GOOD_THRESHOLD = 0.4
+BAD_THRESHOLD = -0.4
+
+
+def sentiment_bucket(score: float) -> str:
+    """Classify a compound score as good (> 0.4), bad (< -0.4) or okay."""
+    if score > GOOD_THRESHOLD:
+        return "good"
+    if score < BAD_THRESHOLD:
+        return "bad"
+    return "okay"
+
+
+def _normalize_link(link: str) -> str:
+    """Lowercase scheme/host, drop www., fragments, tracking params and trailing slashes."""
+    parts = urlsplit(link.strip())
+    netloc = parts.netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_")
+    ))
+    path = parts.path.rstrip("/")
+    return urlunsplit(("", netloc, path, query, ""))
+
+
+def article_dedup_key(link: Optional[str], title: str, source_id: str) -> str:
+    """
+    Content-derived key used to drop re-fetched articles.
+    Uses the normalized link when there is one, otherwise title + source.
+    """
+    if link:
+        basis = "link:" + _normalize_link(link)
+    else:
+        normalized_title = " ".join((title or "").casefold().split())
+        basis = f"title:{normalized_title}|{(source_id or '').casefold()}"
+    return hashlib.sha256(basis.encode("utf-8")).hexdigest()
 
 
 logging.basicConfig(level=logging.INFO,
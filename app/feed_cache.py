@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import feedparser
+import httpx
+
+from app.http_client import get_http_manager
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class FeedEntry:
+    """Validators and the parsed body of the last full response for one URL."""
+
+    def __init__(self):
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.parsed: Any = None
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes = 0
+        self.parse_seconds = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "hit_rate": round(self.not_modified / self.requests, 3) if self.requests else 0.0,
+            "bytes": self.bytes,
+            "parse_seconds": round(self.parse_seconds, 4),
+        }
+
+
+class ConditionalFetcher:
+    """
+    GETs URLs with If-None-Match / If-Modified-Since taken from the previous
+    response. A 304 returns the body parsed last time, so unchanged feeds cost
+    neither the download nor feedparser. Per-URL state is kept in a bounded LRU.
+    """
+
+    def __init__(self, parse: Callable[[bytes], Any] = feedparser.parse, maxsize: int = 512):
+        self.parse = parse
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, FeedEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _entry(self, url: str) -> FeedEntry:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                entry = self._entries[url] = FeedEntry()
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return entry
+
+    @staticmethod
+    def _headers(entry: FeedEntry) -> Dict[str, str]:
+        # Without a parsed body to fall back on, a 304 would be useless
+        if entry.parsed is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _not_modified(self, url: str, entry: FeedEntry, response: httpx.Response) -> Any:
+        entry.requests += 1
+        entry.not_modified += 1
+        entry.bytes += response.num_bytes_downloaded
+        logger.debug(f"{url} not modified, reusing parsed feed")
+        return entry.parsed
+
+    def _store(self, url: str, entry: FeedEntry, response: httpx.Response,
+               parsed: Any, parse_seconds: float) -> Any:
+        entry.requests += 1
+        # Wire bytes of the (possibly compressed) body; decoded size if the transport didn't stream
+        entry.bytes += response.num_bytes_downloaded or len(response.content)
+        entry.parse_seconds += parse_seconds
+        # Keep validators only for bodies worth reusing
+        if getattr(parsed, "bozo", False):
+            entry.etag = entry.last_modified = entry.parsed = None
+        else:
+            entry.etag = response.headers.get("ETag")
+            entry.last_modified = response.headers.get("Last-Modified")
+            entry.parsed = parsed
+        return parsed
+
+    def _timed_parse(self, content: bytes):
+        start = time.perf_counter()
+        parsed = self.parse(content)
+        return parsed, time.perf_counter() - start
+
+    def fetch(self, url: str, timeout: Any = httpx.USE_CLIENT_DEFAULT) -> Any:
+        """
+        Synchronous conditional GET; raises httpx.HTTPStatusError on error
+        statuses. `timeout` overrides the shared client's HTTP_TIMEOUT.
+        """
+        entry = self._entry(url)
+        response = get_http_manager().sync_client().get(
+            url, headers=self._headers(entry), follow_redirects=True, timeout=timeout)
+        if response.status_code == 304 and entry.parsed is not None:
+            return self._not_modified(url, entry, response)
+        response.raise_for_status()
+        parsed, seconds = self._timed_parse(response.content)
+        return self._store(url, entry, response, parsed, seconds)
+
+    async def afetch(self, url: str) -> Any:
+        """Async conditional GET; parsing runs in a thread to keep the event loop free."""
+        parsed, _ = await self.afetch_status(url)
+        return parsed
+
+    async def afetch_status(self, url: str) -> Tuple[Any, bool]:
+        """Like `afetch`, also returning True when the body was reused after a 304."""
+        entry = self._entry(url)
+        client = await get_http_manager().async_client()
+        response = await client.get(url, headers=self._headers(entry), follow_redirects=True)
+        if response.status_code == 304 and entry.parsed is not None:
+            return self._not_modified(url, entry, response), True
+        response.raise_for_status()
+        parsed, seconds = await asyncio.to_thread(self._timed_parse, response.content)
+        return self._store(url, entry, response, parsed, seconds), False
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-URL counters plus totals across every tracked feed."""
+        with self._lock:
+            feeds = {url: entry.to_dict() for url, entry in self._entries.items()}
+        requests = sum(feed["requests"] for feed in feeds.values())
+        not_modified = sum(feed["not_modified"] for feed in feeds.values())
+        return {
+            "requests": requests,
+            "not_modified": not_modified,
+            "hit_rate": round(not_modified / requests, 3) if requests else 0.0,
+            "bytes": sum(feed["bytes"] for feed in feeds.values()),
+            "parse_seconds": round(sum(feed["parse_seconds"] for feed in feeds.values()), 4),
+            "feeds": feeds,
+        }
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        logger.info(
+            f"Feeds: {stats['requests']} requests, {stats['not_modified']} not modified "
+            f"({stats['hit_rate']:.0%}), {stats['bytes'] / 1024:.1f} KB, "
+            f"{stats['parse_seconds']:.3f}s parsing")
+
+
+_fetcher: Optional[ConditionalFetcher] = None
+_fetcher_lock = threading.Lock()
+
+
+def get_feed_fetcher() -> ConditionalFetcher:
+    """Process-wide RSS fetcher, tracking up to FEED_CACHE_SIZE URLs."""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = ConditionalFetcher(maxsize=int(os.getenv("FEED_CACHE_SIZE", "512")))
+        return _fetcher
@@ -0,0 +1,107 @@
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.redis_logic.codec import decode_payload
+from app.summary_snapshot import snapshot_key
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PIE_COLORS = {'Positive': '#28a745', 'Neutral': '#ffc107', 'Negative': '#dc3545'}
+TABLE_COLUMNS = ("Sources", "Art. Count", "Avg. Sentiment")
+
+
+def figures_key(summary_key: str) -> str:
+    """Redis key holding the rendered figures for a summary key such as "weekly_sports"."""
+    return f"{summary_key}:figures"
+
+
+# --- Builders (run by the refresh job; pandas/plotly.express stay off the request path) ---
+
+
+def build_line_figure(line_graph: Dict[str, float]) -> Dict[str, Any]:
+    import pandas as pd
+    import plotly.express as px
+
+    timestamps = [datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
+                  for ts_str in line_graph.keys()]
+    df_line = pd.DataFrame({
+        "Timestamp": timestamps,
+        "Sentiment Score": list(line_graph.values())
+    })
+    df = df_line.sort_values(by="Timestamp")
+    fig_line = px.line(df, x="Timestamp", y="Sentiment Score", title="Overall Sentiment Trend",
+                       markers=True, line_shape="linear")
+    fig_line.update_layout(hovermode="x unified", template="plotly_white",
+                           xaxis_rangeslider_visible=True)
+    # to_json handles the numpy arrays and timestamps inside the figure
+    return json.loads(fig_line.to_json())
+
+
+def build_pie_figure(pie_chart: Dict[str, int]) -> Dict[str, Any]:
+    import pandas as pd
+    import plotly.express as px
+
+    pie_data = [pie_chart['good'], pie_chart['okay'], pie_chart['bad']]
+    total = sum(pie_data)
+    # Percentages, as the dashboard has always shown them
+    pie_data = [int(round(x / total * 100)) if total else 0 for x in pie_data]
+    df_pie = pd.DataFrame({
+        "Sentiment": ["Positive", "Neutral", "Negative"],
+        "Count": pie_data
+    })
+    fig_pie = px.pie(df_pie, names="Sentiment", values="Count", title="Sentiment Distribution",
+                     color_discrete_map=PIE_COLORS)
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    fig_pie.update_layout(showlegend=True)
+    return json.loads(fig_pie.to_json())
+
+
+def build_table_records(top_sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {"Sources": source["source"],
+         "Art. Count": source["article_count"],
+         "Avg. Sentiment": source["avg_sentiment"]}
+        for source in top_sources
+    ]
+
+
+def build_dashboard_figures(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Line figure, pie figure and table records for one summary payload."""
+    return {
+        "line": build_line_figure(summary["line_graph"]),
+        "pie": build_pie_figure(summary["pie_chart"]),
+        "table": build_table_records(summary["top_sources"]),
+    }
+
+
+def build_all_figures(payloads: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Figures for every summary payload, keyed by their Redis key."""
+    return {figures_key(key): build_dashboard_figures(summary)
+            for key, summary in payloads.items()}
+
+
+# --- Request path ---
+
+
+def load_dashboard_figures(client, summary_key: str,
+                           version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Ready-to-return figures for `summary_key` in snapshot `version` (see
+    app.summary_snapshot). Falls back to rendering from the summary itself when
+    the figures haven't been stored yet (e.g. right after a deploy, before the
+    next refresh). None when neither is in Redis.
+    """
+    raw = client.get(snapshot_key(version, figures_key(summary_key)))
+    if raw:
+        # Decodes straight to the figure dicts Dash returns; no re-parsing
+        return decode_payload(raw)
+    logger.warning(f"No precomputed figures for '{summary_key}', rendering from the summary")
+    summary = client.get(snapshot_key(version, summary_key))
+    if not summary:
+        return None
+    return build_dashboard_figures(decode_payload(summary))
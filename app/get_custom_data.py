@@ -1,15 +1,17 @@
 import logging
-from typing import Tuple, List, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Tuple, List, Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 import os
-import requests
-from requests.exceptions import RequestException, HTTPError
+import httpx
 from urllib.error import URLError
 import socket
-import feedparser
-from tenacity import retry, wait_exponential, stop_after_attempt, before_log, after_log, retry_if_exception_type
-from app.models.sentiment import analyze_sentiment
+from tenacity import retry, wait_exponential, stop_after_attempt, stop_before_delay, before_log, after_log, retry_if_exception_type
+from app.models.prediction_cache import sentiments_with_cache
+from app.http_client import get_http_manager
+from app.feed_cache import get_feed_fetcher
 
 # --- Configure Logging ---
 logging.basicConfig(level=logging.INFO,
@@ -20,13 +22,12 @@ logger = logging.getLogger(__name__)
 BASE_DIR = Path(__file__).resolve().parent.parent
 dotenv_path = BASE_DIR / 'app' / '.env'
 
-if not dotenv_path.exists():
-    raise FileNotFoundError(f".env file not found at {dotenv_path}")
-
-load_dotenv(dotenv_path)
+# Optional when NEWS_API_KEY comes from the environment (containers, tests)
+if dotenv_path.exists():
+    load_dotenv(dotenv_path)
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 if not NEWS_API_KEY:
-    raise ValueError("NEWS_API_KEY not set in .env file")
+    raise ValueError(f"NEWS_API_KEY not set in {dotenv_path} or the environment")
 logger.info("Successfully loaded NEWS_API_KEY")
 
 # --- Dummy Data ---
@@ -44,11 +45,33 @@ ALT_HEADLINES = [
 ]
 
 # --- Retry Logic Configuration ---
-RETRIABLE_EXCEPTIONS = (RequestException, HTTPError, URLError, socket.timeout)
+RETRIABLE_EXCEPTIONS = (httpx.RequestError, httpx.HTTPStatusError, URLError, socket.timeout)
+
+# --- Parallel Search Configuration ---
+DEFAULT_SEARCH_DEADLINE = 8.0
+# One pool per worker process, shared by its request threads. A search can hold
+# three slots at once: the RSS fetch, a local search still running past its
+# timeout and the Newsdata.io fallback. The default leaves room for four searches.
+_search_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CUSTOM_SEARCH_WORKERS", "12")),
+    thread_name_prefix="custom-search")
 
 # --- Utility Functions ---
 
 
+def request_timeout(until: Optional[float]) -> Any:
+    """
+    httpx timeout for a request that must finish by `until` (a time.monotonic()
+    value): the remaining budget, or the client's HTTP_TIMEOUT when unbounded.
+    """
+    if until is None:
+        return httpx.USE_CLIENT_DEFAULT
+    remaining = until - time.monotonic()
+    if remaining <= 0:
+        raise httpx.TimeoutException("Search deadline passed before the request was sent")
+    return remaining
+
+
 def safe_join(value: Any) -> str:
     """Convert a value to a string, joining lists with commas."""
     if isinstance(value, list):
@@ -91,39 +114,25 @@ def _extract_needed_data(response: Dict[str, Any]) -> Tuple[List[str], List[str]
     after=after_log(logger, logging.WARNING),
     reraise=True
 )
-def get_data(input: str) -> Tuple[List[str], List[float], List[int], List[Dict[str, str]]]:
+def fetch_api_data(input: str, until: Optional[float] = None) -> Tuple[List[str], List[str]]:
     """
-    Fetch news data from Newsdata.io API and Google News RSS, analyze sentiments, and prepare visualization data.
-    Returns dummy headlines if RSS fetch fails.
-
-    Args:
-        input (str): Search query for news articles.
-
-    Returns:
-        Tuple containing:
-            - List[str]: Publication dates.
-            - List[float]: Sentiment scores for descriptions.
-            - List[int]: Counts of positive, neutral, negative sentiments for pie chart.
-            - List[Dict[str, str]]: Top headlines with titles and links.
+    Fetch (descriptions, dates) for a query from the Newsdata.io API. Each
+    attempt is cut off at `until` (time.monotonic()) when given.
     """
-    # Default return value for failures
-    default_return = ([], [], [0, 0, 0], ALT_HEADLINES)
-
-    # Fetch from Newsdata.io API
     NEWS_URL = f"https://newsdata.io/api/1/latest?apikey={NEWS_API_KEY}&language=en&q={input}"
     try:
-        response = requests.get(NEWS_URL, timeout=30)
+        # Shared keep-alive client, so repeated searches skip the TLS handshake
+        response = get_http_manager().sync_client().get(NEWS_URL, timeout=request_timeout(until))
         response.raise_for_status()
-        response_data = response.json()
-        descriptions, dates = _extract_needed_data(response_data)
-    except HTTPError as e:
+        return _extract_needed_data(response.json())
+    except httpx.HTTPStatusError as e:
         if e.response.status_code in (429, 503):
             logger.warning(
                 f"Retriable HTTP error {e.response.status_code} for {NEWS_URL}: {e}")
             raise
         logger.error(
             f"Non-retriable HTTP error {e.response.status_code} for {NEWS_URL}: {e}")
-        return default_return
+        return [], []
     except RETRIABLE_EXCEPTIONS as e:
         logger.warning(
             f"Retriable error fetching API data from {NEWS_URL}: {e}")
@@ -131,16 +140,94 @@ def get_data(input: str) -> Tuple[List[str], List[float], List[int], List[Dict[s
     except Exception as e:
         logger.error(
             f"Unexpected error fetching API data from {NEWS_URL}: {e}")
-        return default_return
+        return [], []
+
 
-    # Analyze sentiments
-    sentiments = []
+def search_local(input: str, timeout: float) -> Optional[Tuple[List[str], List[float]]]:
+    """(dates, sentiments) of stored articles matching `input`, or None if local search is off or fails."""
+    if os.getenv("LOCAL_SEARCH_ENABLED", "1") == "0":
+        return None
     try:
-        for description in descriptions:
-            sentiments.append(analyze_sentiment(description))
+        from app.data_extraction.local_search import search_local_articles_sync
+        future = _search_executor.submit(
+            search_local_articles_sync, input,
+            days=int(os.getenv("LOCAL_SEARCH_DAYS", "30")))
+        return future.result(timeout=timeout)
     except Exception as e:
-        logger.error(f"Error analyzing sentiments: {e}")
-        return default_return
+        logger.warning(f"Local search for '{input}' unavailable: {e}")
+        return None
+
+
+def get_data(input: str, deadline: Optional[float] = None
+             ) -> Tuple[List[str], List[float], List[int], List[Dict[str, str]]]:
+    """
+    Fetch news data for a query, analyze sentiments, and prepare visualization data.
+
+    Stored articles are searched first (full-text index over title and
+    description); Newsdata.io is only called when that finds fewer than
+    LOCAL_SEARCH_MIN_HITS articles. Google News RSS headlines are fetched in
+    parallel, and the call returns within `deadline` seconds
+    (CUSTOM_SEARCH_DEADLINE by default). A source that fails or misses the
+    deadline is left out: no article data gives empty charts, no RSS gives the
+    dummy headlines (ALT_HEADLINES).
+
+    Args:
+        input (str): Search query for news articles.
+        deadline (float, optional): Overall time budget in seconds.
+
+    Returns:
+        Tuple containing:
+            - List[str]: Publication dates.
+            - List[float]: Sentiment scores for descriptions.
+            - List[int]: Counts of positive, neutral, negative sentiments for pie chart.
+            - List[Dict[str, str]]: Top headlines with titles and links.
+    """
+    if deadline is None:
+        deadline = float(os.getenv("CUSTOM_SEARCH_DEADLINE", str(DEFAULT_SEARCH_DEADLINE)))
+    started = time.monotonic()
+    # Tenacity backoff must not outlive the deadline, or late retries keep the worker threads busy
+    bounded = stop_after_attempt(5) | stop_before_delay(deadline)
+    # ...and neither may a request in flight, so each one is timed out at the deadline too
+    until = started + deadline
+
+    cleaned_input = ''.join(input.split())
+    rss_url = f"https://news.google.com/rss/search?q={cleaned_input}&hl=en-US&gl=US&ceid=US:en"
+    rss_future = _search_executor.submit(top_news.retry_with(stop=bounded), rss_url, until)
+
+    source = "local"
+    local = search_local(input, timeout=min(
+        float(os.getenv("LOCAL_SEARCH_TIMEOUT", "2")), deadline))
+    if local is not None and len(local[0]) >= int(os.getenv("LOCAL_SEARCH_MIN_HITS", "20")):
+        dates, sentiments = local
+        wait([rss_future], timeout=max(0.0, deadline - (time.monotonic() - started)))
+    else:
+        source = "newsdata.io"
+        api_future = _search_executor.submit(fetch_api_data.retry_with(stop=bounded), input, until)
+        wait([api_future, rss_future],
+             timeout=max(0.0, deadline - (time.monotonic() - started)))
+
+        descriptions, dates = [], []
+        if not api_future.done():
+            logger.warning(f"Newsdata.io search for '{input}' missed the {deadline}s deadline")
+        elif api_future.exception() is not None:
+            logger.error(f"Failed to fetch API data for '{input}': {api_future.exception()}")
+        else:
+            descriptions, dates = api_future.result()
+
+        # Analyze sentiments
+        try:
+            sentiments = sentiments_with_cache(descriptions)
+        except Exception as e:
+            logger.error(f"Error analyzing sentiments: {e}")
+            dates, sentiments = [], []
+
+    top_headlines = ALT_HEADLINES
+    if not rss_future.done():
+        logger.warning(f"RSS headlines for '{input}' missed the {deadline}s deadline")
+    elif rss_future.exception() is not None:
+        logger.error(f"Failed to fetch RSS headlines from {rss_url}: {rss_future.exception()}")
+    else:
+        top_headlines = rss_future.result()
 
     # Prepare pie chart data
     positive, neutral, negative = 0, 0, 0
@@ -154,20 +241,29 @@ def get_data(input: str) -> Tuple[List[str], List[float], List[int], List[Dict[s
             neutral += 1
     pie_data = [positive, neutral, negative]
 
-    # Fetch RSS headlines
-    cleaned_input = ''.join(input.split())
-    rss_url = f"https://news.google.com/rss/search?q={cleaned_input}&hl=en-US&gl=US&ceid=US:en"
-    try:
-        top_headlines = top_news(rss_url)
-    except Exception as e:
-        logger.error(f"Failed to fetch RSS headlines from {rss_url}: {e}")
-        top_headlines = ALT_HEADLINES
-
     logger.info(
-        f"Fetched {len(descriptions)} API articles and {len(top_headlines)} RSS headlines")
+        f"Fetched {len(dates)} articles from {source} and {len(top_headlines)} RSS headlines "
+        f"in {time.monotonic() - started:.2f}s")
     return dates, sentiments, pie_data, top_headlines
 
 
+def feed_headlines(feed: Any, url: str = "", limit: int = 5) -> List[Dict[str, str]]:
+    """Title/link of the first `limit` entries of a parsed feed; empty if it is invalid."""
+    if feed.get("bozo", False):
+        logger.warning(
+            f"Invalid RSS feed at {url}: {feed.get('bozo_exception')}")
+        return []
+
+    headlines = []
+    for entry in feed.entries[:limit]:
+        if hasattr(entry, "title") and hasattr(entry, "link"):
+            headlines.append({
+                "title": entry.title,
+                "link": entry.link
+            })
+    return headlines
+
+
 @retry(
     wait=wait_exponential(multiplier=1, min=1, max=10),
     stop=stop_after_attempt(5),
@@ -176,31 +272,22 @@ def get_data(input: str) -> Tuple[List[str], List[float], List[int], List[Dict[s
     after=after_log(logger, logging.WARNING),
     reraise=True
 )
-def top_news(url: str) -> List[Dict[str, str]]:
+def top_news(url: str, until: Optional[float] = None) -> List[Dict[str, str]]:
     """
     Fetch the top 5 news headlines from an RSS feed URL.
     Returns dummy data (ALT_HEADLINES) if the fetch fails or no headlines are found.
 
     Args:
         url (str): The RSS feed URL to fetch headlines from.
+        until (float, optional): time.monotonic() by which each attempt must finish.
 
     Returns:
         List[Dict[str, str]]: A list of dictionaries containing 'title' and 'link' for each headline.
     """
-    top_headlines = []
     try:
-        feed = feedparser.parse(url)
-        if feed.get("bozo", False):
-            logger.warning(
-                f"Invalid RSS feed at {url}: {feed.get('bozo_exception')}")
-            return ALT_HEADLINES
-
-        for entry in feed.entries[:5]:  # Get top 5 headlines
-            if hasattr(entry, "title") and hasattr(entry, "link"):
-                top_headlines.append({
-                    "title": entry.title,
-                    "link": entry.link
-                })
+        # Conditional GET: an unchanged feed comes back as a 304 and the last parse is reused
+        top_headlines = feed_headlines(
+            get_feed_fetcher().fetch(url, timeout=request_timeout(until)), url)
 
         if not top_headlines:
             logger.info(
@@ -211,6 +298,14 @@ def top_news(url: str) -> List[Dict[str, str]]:
             f"Successfully fetched {len(top_headlines)} headlines from {url}")
         return top_headlines
 
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code in (429, 503):
+            logger.warning(
+                f"Retriable HTTP error {e.response.status_code} for {url}: {e}")
+            raise
+        logger.error(
+            f"Non-retriable HTTP error {e.response.status_code} for {url}: {e}")
+        return ALT_HEADLINES
     except RETRIABLE_EXCEPTIONS as e:
         logger.warning(f"Retriable error fetching RSS feed from {url}: {e}")
         raise
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # httpx only speaks HTTP/2 with the optional h2 package
+    HTTP2_AVAILABLE = False
+
+DEFAULT_TIMEOUT = 30.0
+
+
+def parse_host_limits(spec: str) -> Dict[str, int]:
+    """Parse HTTP_PER_HOST_LIMITS, e.g. "newsdata.io:4,news.google.com:2"."""
+    limits = {}
+    for item in spec.split(","):
+        if ":" in item:
+            host, cap = item.rsplit(":", 1)
+            limits[host.strip()] = int(cap)
+    return limits
+
+
+class HTTPClientManager:
+    """
+    Owns one pooled httpx.AsyncClient (scheduler/ingest) and one httpx.Client
+    (Dash callbacks) per process, so keep-alive connections are reused across
+    fetches and tenacity retries instead of paying a TCP+TLS handshake each time.
+
+    Every request is traced: new TCP connections, TLS handshakes and time to
+    response headers are counted and exposed through `stats()`.
+    """
+
+    def __init__(self):
+        self.http2 = HTTP2_AVAILABLE and os.getenv("HTTP2_ENABLED", "1") != "0"
+        self.timeout = float(os.getenv("HTTP_TIMEOUT", str(DEFAULT_TIMEOUT)))
+        self.limits = httpx.Limits(
+            max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", "10")),
+            keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60")),
+        )
+        self.host_limits = parse_host_limits(os.getenv(
+            "HTTP_PER_HOST_LIMITS", "newsdata.io:4,news.google.com:4"))
+
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "tcp_connects": 0,
+                          "tls_handshakes": 0, "latency_total": 0.0}
+
+    # --- Tracing ---
+
+    def _record(self, event: str) -> None:
+        with self._lock:
+            if event == "connection.connect_tcp.complete":
+                self._counters["tcp_connects"] += 1
+            elif event == "connection.start_tls.complete":
+                self._counters["tls_handshakes"] += 1
+
+    def _trace(self, event: str, info: Dict[str, Any]) -> None:
+        self._record(event)
+
+    async def _atrace(self, event: str, info: Dict[str, Any]) -> None:
+        self._record(event)
+
+    def _on_request(self, request: httpx.Request) -> None:
+        request.extensions["start_time"] = time.perf_counter()
+
+    def _on_response(self, response: httpx.Response) -> None:
+        started = response.request.extensions.get("start_time")
+        if started is None:
+            return
+        latency = time.perf_counter() - started
+        with self._lock:
+            self._counters["requests"] += 1
+            self._counters["latency_total"] += latency
+        logger.debug(
+            f"{response.request.method} {response.request.url.host} -> "
+            f"{response.status_code} in {latency * 1000:.0f} ms ({response.http_version})")
+
+    def _sync_request_hook(self, request: httpx.Request) -> None:
+        request.extensions["trace"] = self._trace
+        self._on_request(request)
+
+    async def _async_request_hook(self, request: httpx.Request) -> None:
+        request.extensions["trace"] = self._atrace
+        self._on_request(request)
+
+    async def _async_response_hook(self, response: httpx.Response) -> None:
+        self._on_response(response)
+
+    # --- Clients ---
+
+    def _mounts(self, transport_cls) -> Dict[str, Any]:
+        """One transport per capped host, each with its own connection pool."""
+        return {
+            f"all://{host}": transport_cls(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=cap,
+                    max_keepalive_connections=min(
+                        cap, self.limits.max_keepalive_connections),
+                    keepalive_expiry=self.limits.keepalive_expiry))
+            for host, cap in self.host_limits.items()
+        }
+
+    async def async_client(self) -> httpx.AsyncClient:
+        """The shared AsyncClient, rebuilt if it was closed or belongs to another event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed \
+                or self._async_loop is not loop:
+            # A client from an earlier asyncio.run() is tied to a closed loop; drop it
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout, limits=self.limits, http2=self.http2,
+                mounts=self._mounts(httpx.AsyncHTTPTransport),
+                event_hooks={"request": [self._async_request_hook],
+                             "response": [self._async_response_hook]},
+            )
+            self._async_loop = loop
+            logger.info(f"Created shared AsyncClient (http2={self.http2}, "
+                        f"per-host caps={self.host_limits})")
+        return self._async_client
+
+    def sync_client(self) -> httpx.Client:
+        """The shared thread-safe Client for synchronous callers."""
+        with self._lock:
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(
+                    timeout=self.timeout, limits=self.limits, http2=self.http2,
+                    mounts=self._mounts(httpx.HTTPTransport),
+                    event_hooks={"request": [self._sync_request_hook],
+                                 "response": [self._on_response]},
+                )
+                logger.info(f"Created shared Client (http2={self.http2}, "
+                            f"per-host caps={self.host_limits})")
+            return self._sync_client
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._sync_client is not None:
+                self._sync_client.close()
+                self._sync_client = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        requests = counters.pop("requests")
+        latency_total = counters.pop("latency_total")
+        return {
+            "requests": requests,
+            **counters,
+            "avg_latency_ms": round(latency_total / requests * 1000, 1) if requests else 0.0,
+        }
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        logger.info(
+            f"HTTP: {stats['requests']} requests, {stats['tcp_connects']} TCP connects, "
+            f"{stats['tls_handshakes']} TLS handshakes, avg {stats['avg_latency_ms']} ms")
+
+
+_manager: Optional[HTTPClientManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_http_manager() -> HTTPClientManager:
+    """Process-wide manager; settings are read on first use, after load_dotenv."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = HTTPClientManager()
+        return _manager
+
+
+async def close_http_clients() -> None:
+    """Close both shared clients, e.g. on scheduler shutdown."""
+    if _manager is not None:
+        await _manager.aclose()
+        _manager.close()
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# A prepared article: its description (NLP input) and the DB row still missing
+# "sentiment" and "category"
+PreparedArticle = Tuple[str, Dict[str, Any]]
+
+# Marks the end of the stream on every queue
+_DONE = object()
+
+
+class StageStats:
+    """Counters for one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.batches = 0
+        self.items = 0
+        self.busy_seconds = 0.0
+
+    def record(self, items: int, seconds: float) -> None:
+        self.batches += 1
+        self.items += items
+        self.busy_seconds += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 3),
+            # Throughput while the stage was actually working, not waiting on a queue
+            "items_per_second": round(self.items / self.busy_seconds, 1)
+            if self.busy_seconds else 0.0,
+        }
+
+
+class IngestPipeline:
+    """
+    fetch -> parse -> score -> write, each stage a task joined to the next by a
+    bounded asyncio.Queue. Stages overlap: pages are parsed while later pages
+    are still downloading, and a full queue blocks the stage before it, which
+    caps how many articles are held in memory at once.
+
+    The score stage runs sentiment and classification together, because
+    predict_with_cache and the NLP worker pool compute both in one call.
+    """
+
+    def __init__(self,
+                 source: Callable[[], AsyncIterator[Dict[str, List[str]]]],
+                 parse: Callable[[Dict[str, List[str]]], List[PreparedArticle]],
+                 score: Callable[[List[str]], Awaitable[Tuple[List[float], List[str]]]],
+                 write: Callable[[List[Dict[str, Any]]], Awaitable[int]],
+                 queue_size: int = 4, score_batch_size: int = 256,
+                 write_batch_size: int = 500):
+        self.source = source
+        self.parse = parse
+        self.score = score
+        self.write = write
+        self.score_batch_size = score_batch_size
+        self.write_batch_size = write_batch_size
+        self.queues = {
+            "parse": asyncio.Queue(maxsize=queue_size),
+            "score": asyncio.Queue(maxsize=queue_size),
+            "write": asyncio.Queue(maxsize=queue_size),
+        }
+        self.stage_stats = {name: StageStats(name)
+                            for name in ("fetch", "parse", "score", "write")}
+        self.max_depth = {name: 0 for name in self.queues}
+        self.inserted = 0
+        self.started: Optional[float] = None
+        self.elapsed = 0.0
+
+    async def _put(self, name: str, item: Any) -> None:
+        queue = self.queues[name]
+        await queue.put(item)
+        self.max_depth[name] = max(self.max_depth[name], queue.qsize())
+
+    # --- Stages ---
+
+    async def _fetch(self) -> None:
+        iterator = self.source().__aiter__()
+        while True:
+            start = time.perf_counter()
+            try:
+                page = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            self.stage_stats["fetch"].record(len(page.get("titles", [])),
+                                             time.perf_counter() - start)
+            await self._put("parse", page)
+        await self._put("parse", _DONE)
+
+    async def _parse(self) -> None:
+        pending: List[PreparedArticle] = []
+        while True:
+            page = await self.queues["parse"].get()
+            if page is _DONE:
+                break
+            start = time.perf_counter()
+            prepared = self.parse(page)
+            self.stage_stats["parse"].record(len(prepared), time.perf_counter() - start)
+            pending.extend(prepared)
+            while len(pending) >= self.score_batch_size:
+                await self._put("score", pending[:self.score_batch_size])
+                pending = pending[self.score_batch_size:]
+        if pending:
+            await self._put("score", pending)
+        await self._put("score", _DONE)
+
+    async def _score(self) -> None:
+        while True:
+            batch = await self.queues["score"].get()
+            if batch is _DONE:
+                break
+            start = time.perf_counter()
+            sentiments, categories = await self.score([text for text, _ in batch])
+            rows = []
+            for (_, row), sentiment, category in zip(batch, sentiments, categories):
+                rows.append({**row, "sentiment": sentiment, "category": category})
+            self.stage_stats["score"].record(len(rows), time.perf_counter() - start)
+            await self._put("write", rows)
+        await self._put("write", _DONE)
+
+    async def _write(self) -> None:
+        pending: List[Dict[str, Any]] = []
+        finished = False
+        while not finished:
+            rows = await self.queues["write"].get()
+            if rows is _DONE:
+                finished = True
+            else:
+                pending.extend(rows)
+            # Flush full batches as they fill up, and whatever is left at the end
+            while pending and (len(pending) >= self.write_batch_size or finished):
+                chunk = pending[:self.write_batch_size]
+                pending = pending[self.write_batch_size:]
+                start = time.perf_counter()
+                self.inserted += await self.write(chunk)
+                self.stage_stats["write"].record(len(chunk), time.perf_counter() - start)
+
+    async def run(self) -> int:
+        """Run all stages to completion and return the number of rows inserted."""
+        self.started = time.perf_counter()
+        tasks = [asyncio.create_task(stage(), name=f"ingest-{stage.__name__.strip('_')}")
+                 for stage in (self._fetch, self._parse, self._score, self._write)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # One failed stage would leave the others blocked on a queue forever
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            self.elapsed = time.perf_counter() - self.started
+            self.log_stats()
+        return self.inserted
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-stage throughput plus current and peak depth of every queue."""
+        return {
+            "elapsed_seconds": round(self.elapsed or (
+                time.perf_counter() - self.started if self.started else 0.0), 3),
+            "inserted": self.inserted,
+            "stages": {name: stats.to_dict() for name, stats in self.stage_stats.items()},
+            "queues": {name: {"depth": queue.qsize(), "max_depth": self.max_depth[name],
+                              "capacity": queue.maxsize}
+                       for name, queue in self.queues.items()},
+        }
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        stages = ", ".join(
+            f"{name} {stage['items']} items @ {stage['items_per_second']}/s"
+            for name, stage in stats["stages"].items())
+        depths = ", ".join(
+            f"{name} {queue['max_depth']}/{queue['capacity']}"
+            for name, queue in stats["queues"].items())
+        logger.info(f"Ingest pipeline finished in {stats['elapsed_seconds']}s: {stages}; "
+                    f"peak queue depth {depths}")
@@ -0,0 +1,49 @@
+import functools
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import redis
+
+from app.dashboard_cache import get_dashboard_cache, get_page_client
+from app.figures import build_dashboard_figures
+from app.get_custom_data import ALT_HEADLINES
+from app.headline_cache import DEFAULT_FEED_COUNTRY, cached_headlines
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+EMPTY_SUMMARY = {"line_graph": {},
+                 "pie_chart": {"good": 0, "okay": 0, "bad": 0},
+                 "top_sources": []}
+
+
+@functools.lru_cache(maxsize=4)
+def _render_fallback(summary_json: str) -> Dict[str, Any]:
+    # Rendered once per process; every page load during an outage reuses it
+    return build_dashboard_figures(json.loads(summary_json))
+
+
+def initial_view(summary_key: str = "monthly_summary", country: str = DEFAULT_FEED_COUNTRY,
+                 fallback_summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Figures and headlines for the first render of the dashboard, read from what
+    the refresh jobs stored in Redis. `cached` is False when Redis could not
+    be used and `fallback_summary` (empty by default) was rendered instead.
+    """
+    client = get_page_client()
+    try:
+        figures = get_dashboard_cache().figures(summary_key)
+    except redis.RedisError as e:
+        logger.warning(f"Redis unavailable for the initial page: {e}")
+        figures = None
+        headlines = ALT_HEADLINES
+    else:
+        headlines = cached_headlines(client, country)
+
+    cached = figures is not None
+    if not cached:
+        figures = _render_fallback(json.dumps(fallback_summary or EMPTY_SUMMARY, sort_keys=True))
+    return {"figures": figures, "headlines": headlines, "cached": cached}
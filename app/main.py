@@ -3,8 +3,7 @@ from dash.dependencies import Input, Output, State, ALL
 import dash_bootstrap_components as dbc
 from dash import dcc, html, dash_table
 import plotly.express as px
-from redis import Redis
-from app.redis_logic.redis import RedisClient
+from redis import Redis, RedisError
 import os
 from dotenv import load_dotenv
 import pandas as pd
@@ -16,8 +15,13 @@ from datetime import datetime
 import asyncio
 import nest_asyncio
 
-from .get_custom_data import get_data, top_news
+from .get_custom_data import get_data
+from .search_cache import cached_get_data
 from .scheduler import main
+from .figures import TABLE_COLUMNS
+from .dashboard_cache import get_dashboard_cache, get_page_client
+from .headline_cache import DEFAULT_FEED_COUNTRY, get_headlines
+from .initial_view import initial_view
 # from pathlib import Path  # Import Path
 
 # # ... (other imports) ...
@@ -33,8 +37,6 @@ from .scheduler import main
 
 nest_asyncio.apply()
 
-client = RedisClient()
-
 # --- 1. Prepare Dummy Data (Same as before) ---
 # Dropdown Options
 time_options = [
@@ -73,127 +75,6 @@ country_options = [
     # You can add more as needed
 ]
 
-COUNTRY_CODES = {
-    'United States': {'gl': 'US', 'hl': 'en', 'ceid': 'US:en'},
-    'Canada': {'gl': 'CA', 'hl': 'en', 'ceid': 'CA:en'},
-    'United Kingdom': {'gl': 'GB', 'hl': 'en', 'ceid': 'GB:en'},
-    # English news from Germany
-    'Germany': {'gl': 'DE', 'hl': 'en', 'ceid': 'DE:en'},
-    'Australia': {'gl': 'AU', 'hl': 'en', 'ceid': 'AU:en'},
-    # 5 Most Popular Countries added
-    'India': {'gl': 'IN', 'hl': 'en', 'ceid': 'IN:en'},
-    # English news from France
-    'France_en': {'gl': 'FR', 'hl': 'en', 'ceid': 'FR:en'},
-    # English news from Japan
-    'Japan_en': {'gl': 'JP', 'hl': 'en', 'ceid': 'JP:en'},
-    # English news from Brazil
-    'Brazil_en': {'gl': 'BR', 'hl': 'en', 'ceid': 'BR:en'},
-    # English news from China
-    'China_en': {'gl': 'CN', 'hl': 'en', 'ceid': 'CN:en'},
-    # Countries you specifically asked about
-    'Nigeria': {'gl': 'NG', 'hl': 'en', 'ceid': 'NG:en'},
-    'Netherlands_en': {'gl': 'NL', 'hl': 'en', 'ceid': 'NL:en'},
-    # Dutch news for Netherlands
-    'Netherlands_nl': {'gl': 'NL', 'hl': 'nl', 'ceid': 'NL:nl'},
-    'Zambia': {'gl': 'ZM', 'hl': 'en', 'ceid': 'ZM:en'},
-}
-custom_search_output_children = None
-try:
-    client.initialize()
-    data = client.get("monthly_summary")
-    data = json.loads(data)
-except BaseException:
-    data = {"line_graph": {},
-            "pie_chart": {"good": 0, "okay": 0, "bad": 0},
-            "top_sources": []}
-    custom_search_output_children = html.Div(
-        dbc.Alert(
-            f"A server error occured",
-            color="danger",
-            className="mt-3"
-        ),
-        style={'text-align': 'center'}
-    )
-
-
-# Dummy Data for Line Graph
-line_graph = data['line_graph']
-# timestamps = line_graph.keys()
-timestamps = [datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
-              for ts_str in line_graph.keys()]
-sentiments = list(line_graph.values())
-df_line = pd.DataFrame({
-    "Timestamp": timestamps,
-    "Sentiment Score": sentiments
-})
-
-# df_line['Timestamp'] = df_line['Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
-# df_line['Timestamp'] = df_line['Timestamp']
-
-df = df_line.sort_values(by="Timestamp")
-fig_line = px.line(df_line, x="Timestamp", y="Sentiment Score", title="Overall Sentiment Trend",
-                   markers=True, line_shape="linear")
-fig_line.update_layout(hovermode="x unified", template="plotly_white",
-                       xaxis_rangeslider_visible=True)
-
-# Dummy Data for Pie Chart
-pie_chart = data['pie_chart']
-total = 0
-pie_data = [pie_chart['good'], pie_chart['okay'], pie_chart['bad']]
-for i in pie_data:
-    total += i
-pie_data = [x / total * 100 for x in pie_data]
-pie_data = [int(round(x)) for x in pie_data]
-df_pie = pd.DataFrame({
-    "Sentiment": ["Positive", "Neutral", "Negative"],
-    "Count": pie_data
-})
-fig_pie = px.pie(df_pie, names="Sentiment", values="Count", title="Sentiment Distribution",
-                 color_discrete_map={'Positive': '#28a745', 'Neutral': '#ffc107', 'Negative': '#dc3545'})
-fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-fig_pie.update_layout(showlegend=True)
-
-# Dummy Data for Table
-top_sources = data['top_sources']
-sources = []
-article_counts = []
-avg_sentiments = []
-
-for i in top_sources:
-    sources.append(i['source'])
-    article_counts.append(i['article_count'])
-    avg_sentiments.append(i['avg_sentiment'])
-
-df_table = pd.DataFrame({
-    "Sources": sources,
-    "Art. Count": article_counts,
-    "Avg. Sentiment": avg_sentiments
-})
-
-# Dummy News Articles for Scrollable Feed
-news_articles = top_news(
-    "https://news.google.com/rss?hl=en-US&gl=NG&ceid=US:en")
-# news_articles = [
-#     {"title": "Tech Giant Unveils New AI Processor",
-#         "link": "https://www.verylongexample.com/ai-innovation/tech-giant-unveils-revolutionary-new-artificial-intelligence-processor-details.html"},
-#     {"title": "Global Markets React to Interest Rate Hike",
-#         "link": "https://www.financeworldnews.org/economy/global-markets-show-mixed-reactions-to-recent-central-bank-interest-rate-hike-analysis.html"},
-#     {"title": "Breakthrough in Renewable Energy Storage",
-#         "link": "https://www.greenenergynow.net/research/new-breakthrough-in-long-duration-renewable-energy-storage-technology-paving-the-way.html"},
-#     {"title": "Local Charity Exceeds Fundraising Goal",
-#         "link": "https://www.communityvoice.com/local-updates/local-charity-campaign-exceeds-fundraising-goal-thanks-to-overwhelming-community-support.html"},
-#     {"title": "New Study on Climate Change Impacts",
-#         "link": "https://www.environmentalsciencejournal.org/climate-research/comprehensive-new-study-highlights-severe-climate-change-impacts-globally.html"},
-#     {"title": "Startup Secures Series B Funding Round",
-#         "link": "https://www.startupinsights.co/funding/promising-fintech-startup-secures-oversubscribed-series-b-funding-round-for-expansion.html"},
-#     {"title": "Major Sports Event Kicks Off This Weekend",
-#         "link": "https://www.sportseverywhere.com/events/annual-international-sports-tournament-kicks-off-this-weekend-full-schedule-and-athlete-profiles.html"},
-#     {"title": "Health Organization Issues New Guidelines",
-#         "link": "https://www.healthnewsdaily.org/public-health/major-health-organization-issues-new-public-health-guidelines-for-seasonal-illnesses.html"},
-#     {"title": "Cultural Festival Draws Record Crowds",
-#         "link": "https://www.artsculturemagazine.com/festival-reviews/annual-cultural-arts-festival-draws-record-breaking-crowds-and-acclaim.html"},
-# ]
-
 # Function to create a news item div (same as before)
 
 
@@ -211,10 +92,6 @@ def create_news_item_component(title, link):
     ], style={'padding': '5px 0'})
 
 
-news_elements = [create_news_item_component(
-    article['title'], article['link']) for article in news_articles]
-
-
 # --- 2. Initialize Dash App ---
 app = dash.Dash(__name__, suppress_callback_exceptions=True, external_stylesheets=[
                 dbc.themes.BOOTSTRAP, dbc.icons.FONT_AWESOME])
@@ -224,195 +101,223 @@ app = dash.Dash(__name__, suppress_callback_exceptions=True, external_stylesheet
 # server = app.server  # This line is essential!
 
 # --- 3. Define Dashboard Layout ---
-app.layout = dbc.Container([
-
-    # Storing needed values in browser session
-    dcc.Store(id='last-searched-query-store', data=''),
-    dcc.Store(id='search-mode', data='default'),
-
-    # Row 1: Dashboard Title
-    dbc.Row(
-        dbc.Col(
-            html.H1("GLOBAL NEWS DASHBOARD",
-                    className="text-center my-4 display-4 text-primary"),
-            width=12
+
+
+def serve_layout():
+    """
+    Built per page load from what the refresh jobs keep in Redis, so importing
+    this module (every gunicorn worker boot) makes no Redis or network calls.
+    """
+    view = initial_view()
+    figures = view["figures"]
+    fig_line = figures["line"]
+    fig_pie = figures["pie"]
+    news_elements = [create_news_item_component(
+        article['title'], article['link']) for article in view["headlines"]]
+    custom_search_output_children = None
+    if not view["cached"]:
+        custom_search_output_children = html.Div(
+            dbc.Alert(
+                f"A server error occured",
+                color="danger",
+                className="mt-3"
+            ),
+            style={'text-align': 'center'}
         )
-    ),
-
-    # Placeholder for the dynamically added input box
-    dbc.Row(
-        dbc.Col(
-            html.Div([
-                html.Div(id='custom-search-input-container'),
-                # To display search query for demonstration
-                html.Div(id='custom-search-output',
-                         children=custom_search_output_children)
-            ]),
-            width=12
+
+    return dbc.Container([
+
+        # Storing needed values in browser session
+        dcc.Store(id='last-searched-query-store', data=''),
+        dcc.Store(id='search-mode', data='default'),
+
+        # Row 1: Dashboard Title
+        dbc.Row(
+            dbc.Col(
+                html.H1("GLOBAL NEWS DASHBOARD",
+                        className="text-center my-4 display-4 text-primary"),
+                width=12
+            )
         ),
-        className="mb-3"
-    ),
 
-    # Row 2: Filters (Dropdowns) with new button
-    dbc.Row([
-        # Button for Offcanvas
-        dbc.Col(
-            dbc.Button(
-                [html.I(className="fa-solid fa-gears me-2"),
-                 "Search Options"],  # Gear icon
-                id="open-options-offcanvas",
-                color="info",  # Info color for secondary action
-                className="mb-3"
+        # Placeholder for the dynamically added input box
+        dbc.Row(
+            dbc.Col(
+                html.Div([
+                    html.Div(id='custom-search-input-container'),
+                    # To display search query for demonstration
+                    html.Div(id='custom-search-output',
+                             children=custom_search_output_children)
+                ]),
+                width=12
             ),
-            width="auto",  # Adjust width to content
-            align="end",  # Align button to the bottom of the column
-            className="d-flex align-items-end"  # Use flexbox for vertical alignment
-        ),
-        dbc.Col(
-            html.Div([
-                html.Label("News in the last:", className="mb-2 lead"),
-                dcc.Dropdown(
-                    id='time-dropdown',
-                    options=time_options,
-                    value='monthly',
-                    clearable=False,
-                    className="mb-3"
-                )
-            ]),
-            md=4,
-            className="d-flex align-items-center justify-content-center flex-column"
+            className="mb-3"
         ),
-        dbc.Col(
-            html.Div([
-                html.Label("Specific Category:", className="mb-2 lead"),
-                dcc.Dropdown(
-                    id='category-dropdown',
-                    options=category_options,
-                    value='summary',
-                    clearable=False,
+
+        # Row 2: Filters (Dropdowns) with new button
+        dbc.Row([
+            # Button for Offcanvas
+            dbc.Col(
+                dbc.Button(
+                    [html.I(className="fa-solid fa-gears me-2"),
+                     "Search Options"],  # Gear icon
+                    id="open-options-offcanvas",
+                    color="info",  # Info color for secondary action
                     className="mb-3"
-                )
-            ]),
-            md=4,
-            className="d-flex align-items-center justify-content-center flex-column"
-        )
-    ], justify="center", className="mb-5"),
-
-    # dbc.Offcanvas for search options
-    dbc.Offcanvas(
-        id="offcanvas-search-options",
-        title="Search Settings",
-        is_open=False,  # Initially closed
-        placement="start",  # Opens from the left
-        children=[
-            html.P("Choose your search mode:"),
-            dbc.Row([
-                dbc.Col(
-                    dbc.Button("Default Search", id="default-search-button",
-                               color="primary", size="lg", className="me-2 w-100"),  # w-100 for full width
-                    className="mb-2"
                 ),
-                dbc.Col(
-                    dbc.Button("Custom Search", id="custom-search-button",
-                               color="success", size="lg", className="w-100"),
-                )
-            ], className="g-2")  # g-2 for gap between columns
-        ]
-    ),
-
-    # Row 3: Graphs (Line Chart and Pie Chart)
-    dbc.Row([
-        dbc.Col(
-            dbc.Card([
-                dbc.CardHeader("Sentiment Trend Over Time", className="h5"),
-                dbc.CardBody(
-                    dcc.Graph(id='sentiment-line-graph', figure=fig_line)
-                )
-            ], className="shadow-sm border-0"),
-            md=6,
-            className="mb-4"
-        ),
-        dbc.Col(
-            dbc.Card([
-                dbc.CardHeader("Overall Sentiment Distribution",
-                               className="h5"),
-                dbc.CardBody(
-                    dcc.Graph(id='sentiment-pie-chart', figure=fig_pie)
-                )
-            ], className="shadow-sm border-0"),
-            md=6,
-            className="mb-4"
-        )
-    ], className="mb-5"),
-
-    # Row 4: Table and Scrollable News
-    dbc.Row([
-        dbc.Col(
-            dbc.Card([
-                dbc.CardHeader("Top Keywords & Sentiment", className="h5"),
-                dbc.CardBody(
-                    dash_table.DataTable(
-                        id='keyword-table',
-                        columns=[{"name": i, "id": i}
-                                 for i in df_table.columns],
-                        data=df_table.to_dict('records'),
-                        style_table={'overflowX': 'auto'},
-                        style_header={
-                            'backgroundColor': 'white',
-                            'fontWeight': 'bold'
-                        },
-                        style_data_conditional=[
-                            {'if': {'row_index': 'odd'},
-                                'backgroundColor': 'rgb(248, 248, 248)'}
-                        ],
-                        export_headers='display',
-                        export_format='xlsx'
+                width="auto",  # Adjust width to content
+                align="end",  # Align button to the bottom of the column
+                className="d-flex align-items-end"  # Use flexbox for vertical alignment
+            ),
+            dbc.Col(
+                html.Div([
+                    html.Label("News in the last:", className="mb-2 lead"),
+                    dcc.Dropdown(
+                        id='time-dropdown',
+                        options=time_options,
+                        value='monthly',
+                        clearable=False,
+                        className="mb-3"
+                    )
+                ]),
+                md=4,
+                className="d-flex align-items-center justify-content-center flex-column"
+            ),
+            dbc.Col(
+                html.Div([
+                    html.Label("Specific Category:", className="mb-2 lead"),
+                    dcc.Dropdown(
+                        id='category-dropdown',
+                        options=category_options,
+                        value='summary',
+                        clearable=False,
+                        className="mb-3"
+                    )
+                ]),
+                md=4,
+                className="d-flex align-items-center justify-content-center flex-column"
+            )
+        ], justify="center", className="mb-5"),
+
+        # dbc.Offcanvas for search options
+        dbc.Offcanvas(
+            id="offcanvas-search-options",
+            title="Search Settings",
+            is_open=False,  # Initially closed
+            placement="start",  # Opens from the left
+            children=[
+                html.P("Choose your search mode:"),
+                dbc.Row([
+                    dbc.Col(
+                        dbc.Button("Default Search", id="default-search-button",
+                                   color="primary", size="lg", className="me-2 w-100"),  # w-100 for full width
+                        className="mb-2"
+                    ),
+                    dbc.Col(
+                        dbc.Button("Custom Search", id="custom-search-button",
+                                   color="success", size="lg", className="w-100"),
                     )
-                )
-            ], className="shadow-sm border-0"),
-            md=6,
-            className="mb-4"
+                ], className="g-2")  # g-2 for gap between columns
+            ]
         ),
-        dbc.Col(
-            dbc.Card([
-                dbc.CardHeader(
-                    dbc.Row([
-                        dbc.Col(html.Span("Top News in ",
-                                className="h5 me-2"), width="auto"),
-                        dbc.Col(
-                            dcc.Dropdown(
-                                id='country-dropdown',
-                                options=country_options,
-                                value='United States',
-                                clearable=False,
-                                className="flex-grow-1"
-                            ),
-                            width=True
+
+        # Row 3: Graphs (Line Chart and Pie Chart)
+        dbc.Row([
+            dbc.Col(
+                dbc.Card([
+                    dbc.CardHeader("Sentiment Trend Over Time", className="h5"),
+                    dbc.CardBody(
+                        dcc.Graph(id='sentiment-line-graph', figure=fig_line)
+                    )
+                ], className="shadow-sm border-0"),
+                md=6,
+                className="mb-4"
+            ),
+            dbc.Col(
+                dbc.Card([
+                    dbc.CardHeader("Overall Sentiment Distribution",
+                                   className="h5"),
+                    dbc.CardBody(
+                        dcc.Graph(id='sentiment-pie-chart', figure=fig_pie)
+                    )
+                ], className="shadow-sm border-0"),
+                md=6,
+                className="mb-4"
+            )
+        ], className="mb-5"),
+
+        # Row 4: Table and Scrollable News
+        dbc.Row([
+            dbc.Col(
+                dbc.Card([
+                    dbc.CardHeader("Top Keywords & Sentiment", className="h5"),
+                    dbc.CardBody(
+                        dash_table.DataTable(
+                            id='keyword-table',
+                            columns=[{"name": i, "id": i}
+                                     for i in TABLE_COLUMNS],
+                            data=figures["table"],
+                            style_table={'overflowX': 'auto'},
+                            style_header={
+                                'backgroundColor': 'white',
+                                'fontWeight': 'bold'
+                            },
+                            style_data_conditional=[
+                                {'if': {'row_index': 'odd'},
+                                    'backgroundColor': 'rgb(248, 248, 248)'}
+                            ],
+                            export_headers='display',
+                            export_format='xlsx'
                         )
-                    ], align="center", justify="start")
-                ),
-                dbc.CardBody(
-                    html.Div(
-                        news_elements,
-                        id='news-bar',
-                        style={
-                            'height': '350px',
-                            'overflowY': 'scroll',
-                            'border': '1px solid #e9ecef',
-                            'padding': '10px',
-                            'border-radius': '0.25rem',
-                            'background-color': '#f8f9fa'
-                        }
+                    )
+                ], className="shadow-sm border-0"),
+                md=6,
+                className="mb-4"
+            ),
+            dbc.Col(
+                dbc.Card([
+                    dbc.CardHeader(
+                        dbc.Row([
+                            dbc.Col(html.Span("Top News in ",
+                                    className="h5 me-2"), width="auto"),
+                            dbc.Col(
+                                dcc.Dropdown(
+                                    id='country-dropdown',
+                                    options=country_options,
+                                    value='United States',
+                                    clearable=False,
+                                    className="flex-grow-1"
+                                ),
+                                width=True
+                            )
+                        ], align="center", justify="start")
                     ),
-                    className="p-0"
-                )
-            ], className="shadow-sm border-0"),
-            md=6,
-            className="mb-4"
-        )
-    ], className="mb-4")
+                    dbc.CardBody(
+                        html.Div(
+                            news_elements,
+                            id='news-bar',
+                            style={
+                                'height': '350px',
+                                'overflowY': 'scroll',
+                                'border': '1px solid #e9ecef',
+                                'padding': '10px',
+                                'border-radius': '0.25rem',
+                                'background-color': '#f8f9fa'
+                            }
+                        ),
+                        className="p-0"
+                    )
+                ], className="shadow-sm border-0"),
+                md=6,
+                className="mb-4"
+            )
+        ], className="mb-4")
 
-], fluid=True, className="p-4")
+    ], fluid=True, className="p-4")
+
+
+# Dash calls this on every page load
+app.layout = serve_layout
 
 # --- 4. Callbacks for Offcanvas and Dynamic Content ---
 
@@ -541,65 +446,18 @@ def handle_default_search_button(n_clicks, search_mode):
     custom_search_output_children = None  # Or html.Div()
 
     if search_mode == "custom":
-        data = client.get("monthly_summary")
-        print(data, "Hello")
-        data = json.loads(data)
-
-        # Dummy Data for Line Graph
-        line_graph = data['line_graph']
-        # timestamps = line_graph.keys()
-        timestamps = [datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
-                      for ts_str in line_graph.keys()]
-        sentiments = list(line_graph.values())
-        df_line = pd.DataFrame({
-            "Timestamp": timestamps,
-            "Sentiment Score": sentiments
-        })
-
-        df = df_line.sort_values(by="Timestamp")
-        fig_line = px.line(df, x="Timestamp", y="Sentiment Score", title="Overall Sentiment Trend",
-                           markers=True, line_shape="linear")
-        fig_line.update_layout(hovermode="x unified", template="plotly_white",
-                               xaxis_rangeslider_visible=True)
-
-        # Dummy Data for Pie Chart
-        pie_chart = data['pie_chart']
-        total = 0
-        pie_data = [pie_chart['good'], pie_chart['okay'], pie_chart['bad']]
-        for i in pie_data:
-            total += i
-        pie_data = [x / total * 100 for x in pie_data]
-        pie_data = [int(round(x)) for x in pie_data]
-        df_pie = pd.DataFrame({
-            "Sentiment": ["Positive", "Neutral", "Negative"],
-            "Count": pie_data
-        })
-        fig_pie = px.pie(df_pie, names="Sentiment", values="Count", title="Sentiment Distribution",
-                         color_discrete_map={'Positive': '#28a745', 'Neutral': '#ffc107', 'Negative': '#dc3545'})
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-        fig_pie.update_layout(showlegend=True)
-
-        # Dummy Data for Table
-        top_sources = data['top_sources']
-        sources = []
-        article_counts = []
-        avg_sentiments = []
-
-        for i in top_sources:
-            sources.append(i['source'])
-            article_counts.append(i['article_count'])
-            avg_sentiments.append(i['avg_sentiment'])
-
-        df_table = pd.DataFrame({
-            "Sources": sources,
-            "Art. Count": article_counts,
-            "Avg. Sentiment": avg_sentiments
-        })
-
-        df_table_json = df_table.to_dict('records')
+        try:
+            figures = get_dashboard_cache().figures("monthly_summary")
+        except RedisError as e:
+            print(f"Redis unavailable, keeping the current charts: {e}")
+            raise dash.exceptions.PreventUpdate
+        if figures is None:
+            raise dash.exceptions.PreventUpdate
+        fig_line = figures["line"]
+        fig_pie = figures["pie"]
+        df_table_json = figures["table"]
         # Dummy News Articles for Scrollable Feed
-        news_articles = top_news(
-            "https://news.google.com/rss?hl=en-US&gl=NG&ceid=US:en")
+        news_articles = get_headlines(get_page_client(), DEFAULT_FEED_COUNTRY)
 
         news_elements = [create_news_item_component(
             article['title'], article['link']) for article in news_articles]
@@ -732,7 +590,7 @@ def perform_custom_search(n_clicks, current_search_query, last_searched_query):
             style={'text-align': 'center'}
         )
 
-        dates, sentiments, pie_data, top_headlines = get_data(
+        dates, sentiments, pie_data, top_headlines = cached_get_data(
             cleaned_current_query)
         if dates == []:
             search_message = html.Div(
@@ -803,42 +661,20 @@ def top_news_in_country(selected_country_value, current_search_mode, last_search
     if current_search_mode is None:
         raise dash.exceptions.PreventUpdate
 
-    # Get country parameters
-    # Use .get() with a default to prevent KeyError if selected_country_value is unexpected
-    country_params = COUNTRY_CODES.get(
-        selected_country_value, COUNTRY_CODES['United States'])
-    hl = country_params['hl']
-    gl = country_params['gl']
-    ceid = country_params['ceid']
-
     news_elements = []  # Initialize news_elements to an empty list
 
     if current_search_mode == 'default':
         # In default mode, get general top news for the selected country
-        url = f"https://news.google.com/rss?hl={hl}-{gl}&gl={gl}&ceid={ceid}"
-        # Debugging
-        print(
-            f"Fetching default news for {selected_country_value} from URL: {url}")
-        top_headlines = top_news(url)
+        # (kept warm in Redis by app.scheduled.refresh_headlines)
+        top_headlines = get_headlines(get_page_client(), selected_country_value)
         news_elements = [create_news_item_component(
             article['title'], article['link']) for article in top_headlines]
 
     elif current_search_mode == 'custom':
         # In custom mode, use the last searched query with the new country
         if last_searched_query:  # Check if there's actually a query to search for
-            # Ensure the query is URL-encoded if it contains spaces or special characters
-            # requests.get will handle this mostly, but for constructing the URL,
-            # it's good practice to ensure it's clean for the 'q' parameter.
-            # However, Google News RSS often handles spaces naturally with just '+'
-            # Let's revert to last_searched_query directly for query part, as it's cleaner.
-            cleaned_input_for_url = last_searched_query.strip().replace(
-                ' ', '+')  # Replace spaces with '+'
-
-            url = f"https://news.google.com/rss/search?q={cleaned_input_for_url}&hl={hl}&gl={gl}&ceid={ceid}"
-            # Debugging
-            print(
-                f"Fetching custom news for '{last_searched_query}' in {selected_country_value} from URL: {url}")
-            top_headlines = top_news(url)
+            top_headlines = get_headlines(
+                get_page_client(), selected_country_value, query=last_searched_query)
             news_elements = [create_news_item_component(
                 article['title'], article['link']) for article in top_headlines]
         else:
@@ -891,75 +727,22 @@ def time_and_cat_sort(selected_time_value, selected_category_value, selected_cou
         raise dash.exceptions.PreventUpdate
 
     redis_key = f"{selected_time_value}_{selected_category_value}"
-    data = client.get(redis_key)
-
-    data = json.loads(data)
-
-    # Dummy Data for Line Graph
-    line_graph = data['line_graph']
-    # timestamps = line_graph.keys()
-    timestamps = [datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
-                  for ts_str in line_graph.keys()]
-    sentiments = list(line_graph.values())
-    df_line = pd.DataFrame({
-        "Timestamp": timestamps,
-        "Sentiment Score": sentiments
-    })
-
-    df = df_line.sort_values(by="Timestamp")
-    fig_line = px.line(df, x="Timestamp", y="Sentiment Score", title="Overall Sentiment Trend",
-                       markers=True, line_shape="linear")
-    fig_line.update_layout(hovermode="x unified", template="plotly_white",
-                           xaxis_rangeslider_visible=True)
-
-    # Dummy Data for Pie Chart
-    pie_chart = data['pie_chart']
-    total = 0
-    pie_data = [pie_chart['good'], pie_chart['okay'], pie_chart['bad']]
-    for i in pie_data:
-        total += i
-    pie_data = [x / total * 100 for x in pie_data]
-    pie_data = [int(round(x)) for x in pie_data]
-    df_pie = pd.DataFrame({
-        "Sentiment": ["Positive", "Neutral", "Negative"],
-        "Count": pie_data
-    })
-    fig_pie = px.pie(df_pie, names="Sentiment", values="Count", title="Sentiment Distribution",
-                     color_discrete_map={'Positive': '#28a745', 'Neutral': '#ffc107', 'Negative': '#dc3545'})
-    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-    fig_pie.update_layout(showlegend=True)
-
-    # Dummy Data for Table
-    top_sources = data['top_sources']
-    sources = []
-    article_counts = []
-    avg_sentiments = []
-
-    for i in top_sources:
-        sources.append(i['source'])
-        article_counts.append(i['article_count'])
-        avg_sentiments.append(i['avg_sentiment'])
-
-    df_table = pd.DataFrame({
-        "Sources": sources,
-        "Art. Count": article_counts,
-        "Avg. Sentiment": avg_sentiments
-    })
-
-    df_table_json = df_table.to_dict('records')
-    # Dummy News Articles for Scrollable Feed
-
-    country_params = COUNTRY_CODES.get(
-        selected_country, COUNTRY_CODES['United States'])
-    hl = country_params['hl']
-    gl = country_params['gl']
-    ceid = country_params['ceid']
+    # Figures are rendered by the refresh job and held in-process until the next one
+    try:
+        figures = get_dashboard_cache().figures(redis_key)
+    except RedisError as e:
+        # Cold process with Redis down: nothing cached yet to fall back on
+        print(f"Redis unavailable, keeping the current charts: {e}")
+        raise dash.exceptions.PreventUpdate
+    if figures is None:
+        raise dash.exceptions.PreventUpdate
 
-    url = f"https://news.google.com/rss/search?q={selected_category_value}&hl={hl}-{gl}&gl={gl}&ceid={ceid}"
-    if selected_category_value == "summary":
-        url = f"https://news.google.com/rss?hl={hl}-{gl}&gl={gl}&ceid={ceid}"
+    fig_line = figures["line"]
+    fig_pie = figures["pie"]
+    df_table_json = figures["table"]
+    # Dummy News Articles for Scrollable Feed
 
-    news_articles = top_news(url)
+    news_articles = get_headlines(get_page_client(), selected_country, selected_category_value)
     news_elements = [create_news_item_component(
         article['title'], article['link']) for article in news_articles]
 
@@ -0,0 +1,234 @@
+import argparse
+import logging
+import os
+import re
+import time
+import zlib
+from typing import List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+compact_model_path = os.path.join(
+    os.path.dirname(__file__), "ag_news_classifier_compact.npz")
+
+
+def _hash_token(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8"))
+
+
+class CompactClassifier:
+    """
+    Array-only export of the TF-IDF + LogisticRegression pipeline.
+
+    The vocabulary dict is replaced by the sorted crc32 hashes of its terms;
+    row i of the float32 weight matrix belongs to hashes[i]. Prediction
+    tokenizes with the vectorizer's own pattern, finds each token with a
+    binary search, builds the l2-normalized tf-idf rows as a sparse matrix
+    and takes one sparse-dense product with the weights.
+    """
+
+    def __init__(self, hashes: np.ndarray, idf: np.ndarray, weights: np.ndarray,
+                 intercept: np.ndarray, classes: np.ndarray, token_pattern: str,
+                 lowercase: bool = True, sublinear_tf: bool = False):
+        self.hashes = hashes
+        self.idf = idf
+        self.weights = weights
+        self.intercept = intercept
+        self.classes = classes
+        self.token_pattern = token_pattern
+        self.lowercase = lowercase
+        self.sublinear_tf = sublinear_tf
+        self._token_re = re.compile(token_pattern)
+
+    @classmethod
+    def from_pipeline(cls, pipeline) -> "CompactClassifier":
+        """Export a fitted Pipeline([("vectorizer", TfidfVectorizer), ("classifier", LogisticRegression)])."""
+        vectorizer = pipeline.named_steps["vectorizer"]
+        classifier = pipeline.named_steps["classifier"]
+        if vectorizer.ngram_range != (1, 1) or vectorizer.analyzer != "word" \
+                or vectorizer.norm != "l2" or vectorizer.binary or vectorizer.tokenizer:
+            raise ValueError("Only unigram word TF-IDF with l2 norm can be exported")
+
+        terms = vectorizer.get_feature_names_out()
+        term_hashes = np.array([_hash_token(term) for term in terms], dtype=np.uint32)
+        if len(np.unique(term_hashes)) != len(term_hashes):
+            raise ValueError("crc32 collision inside the vocabulary")
+        order = np.argsort(term_hashes)
+
+        coef = np.asarray(classifier.coef_, dtype=np.float32)
+        intercept = np.asarray(classifier.intercept_, dtype=np.float32)
+        if coef.shape[0] == 1:
+            # Binary LogisticRegression keeps one row for classes_[1]
+            coef = np.vstack([-coef, coef]) / 2
+            intercept = np.concatenate([-intercept, intercept]) / 2
+
+        return cls(
+            hashes=term_hashes[order],
+            idf=np.asarray(vectorizer.idf_, dtype=np.float32)[order],
+            weights=np.ascontiguousarray(coef.T[order]),
+            intercept=intercept,
+            classes=np.asarray(classifier.classes_).astype(str),
+            token_pattern=vectorizer.token_pattern,
+            lowercase=vectorizer.lowercase,
+            sublinear_tf=vectorizer.sublinear_tf,
+        )
+
+    def save(self, path: str = compact_model_path) -> None:
+        np.savez(path, hashes=self.hashes, idf=self.idf, weights=self.weights,
+                 intercept=self.intercept, classes=self.classes,
+                 token_pattern=np.array(self.token_pattern),
+                 lowercase=np.array(self.lowercase),
+                 sublinear_tf=np.array(self.sublinear_tf))
+
+    @classmethod
+    def load(cls, path: str = compact_model_path) -> "CompactClassifier":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                hashes=data["hashes"], idf=data["idf"], weights=data["weights"],
+                intercept=data["intercept"], classes=data["classes"],
+                token_pattern=str(data["token_pattern"]),
+                lowercase=bool(data["lowercase"]),
+                sublinear_tf=bool(data["sublinear_tf"]),
+            )
+
+    def _counts(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """Raw term counts over the compact feature space, one row per text."""
+        tokens: List[str] = []
+        lengths = np.zeros(len(texts), dtype=np.int64)
+        for doc, text in enumerate(texts):
+            text = str(text)
+            doc_tokens = self._token_re.findall(text.lower() if self.lowercase else text)
+            lengths[doc] = len(doc_tokens)
+            tokens.extend(doc_tokens)
+
+        n_docs, n_features = len(texts), len(self.hashes)
+        if not tokens:
+            return sparse.csr_matrix((n_docs, n_features), dtype=np.float32)
+
+        # Hash each distinct token of the batch once
+        distinct = {token: _hash_token(token) for token in set(tokens)}
+        lookup = np.fromiter(map(distinct.__getitem__, tokens),
+                             dtype=np.uint32, count=len(tokens))
+        positions = np.searchsorted(self.hashes, lookup)
+        positions[positions == n_features] = 0
+        known = self.hashes[positions] == lookup
+
+        doc_ids = np.repeat(np.arange(n_docs), lengths)
+        counts = sparse.csr_matrix(
+            (np.ones(int(known.sum()), dtype=np.float32),
+             (doc_ids[known], positions[known])),
+            shape=(n_docs, n_features))
+        counts.sum_duplicates()
+        if self.sublinear_tf:
+            np.log(counts.data, counts.data)
+            counts.data += 1
+        return counts
+
+    def transform(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """l2-normalized tf-idf rows (columns in hash order, not vocabulary order)."""
+        tfidf = self._counts(texts).multiply(self.idf).tocsr()
+        return sparse.csr_matrix(sparse.diags(1.0 / self._row_norms(tfidf)) @ tfidf,
+                                 dtype=np.float32)
+
+    @staticmethod
+    def _row_norms(matrix: sparse.csr_matrix) -> np.ndarray:
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return norms
+
+    def decision_function(self, texts: Sequence[str]) -> np.ndarray:
+        # Normalizing the (n, classes) scores is cheaper than rebuilding the sparse rows
+        tfidf = self._counts(texts).multiply(self.idf).tocsr()
+        scores = tfidf @ self.weights
+        return scores / self._row_norms(tfidf)[:, None] + self.intercept
+
+    def predict(self, texts: Sequence[str]) -> np.ndarray:
+        if len(texts) == 0:
+            return np.array([], dtype=self.classes.dtype)
+        return self.classes[np.argmax(self.decision_function(texts), axis=1)]
+
+
+_compact_model: Optional[CompactClassifier] = None
+_compact_missing = False
+
+
+def get_compact_model() -> Optional[CompactClassifier]:
+    """
+    Load the exported .npz artifact on first use. None (with one warning per
+    process) when it hasn't been exported, so callers fall back to the pipeline.
+    """
+    global _compact_model, _compact_missing
+    if _compact_model is None:
+        if not os.path.exists(compact_model_path):
+            if not _compact_missing:
+                _compact_missing = True
+                logger.warning(
+                    f"{os.path.basename(compact_model_path)} not found, using the pickled pipeline; "
+                    "export it with python -m app.models.compact_classifier --export")
+            return None
+        start = time.perf_counter()
+        _compact_model = CompactClassifier.load()
+        logger.info(
+            f"Loaded compact classifier in {time.perf_counter() - start:.4f}s")
+    return _compact_model
+
+
+def export_compact_model(path: str = compact_model_path) -> CompactClassifier:
+    """Convert the pickled pipeline into the compact .npz artifact."""
+    from app.models.news_classifier import get_model
+    compact = CompactClassifier.from_pipeline(get_model())
+    compact.save(path)
+    logger.info(
+        f"Exported {len(compact.hashes)} features x {len(compact.classes)} classes "
+        f"to {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+    return compact
+
+
+def benchmark(texts: Sequence[str], compact: Optional[CompactClassifier] = None,
+              repeat: int = 3) -> dict:
+    """Label agreement with the pickled pipeline and throughput of both backends."""
+    from app.models.news_classifier import get_model
+    pipeline = get_model()
+    compact = compact or CompactClassifier.load()
+    texts = list(texts)
+
+    def throughput(predict) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            predict(texts)
+            best = min(best, time.perf_counter() - start)
+        return len(texts) / best
+
+    expected = np.asarray(pipeline.predict(texts)).astype(str)
+    actual = compact.predict(texts)
+    return {
+        "articles": len(texts),
+        "agreement": float(np.mean(expected == actual)) if texts else 1.0,
+        "pipeline_articles_per_second": round(throughput(pipeline.predict), 1),
+        "compact_articles_per_second": round(throughput(compact.predict), 1),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Export the compact classifier and compare it with the pickled pipeline.")
+    parser.add_argument("--export", action="store_true",
+                        help=f"write {os.path.basename(compact_model_path)} first")
+    parser.add_argument("--texts", help="file with one article description per line")
+    args = parser.parse_args()
+
+    model = export_compact_model() if args.export else None
+    if args.texts:
+        with open(args.texts, encoding="utf-8") as handle:
+            sample = [line.strip() for line in handle if line.strip()]
+    else:
+        from app.models.news_classifier import x
+        sample = x * 2500
+    print(benchmark(sample, compact=model))
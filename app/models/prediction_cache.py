@@ -0,0 +1,187 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.models.sentiment import analyze_sentiments
+from app.models.worker_pool import score_texts
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# (sentiment, category); category is None when only the sentiment was computed
+Prediction = Tuple[float, Optional[str]]
+
+DEFAULT_MAXSIZE = 20_000
+DEFAULT_REDIS_TTL = 7 * 24 * 3600
+
+
+def text_key(text: str) -> str:
+    """Hash of the case-folded, whitespace-collapsed text."""
+    normalized = " ".join(str(text).casefold().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class PredictionCache:
+    """
+    Bounded LRU of predictions keyed by `text_key`, with an optional shared
+    Redis tier (an app.redis_logic.async_redis.RedisClient) behind it.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, redis_client: Any = None,
+                 redis_ttl: int = DEFAULT_REDIS_TTL, namespace: str = "nlp:pred"):
+        self.maxsize = maxsize
+        self.redis_client = redis_client
+        self.redis_ttl = redis_ttl
+        self.namespace = namespace
+        self._lru: "OrderedDict[str, Prediction]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    # --- In-process tier ---
+
+    def get_local(self, key: str) -> Optional[Prediction]:
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+            return value
+
+    def put_local(self, key: str, value: Prediction) -> None:
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+
+    def lookup_local(self, texts: Sequence[str]) -> List[Optional[Prediction]]:
+        """Local-only lookup, usable from synchronous code such as Dash callbacks."""
+        results = []
+        for text in texts:
+            value = self.get_local(text_key(text))
+            self._count(value is not None, shared=False)
+            results.append(value)
+        return results
+
+    def store_local(self, texts: Sequence[str], values: Sequence[Prediction]) -> None:
+        for text, value in zip(texts, values):
+            self.put_local(text_key(text), value)
+
+    # --- Both tiers ---
+
+    async def lookup(self, texts: Sequence[str]) -> List[Optional[Prediction]]:
+        """Check the LRU first, then fetch the remaining keys from Redis in one MGET."""
+        keys = [text_key(text) for text in texts]
+        results: List[Optional[Prediction]] = [self.get_local(key) for key in keys]
+        # Sentiment-only entries (category None, from custom search) can't answer a
+        # full prediction, so they are looked up in Redis and counted like misses
+        missing = [i for i, value in enumerate(results) if value is None or value[1] is None]
+        self.local_hits += len(keys) - len(missing)
+
+        if missing and self.redis_client is not None:
+            raw_values = await self.redis_client.mget(
+                [f"{self.namespace}:{keys[i]}" for i in missing])
+            for i, raw in zip(missing, raw_values):
+                if raw:
+                    sentiment, category = json.loads(raw)
+                    if category is None:
+                        continue
+                    results[i] = (sentiment, category)
+                    self.put_local(keys[i], results[i])
+                    self.redis_hits += 1
+
+        self.misses += sum(1 for i in missing if results[i] is None or results[i][1] is None)
+        return results
+
+    async def store(self, texts: Sequence[str], values: Sequence[Prediction]) -> None:
+        keys = [text_key(text) for text in texts]
+        for key, value in zip(keys, values):
+            self.put_local(key, value)
+        if self.redis_client is not None and keys:
+            await self.redis_client.set_many(
+                {f"{self.namespace}:{key}": json.dumps(value) for key, value in zip(keys, values)},
+                ex=self.redis_ttl, transaction=False)
+
+    def _count(self, hit: bool, shared: bool) -> None:
+        if not hit:
+            self.misses += 1
+        elif shared:
+            self.redis_hits += 1
+        else:
+            self.local_hits += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": (self.local_hits + self.redis_hits) / lookups if lookups else 0.0,
+            "size": len(self._lru),
+        }
+
+
+_cache: Optional[PredictionCache] = None
+
+
+def get_prediction_cache() -> PredictionCache:
+    """Process-wide cache, sized by PREDICTION_CACHE_SIZE."""
+    global _cache
+    if _cache is None:
+        _cache = PredictionCache(
+            maxsize=int(os.getenv("PREDICTION_CACHE_SIZE", str(DEFAULT_MAXSIZE))))
+    return _cache
+
+
+async def close_prediction_cache() -> None:
+    """Close and detach the shared Redis tier, if one was attached; the LRU is kept."""
+    if _cache is not None and _cache.redis_client is not None:
+        client, _cache.redis_client = _cache.redis_client, None
+        await client.close()
+
+
+async def predict_with_cache(texts: Sequence[str],
+                             cache: Optional[PredictionCache] = None) -> Tuple[List[float], List[str]]:
+    """(sentiments, categories) for `texts`, running inference only for cache misses."""
+    cache = cache or get_prediction_cache()
+    texts = list(texts)
+    cached = await cache.lookup(texts)
+    # Entries cached by custom search have no category yet, so they count as misses here
+    missing = [i for i, value in enumerate(cached)
+               if value is None or value[1] is None]
+
+    if missing:
+        sentiments, categories = await score_texts([texts[i] for i in missing])
+        fresh = list(zip(sentiments, categories))
+        for i, value in zip(missing, fresh):
+            cached[i] = value
+        await cache.store([texts[i] for i in missing], fresh)
+
+    stats = cache.stats()
+    logger.info(
+        f"Prediction cache: {len(texts) - len(missing)}/{len(texts)} cached "
+        f"(hit rate {stats['hit_rate']:.1%}, {stats['size']} entries)")
+    return [value[0] for value in cached], [value[1] for value in cached]
+
+
+def sentiments_with_cache(texts: Sequence[str],
+                          cache: Optional[PredictionCache] = None) -> List[float]:
+    """Synchronous sentiment-only lookup backed by the in-process tier."""
+    cache = cache or get_prediction_cache()
+    texts = list(texts)
+    cached = cache.lookup_local(texts)
+    missing = [i for i, value in enumerate(cached) if value is None]
+    if missing:
+        scores = analyze_sentiments([texts[i] for i in missing])
+        cache.store_local([texts[i] for i in missing],
+                          [(score, None) for score in scores])
+        for i, score in zip(missing, scores):
+            cached[i] = (score, None)
+    return [value[0] for value in cached]
@@ -1,13 +1,119 @@
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from typing import List, Sequence
+import numpy as np
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer, SentiText, BOOSTER_DICT
 
 analyzer = SentimentIntensityAnalyzer()
 
+# VADER's normalization constant and punctuation weights (see score_valence)
+ALPHA = 15
+EXCLAMATION_WEIGHT = 0.292
+QUESTION_WEIGHT = 0.18
+QUESTION_CAP = 0.96
+
 
 def analyze_sentiment(text):
     score = analyzer.polarity_scores(text)
     return score["compound"]  # Main value for plotting
 
 
+def _replace_emojis(text: str) -> str:
+    """Swap emojis for their textual descriptions, as polarity_scores does."""
+    text_no_emoji = ""
+    prev_space = True
+    for char in text:
+        if char in analyzer.emojis:
+            if not prev_space:
+                text_no_emoji += ' '
+            text_no_emoji += analyzer.emojis[char]
+            prev_space = False
+        else:
+            text_no_emoji += char
+            prev_space = char == ' '
+    return text_no_emoji.strip()
+
+
+def analyze_sentiments(texts: Sequence[str]) -> List[float]:
+    """
+    Batch version of `analyze_sentiment`, returning the same compound scores.
+
+    Every text is tokenized once and each distinct token in the batch is
+    looked up in the lexicon once. VADER's word-level rules only run on
+    lexicon hits, since every other token scores zero. They only look 3
+    words back and 2 ahead, so each distinct window is scored once per
+    batch. Summing, punctuation emphasis and normalization are done with
+    numpy over the whole batch.
+    """
+    if not texts:
+        return []
+
+    sentitexts = []
+    prepared = []
+    owners = []
+    tokens = []
+    for index, text in enumerate(texts):
+        text = str(text)
+        if not analyzer.emojis.keys().isdisjoint(text):
+            text = _replace_emojis(text)
+        else:
+            text = text.strip()
+        sentitext = SentiText(text)
+        sentitexts.append(sentitext)
+        prepared.append(text)
+        owners.extend([index] * len(sentitext.words_and_emoticons))
+        tokens.extend(word.lower() for word in sentitext.words_and_emoticons)
+
+    count = len(prepared)
+    valences = np.zeros(len(tokens), dtype=np.float64)
+    if tokens:
+        vocabulary, inverse = np.unique(np.array(tokens), return_inverse=True)
+        in_lexicon = np.fromiter((word in analyzer.lexicon for word in vocabulary.tolist()),
+                                 dtype=bool, count=len(vocabulary))
+        hits = np.flatnonzero(in_lexicon[inverse])
+
+        window_scores = {}
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(owners, minlength=count), out=offsets[1:])
+        for position in hits.tolist():
+            index = owners[position]
+            i = position - offsets[index]
+            words = sentitexts[index].words_and_emoticons
+            item = words[i]
+            lowered = tokens[position]
+            if lowered in BOOSTER_DICT:
+                continue
+            if lowered == "kind" and i < len(words) - 1 and words[i + 1].lower() == "of":
+                continue
+            window = (tuple(words[max(0, i - 3):i + 3]), min(i, 3),
+                      sentitexts[index].is_cap_diff)
+            if window not in window_scores:
+                scored = analyzer.sentiment_valence(0, sentitexts[index], item, i, [])
+                window_scores[window] = scored[-1]
+            valences[position] = window_scores[window]
+
+        # 'but' reweights the whole sentence, so hand those texts to VADER's own check
+        for index, sentitext in enumerate(sentitexts):
+            start, end = offsets[index], offsets[index + 1]
+            if "but" in tokens[start:end]:
+                reweighted = analyzer._but_check(
+                    sentitext.words_and_emoticons, valences[start:end].tolist())
+                valences[start:end] = reweighted
+
+    sums = np.bincount(owners, weights=valences, minlength=count) if tokens \
+        else np.zeros(count)
+
+    exclamations = np.array([text.count("!") for text in prepared])
+    questions = np.array([text.count("?") for text in prepared])
+    emphasis = np.minimum(exclamations, 4) * EXCLAMATION_WEIGHT
+    emphasis += np.where(questions > 3, QUESTION_CAP,
+                         np.where(questions > 1, questions * QUESTION_WEIGHT, 0.0))
+
+    sums = sums + np.sign(sums) * emphasis
+    compound = np.clip(sums / np.sqrt(sums * sums + ALPHA), -1.0, 1.0)
+    return np.round(compound, 4).tolist()
+
+
 if __name__ == "__main__":
     print(analyze_sentiment(
         "Everyone in the world is sad"))
+    print(analyze_sentiments(
+        ["Everyone in the world is sad", "The match was GREAT, but the food was awful!!"]))
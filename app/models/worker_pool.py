@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+def _preload_models() -> None:
+    """Worker initializer: load VADER and the classifier once per process."""
+    from app.models import sentiment  # noqa: F401
+    from app.models.news_classifier import get_model
+    get_model()
+
+
+def score_chunk(texts: Sequence[str]) -> Tuple[List[float], List[str]]:
+    """Return (sentiments, categories) for a chunk of descriptions."""
+    from app.models.sentiment import analyze_sentiments
+    from app.models.news_classifier import classify_articles
+    texts = list(texts)
+    return analyze_sentiments(texts), [str(label) for label in classify_articles(texts)]
+
+
+class NLPWorkerPool:
+    """Persistent process pool that scores descriptions while the event loop keeps serving I/O."""
+
+    def __init__(self, max_workers: int, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.max_workers = max_workers
+        self.chunk_size = max(1, chunk_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        if self._executor is None:
+            # spawn: workers must not inherit the parent's event loop or DB/Redis sockets
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_preload_models,
+            )
+            logger.info(f"Started NLP worker pool with {self.max_workers} processes")
+
+    async def score(self, texts: Sequence[str]) -> Tuple[List[float], List[str]]:
+        """Split `texts` into chunks, score them in parallel and keep the input order."""
+        self.start()
+        loop = asyncio.get_running_loop()
+        chunks = [texts[i:i + self.chunk_size]
+                  for i in range(0, len(texts), self.chunk_size)]
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, score_chunk, chunk) for chunk in chunks
+        ))
+        sentiments: List[float] = []
+        categories: List[str] = []
+        for chunk_sentiments, chunk_categories in results:
+            sentiments.extend(chunk_sentiments)
+            categories.extend(chunk_categories)
+        return sentiments, categories
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info("NLP worker pool shut down")
+
+
+_pool: Optional[NLPWorkerPool] = None
+
+
+def get_nlp_pool() -> Optional[NLPWorkerPool]:
+    """
+    Process-wide pool sized by NLP_POOL_SIZE (chunks of NLP_CHUNK_SIZE texts).
+    Returns None when NLP_POOL_SIZE is unset or 0, which keeps scoring inline.
+    Read lazily so values from app/.env are picked up after load_dotenv.
+    """
+    global _pool
+    pool_size = int(os.getenv("NLP_POOL_SIZE", "0"))
+    if pool_size <= 0:
+        return None
+    if _pool is None:
+        chunk_size = int(os.getenv("NLP_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE)))
+        _pool = NLPWorkerPool(max_workers=pool_size, chunk_size=chunk_size)
+    return _pool
+
+
+async def score_texts(texts: Sequence[str]) -> Tuple[List[float], List[str]]:
+    """Score descriptions in the worker pool if one is configured, otherwise inline."""
+    if not texts:
+        return [], []
+    pool = get_nlp_pool()
+    if pool is None:
+        return score_chunk(texts)
+    return await pool.score(list(texts))
+
+
+def shutdown_nlp_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
@@ -1,9 +1,14 @@
+import asyncio
+import json
 import logging
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, AsyncIterator, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 import httpx
 import os
+from app.feed_cache import ConditionalFetcher
+from app.http_client import get_http_manager
 from tenacity import retry, wait_exponential, stop_after_attempt, before_log, after_log, retry_if_exception_type
 
 # --- Configure Logging ---
@@ -34,6 +39,60 @@ def safe_join(value: Any) -> str:
         return str(value)
     return ""
 
+
+def parse_partitions(spec: str) -> List[Dict[str, str]]:
+    """
+    Parse NEWS_FETCH_PARTITIONS, e.g. "category:business,category:sports,country:us".
+    Each partition is paged independently; an empty spec means one unfiltered query.
+    """
+    partitions = []
+    for item in spec.split(","):
+        if ":" in item:
+            name, value = item.split(":", 1)
+            partitions.append({name.strip(): value.strip()})
+    return partitions or [{}]
+
+# --- Rate Limiting ---
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second on average, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+# --- Conditional Requests ---
+
+# ETag / Last-Modified of the first page of each query, kept for the life of the
+# process so the scheduler's next run can ask for it conditionally. Cursor
+# pages are one-off URLs and are always fetched in full.
+_api_fetcher: Optional[ConditionalFetcher] = None
+
+
+def get_api_fetcher() -> ConditionalFetcher:
+    """Process-wide conditional fetcher for first pages, tracking up to NEWS_CONDITIONAL_URLS queries."""
+    global _api_fetcher
+    if _api_fetcher is None:
+        _api_fetcher = ConditionalFetcher(
+            parse=json.loads, maxsize=int(os.getenv("NEWS_CONDITIONAL_URLS", "64")))
+    return _api_fetcher
+
 # --- News Fetcher Class ---
 
 
@@ -48,6 +107,12 @@ class NewsFetcher:
         self.api_key = NEWS_API_KEY
         self.base_url = base_url
         self.news_url = f"{base_url}?apikey={self.api_key}&language=en"
+        # Paginated mode settings; the defaults keep a full run inside the free-tier quota
+        self.max_pages = int(os.getenv("NEWS_MAX_PAGES", "10"))
+        self.max_in_flight = int(os.getenv("NEWS_PAGES_IN_FLIGHT", "3"))
+        self.rate_limiter = TokenBucket(
+            rate=float(os.getenv("NEWS_RATE_PER_SECOND", "0.5")),
+            capacity=int(os.getenv("NEWS_RATE_BURST", "3")))
 
     def extract_data(self, json_data: Dict[str, Any]) -> Dict[str, List[str]]:
         """Extract relevant fields from the Newsdata.io API response."""
@@ -105,27 +170,124 @@ class NewsFetcher:
     )
     async def fetch_news(self) -> Dict[str, List[str]]:
         """Fetch news articles from the Newsdata.io API with retry logic."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(self.news_url)
-                response.raise_for_status()
-                data_json = response.json()
-                logger.info("Successfully fetched news from API")
-                return self.extract_data(data_json)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in (429, 503):
-                    logger.warning(
-                        f"Retriable HTTP error {e.response.status_code}: {e}")
-                    raise
-                logger.error(
-                    f"Non-retriable HTTP error {e.response.status_code}: {e}")
+        # Shared pooled client: retries reuse the kept-alive connection
+        manager = get_http_manager()
+        try:
+            data_json, not_modified = await get_api_fetcher().afetch_status(self.news_url)
+            if not_modified:
+                logger.info("Latest news not modified since the last fetch")
                 return {}
-            except (httpx.RequestError, httpx.TimeoutException) as e:
-                logger.warning(f"Retriable network error: {e}")
+            logger.info("Successfully fetched news from API")
+            manager.log_stats()
+            return self.extract_data(data_json)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (429, 503):
+                logger.warning(
+                    f"Retriable HTTP error {e.response.status_code}: {e}")
+                raise
+            logger.error(
+                f"Non-retriable HTTP error {e.response.status_code}: {e}")
+            return {}
+        except (httpx.RequestError, httpx.TimeoutException) as e:
+            logger.warning(f"Retriable network error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error fetching news: {e}")
+            return {}
+
+    @retry(
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        stop=stop_after_attempt(5),
+        retry=retry_if_exception_type(RETRIABLE_EXCEPTIONS),
+        before=before_log(logger, logging.INFO),
+        after=after_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def fetch_page(self, client: httpx.AsyncClient, params: Dict[str, str],
+                         cursor: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page of /latest; every attempt, including retries, takes a rate-limit token.
+        First pages are requested conditionally and None means the API answered 304.
+        """
+        await self.rate_limiter.acquire()
+        query = {"apikey": self.api_key, "language": "en", **params}
+        try:
+            if cursor:
+                query["page"] = cursor
+                response = await client.get(self.base_url, params=query)
+                response.raise_for_status()
+                return response.json()
+            data_json, not_modified = await get_api_fetcher().afetch_status(
+                str(httpx.URL(self.base_url, params=query)))
+            return None if not_modified else data_json
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (429, 503):
+                logger.warning(f"Retriable HTTP error {e.response.status_code}: {e}")
                 raise
+            logger.error(f"Non-retriable HTTP error {e.response.status_code}: {e}")
+            return {}
+
+    async def _drain_partition(self, client: httpx.AsyncClient, params: Dict[str, str],
+                               pages_in_flight: asyncio.Semaphore,
+                               queue: "asyncio.Queue[Dict[str, List[str]]]") -> int:
+        """Follow the nextPage cursor for one partition, pushing each page onto `queue`."""
+        cursor = None
+        pages = 0
+        while pages < self.max_pages:
+            try:
+                async with pages_in_flight:
+                    data_json = await self.fetch_page(client, params, cursor)
             except Exception as e:
-                logger.error(f"Unexpected error fetching news: {e}")
-                return {}
+                logger.error(f"Stopped paging {params or 'latest'} after {pages} pages: {e}")
+                break
+            pages += 1
+            if data_json is None:
+                # Same first page as last run, so nothing new behind it either
+                logger.info(f"{params or 'latest'} not modified since the last fetch")
+                break
+            page = self.extract_data(data_json)
+            if page.get("titles"):
+                await queue.put(page)
+            cursor = data_json.get("nextPage") if page.get("titles") else None
+            if not cursor:
+                break
+        logger.info(f"Fetched {pages} pages for {params or 'latest'}")
+        return pages
+
+    async def stream_news(self, partitions: Optional[List[Dict[str, str]]] = None
+                          ) -> AsyncIterator[Dict[str, List[str]]]:
+        """
+        Yield pages (in extract_data format) as they arrive. Partitions are paged
+        concurrently, with at most `max_in_flight` requests open at once; pages
+        within a partition are sequential because each needs the previous cursor.
+        """
+        if partitions is None:
+            partitions = parse_partitions(os.getenv("NEWS_FETCH_PARTITIONS", ""))
+        queue: "asyncio.Queue[Dict[str, List[str]]]" = asyncio.Queue(
+            maxsize=self.max_in_flight * 2)
+        pages_in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        manager = get_http_manager()
+        client = await manager.async_client()
+        producers = asyncio.gather(*(
+            self._drain_partition(client, params, pages_in_flight, queue)
+            for params in partitions
+        ))
+        try:
+            while not (producers.done() and queue.empty()):
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, producers},
+                                   return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            logger.info(f"Paginated fetch finished: {sum(producers.result())} pages")
+            manager.log_stats()
+        finally:
+            if not producers.done():
+                producers.cancel()
+                await asyncio.gather(producers, return_exceptions=True)
 
 # --- Test Function ---
 
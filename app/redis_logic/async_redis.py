@@ -2,7 +2,7 @@ import logging
 import time
 import os
 # from pathlib import Path
-from typing import Optional, Callable, Any, Coroutine
+from typing import Optional, Callable, Any, Coroutine, List, Mapping, Union
 from dotenv import load_dotenv
 import redis.asyncio as redis
 from redis.exceptions import ConnectionError, TimeoutError
@@ -62,6 +62,8 @@ class RedisClient:
         self.redis_url = redis_url
         self.client: Optional[redis.Redis] = None
         self.circuit_breaker = CircuitBreaker(cooldown=60)
+        # Set after a connection error; the next command PINGs before running
+        self._needs_check = False
 
     async def initialize(self) -> None:
         """Initialize the Redis client with connection validation."""
@@ -74,11 +76,15 @@ class RedisClient:
             raise
 
     async def ensure_client(self) -> None:
-        """Ensure the Redis client is initialized and valid."""
-        if self.client is None or not await self._check_connection():
+        """
+        Ensure the Redis client is initialized and valid. The connection is only
+        re-checked after a command has failed, not with a PING before every command.
+        """
+        if self.client is None or (self._needs_check and not await self._check_connection()):
             logger.warning(
                 "Redis client invalid or not initialized, reinitializing")
             await self.initialize()
+        self._needs_check = False
 
     async def _check_connection(self) -> bool:
         """Check if the Redis connection is healthy."""
@@ -104,20 +110,79 @@ class RedisClient:
             return result
         except self.RETRIABLE_EXCEPTIONS:
             self.circuit_breaker.record_failure()
+            self._needs_check = True
             raise
 
-    async def set(self, key: str, value: str) -> bool:
-        """Set a key-value pair in Redis."""
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+        """Set a key-value pair in Redis, optionally expiring after `ex` seconds."""
         if not self.circuit_breaker.can_execute():
             return False
         try:
-            await self.execute_command(self.client.set, key, value)
+            await self.execute_command(self.client.set, key, value, ex=ex)
             logger.info(f"Set Redis key: {key}")
             return True
         except redis.RedisError as e:
             logger.error(f"Failed to set Redis key '{key}': {e}")
             return False
 
+    async def _write_pipeline(self, mapping: Mapping[str, Union[str, bytes]], ex: Optional[int],
+                              transaction: bool) -> List[Any]:
+        async with self.client.pipeline(transaction=transaction) as pipe:
+            if ex is None:
+                pipe.mset(mapping)
+            else:
+                for key, value in mapping.items():
+                    pipe.set(key, value, ex=ex)
+            return await pipe.execute()
+
+    async def set_many(self, mapping: Mapping[str, Union[str, bytes]], ex: Optional[int] = None,
+                       transaction: bool = True) -> bool:
+        """
+        Set several keys in one round-trip: a single MSET when nothing expires,
+        otherwise one SET per key, pipelined. With `transaction` the batch runs
+        inside MULTI/EXEC, so readers see either all of the new values or none.
+        """
+        if not mapping:
+            return True
+        if not self.circuit_breaker.can_execute():
+            return False
+        try:
+            await self.execute_command(self._write_pipeline, mapping, ex, transaction)
+            logger.info(f"Set {len(mapping)} Redis keys in one pipeline")
+            return True
+        except redis.RedisError as e:
+            logger.error(f"Failed to set {len(mapping)} Redis keys: {e}")
+            return False
+
+    async def _expire_matching(self, pattern: str, seconds: int) -> int:
+        keys = [key async for key in self.client.scan_iter(match=pattern, count=500)]
+        if keys:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.expire(key, seconds)
+                await pipe.execute()
+        return len(keys)
+
+    async def expire_matching(self, pattern: str, seconds: int) -> int:
+        """Set a TTL on every key matching `pattern` (SCAN + one pipeline); returns how many."""
+        if not self.circuit_breaker.can_execute():
+            return 0
+        try:
+            return await self.execute_command(self._expire_matching, pattern, seconds)
+        except redis.RedisError as e:
+            logger.error(f"Failed to expire keys matching '{pattern}': {e}")
+            return 0
+
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish to a pub/sub channel; returns how many subscribers received it."""
+        if not self.circuit_breaker.can_execute():
+            return 0
+        try:
+            return await self.execute_command(self.client.publish, channel, message)
+        except redis.RedisError as e:
+            logger.error(f"Failed to publish to '{channel}': {e}")
+            return 0
+
     async def get(self, key: str) -> Optional[str]:
         """Get a value from Redis by key."""
         if not self.circuit_breaker.can_execute():
@@ -131,6 +196,20 @@ class RedisClient:
             logger.error(f"Failed to get Redis key '{key}': {e}")
             return None
 
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get several keys in one round-trip; missing keys come back as None."""
+        if not keys:
+            return []
+        if not self.circuit_breaker.can_execute():
+            return [None] * len(keys)
+        try:
+            values = await self.execute_command(self.client.mget, keys)
+            logger.info(f"Retrieved {len(keys)} Redis keys")
+            return values
+        except redis.RedisError as e:
+            logger.error(f"Failed to get {len(keys)} Redis keys: {e}")
+            return [None] * len(keys)
+
     async def close(self) -> None:
         """Close the Redis client connection."""
         if self.client:
@@ -0,0 +1,180 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+import redis
+from redis.client import Pipeline
+from redis.exceptions import ConnectionError, TimeoutError
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(redis.RedisError):
+    """Raised instead of calling Redis while the circuit breaker is open."""
+
+
+class PoolExhaustedError(redis.RedisError):
+    """Every pooled connection stayed busy for REDIS_POOL_TIMEOUT; Redis itself may be fine."""
+
+
+def is_pool_exhausted(error: Exception) -> bool:
+    # BlockingConnectionPool reports a wait timeout as a plain ConnectionError
+    return isinstance(error, ConnectionError) and str(error) == "No connection available."
+
+
+class CircuitBreaker:
+    """
+    closed -> open after `failure_threshold` consecutive connection failures.
+    open -> half-open once `cooldown` seconds have passed; exactly one caller
+    (the probe) is let through. A successful probe closes the breaker, a
+    failed one re-opens it for another cooldown. Every other caller is
+    turned away while open or while the probe is in flight, so a Redis blip
+    costs each worker process one probe instead of a burst of retries.
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, cooldown: int = 60, failure_threshold: int = 3):
+        self.cooldown = cooldown
+        self.failure_threshold = failure_threshold
+        self.state = self.CLOSED
+        self.failures = 0
+        self.last_failure_time = 0.0
+        self._probe_in_flight = False
+        self._probe_owner: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state != self.CLOSED
+
+    def can_execute(self) -> bool:
+        """Check if operations can proceed based on circuit breaker state."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.last_failure_time < self.cooldown:
+                    return False
+                self.state = self.HALF_OPEN
+                logger.info("Circuit breaker half-open, probing Redis")
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            self._probe_owner = threading.get_ident()
+            return True
+
+    def release_probe(self):
+        """
+        Give up this thread's probe without a verdict (e.g. it raised something
+        unrelated to Redis), so the next caller can probe instead.
+        """
+        with self._lock:
+            if self._probe_in_flight and self._probe_owner == threading.get_ident():
+                self._probe_in_flight = False
+                self._probe_owner = None
+
+    def record_failure(self):
+        """Count a connection failure; opens the breaker at the threshold or on a failed probe."""
+        with self._lock:
+            self._probe_in_flight = False
+            self._probe_owner = None
+            self.failures += 1
+            self.last_failure_time = time.monotonic()
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.error("Circuit breaker opened due to Redis failure")
+                self.state = self.OPEN
+
+    def record_success(self):
+        """Close the breaker (or keep it closed) after Redis answered."""
+        with self._lock:
+            self._probe_in_flight = False
+            self._probe_owner = None
+            self.failures = 0
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                logger.info("Circuit breaker closed after successful operation")
+
+
+def breaker_from_env() -> CircuitBreaker:
+    """Breaker configured by REDIS_BREAKER_COOLDOWN and REDIS_BREAKER_THRESHOLD."""
+    return CircuitBreaker(
+        cooldown=int(os.getenv("REDIS_BREAKER_COOLDOWN", "60")),
+        failure_threshold=int(os.getenv("REDIS_BREAKER_THRESHOLD", "3")))
+
+
+_request_breaker: Optional[CircuitBreaker] = None
+_request_breaker_lock = threading.Lock()
+
+
+def request_breaker() -> CircuitBreaker:
+    """
+    One breaker for every request-path client in the process (dashboard
+    pages, headlines, search cache): they all talk to the same Redis.
+    """
+    global _request_breaker
+    with _request_breaker_lock:
+        if _request_breaker is None:
+            _request_breaker = breaker_from_env()
+        return _request_breaker
+
+
+def guarded_call(breaker: CircuitBreaker, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run one Redis round-trip through `breaker`: CircuitOpenError while it is
+    open, connection failures counted, any answer from Redis a success.
+    """
+    if not breaker.can_execute():
+        raise CircuitOpenError("Circuit breaker is open, skipping Redis")
+    try:
+        result = func(*args, **kwargs)
+    except (ConnectionError, TimeoutError) as e:
+        if is_pool_exhausted(e):
+            raise PoolExhaustedError(str(e)) from e
+        breaker.record_failure()
+        raise
+    except redis.RedisError:
+        # Redis answered, so the connection is fine
+        breaker.record_success()
+        raise
+    else:
+        breaker.record_success()
+    finally:
+        # No-op unless this call was the half-open probe and ended without a verdict
+        breaker.release_probe()
+    return result
+
+
+class BreakerPipeline(Pipeline):
+    """Pipeline of a BreakerRedis; the whole batch is one guarded round-trip."""
+
+    circuit_breaker: CircuitBreaker
+
+    def execute(self, raise_on_error: bool = True) -> List[Any]:
+        return guarded_call(self.circuit_breaker, super().execute, raise_on_error)
+
+
+class BreakerRedis(redis.Redis):
+    """
+    redis.Redis whose commands and pipelines go through a CircuitBreaker.
+    While it is open they raise CircuitOpenError (a RedisError) without
+    touching the network, so an outage costs each process one probe per
+    cooldown instead of a failed connect per request. Pub/sub is not guarded.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.circuit_breaker = request_breaker()
+
+    def execute_command(self, *args, **options) -> Any:
+        return guarded_call(self.circuit_breaker, super().execute_command, *args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None) -> BreakerPipeline:
+        pipe = BreakerPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+        pipe.circuit_breaker = self.circuit_breaker
+        return pipe
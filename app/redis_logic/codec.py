@@ -0,0 +1,262 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Optional speedups; json and zlib from the stdlib are always available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+# Every encoded value starts with MAGIC, a format version, then one byte each
+# for the serializer and the compression. 0xFF never starts UTF-8 text, so
+# anything else is a plain JSON string written before this codec existed.
+MAGIC = b"\xffNC"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+SERIALIZERS = {"json": 1, "orjson": 2, "msgpack": 3}
+COMPRESSIONS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+# Needs nothing outside the stdlib, so every process can read what it writes
+DEFAULT_CODEC = "json+zlib"
+# pip package behind each optional name
+PACKAGES = {"orjson": "orjson", "msgpack": "msgpack", "zstd": "zstandard", "lz4": "lz4"}
+
+_local = threading.local()
+
+
+# --- Serializers ---
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _msgpack_dumps(obj: Any) -> bytes:
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+# orjson writes the same bytes json would, so either decodes both ids
+_DUMPS: Dict[int, Callable[[Any], bytes]] = {1: _json_dumps, 2: _json_dumps, 3: _msgpack_dumps}
+_LOADS: Dict[int, Callable[[bytes], Any]] = {1: _json_loads, 2: _json_loads, 3: _msgpack_loads}
+
+
+# --- Compression ---
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    # zstandard contexts are not thread-safe; keep one per thread and level
+    compressors = _local.__dict__.setdefault("zstd_compressors", {})
+    if level not in compressors:
+        compressors[level] = zstandard.ZstdCompressor(level=level)
+    return compressors[level].compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    if not hasattr(_local, "zstd_decompressor"):
+        _local.zstd_decompressor = zstandard.ZstdDecompressor()
+    return _local.zstd_decompressor.decompress(data)
+
+
+_COMPRESS: Dict[int, Callable[[bytes, int], bytes]] = {
+    0: lambda data, level: data,
+    1: lambda data, level: zlib.compress(data, level),
+    2: _zstd_compress,
+    3: lambda data, level: lz4_frame.compress(data, compression_level=level),
+}
+_DECOMPRESS: Dict[int, Callable[[bytes], bytes]] = {
+    0: lambda data: data,
+    1: zlib.decompress,
+    2: _zstd_decompress,
+    3: lambda data: lz4_frame.decompress(data),
+}
+DEFAULT_LEVELS = {"none": 0, "zlib": 6, "zstd": 3, "lz4": 0}
+
+
+def available(name: str) -> bool:
+    """Whether the library behind a serializer or compression name is installed."""
+    return {"orjson": orjson, "msgpack": msgpack,
+            "zstd": zstandard, "lz4": lz4_frame}.get(name, True) is not None
+
+
+class Codec:
+    """
+    Encodes cache payloads to bytes as header + serialized body, compressed
+    when the body is at least `min_size` bytes. decode() reads the header, so
+    it handles values written with any settings, and legacy JSON strings.
+    """
+
+    def __init__(self, serializer: str = "json", compression: str = "none",
+                 level: Optional[int] = None, min_size: int = 256):
+        if serializer not in SERIALIZERS or compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown codec '{serializer}+{compression}'")
+        if not available(serializer) or not available(compression):
+            raise ValueError(f"Codec '{serializer}+{compression}' needs a library that isn't installed")
+        self.serializer = serializer
+        self.compression = compression
+        self.level = DEFAULT_LEVELS[compression] if level is None else level
+        self.min_size = min_size
+
+    @property
+    def name(self) -> str:
+        return f"{self.serializer}+{self.compression}"
+
+    def encode(self, obj: Any) -> bytes:
+        serializer_id = SERIALIZERS[self.serializer]
+        body = _DUMPS[serializer_id](obj)
+        compression_id = COMPRESSIONS[self.compression]
+        if len(body) < self.min_size:
+            compression_id = 0
+        body = _COMPRESS[compression_id](body, self.level)
+        return MAGIC + bytes((FORMAT_VERSION, serializer_id, compression_id)) + body
+
+    @staticmethod
+    def decode(raw: Union[bytes, str]) -> Any:
+        if isinstance(raw, str) or not raw.startswith(MAGIC):
+            return json.loads(raw)
+        version, serializer_id, compression_id = raw[len(MAGIC):HEADER_SIZE]
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported payload format version {version}")
+        if serializer_id not in _LOADS or compression_id not in _DECOMPRESS:
+            raise ValueError(f"Unknown payload codec ids {serializer_id}/{compression_id}")
+        # orjson payloads are plain JSON, which the stdlib reads too
+        for name, used in (("msgpack", serializer_id == 3), ("zstd", compression_id == 2),
+                            ("lz4", compression_id == 3)):
+            if used and not available(name):
+                raise ValueError(f"Payload was encoded with {name}, which isn't installed "
+                                 f"in this process (pip install {PACKAGES[name]})")
+        return _LOADS[serializer_id](_DECOMPRESS[compression_id](raw[HEADER_SIZE:]))
+
+
+def parse_codec(spec: str) -> Codec:
+    """
+    Codec from a spec like "msgpack+zstd", "orjson+lz4" or "json". "auto" picks
+    the best installed serializer (orjson, msgpack, json) and compression
+    (zstd, lz4, zlib); on dashboard payloads orjson beats msgpack on both size
+    after compression and decode time. Only use "auto" (or a non-stdlib
+    compression) once every process that reads the payloads has the libraries.
+    """
+    spec = spec.strip().lower()
+    if spec == "auto":
+        serializer = next(name for name in ("orjson", "msgpack", "json") if available(name))
+        compression = next(name for name in ("zstd", "lz4", "zlib") if available(name))
+        return Codec(serializer, compression)
+    serializer, _, compression = spec.partition("+")
+    return Codec(serializer, compression or "none")
+
+
+_codec: Optional[Codec] = None
+_codec_lock = threading.Lock()
+
+
+def get_codec() -> Codec:
+    """Process-wide codec for summary payloads, from REDIS_CODEC (default DEFAULT_CODEC)."""
+    global _codec
+    with _codec_lock:
+        if _codec is None:
+            _codec = parse_codec(os.getenv("REDIS_CODEC", DEFAULT_CODEC))
+            level = os.getenv("REDIS_CODEC_LEVEL")
+            if level:
+                _codec.level = int(level)
+            logger.info(f"Redis payload codec: {_codec.name} (level {_codec.level})")
+        return _codec
+
+
+def encode_payload(obj: Any) -> bytes:
+    return get_codec().encode(obj)
+
+
+def decode_payload(raw: Union[bytes, str]) -> Any:
+    return Codec.decode(raw)
+
+
+# --- Benchmark ---
+
+
+def sample_summary(days: int = 30, sources: int = 10, seed: int = 0) -> Dict[str, Any]:
+    """A summary payload shaped like get_summary_payloads() output for `days` days."""
+    rng = random.Random(seed)
+    start = datetime(2025, 6, 1)
+    return {
+        "line_graph": {
+            (start + timedelta(days=day)).strftime("%Y-%m-%d %H:%M:%S"): round(rng.uniform(-1, 1), 5)
+            for day in range(days)
+        },
+        "pie_chart": {"good": rng.randint(100, 900), "okay": rng.randint(100, 900),
+                      "bad": rng.randint(100, 900)},
+        "top_sources": [
+            {"source": f"source_{i}_{rng.randint(0, 10**6)}", "article_count": rng.randint(5, 200),
+             "avg_sentiment": round(rng.uniform(-1, 1), 4)}
+            for i in range(sources)
+        ],
+    }
+
+
+def benchmark(payloads: List[Any], codecs: List[Codec], repeat: int = 50) -> List[Tuple[str, int, float, float]]:
+    """(codec name, total bytes, encode ms, decode ms) for one pass over `payloads`."""
+    results = []
+    for codec in codecs:
+        encoded = [codec.encode(payload) for payload in payloads]
+        assert [codec.decode(raw) for raw in encoded] == payloads
+        start = time.perf_counter()
+        for _ in range(repeat):
+            encoded = [codec.encode(payload) for payload in payloads]
+        encode_ms = (time.perf_counter() - start) / repeat * 1000
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for raw in encoded:
+                codec.decode(raw)
+        decode_ms = (time.perf_counter() - start) / repeat * 1000
+        results.append((codec.name, sum(len(raw) for raw in encoded), encode_ms, decode_ms))
+    return results
+
+if __name__ == "__main__":
+    from app.figures import build_dashboard_figures
+
+    # One refresh's worth: 10 summaries (monthly and weekly x 5 categories) and their figures
+    summaries = [sample_summary(days=30 if i < 5 else 7, seed=i) for i in range(10)]
+    figures = [build_dashboard_figures(summary) for summary in summaries]
+    candidates = [Codec(serializer, compression)
+                  for serializer in ("json", "orjson", "msgpack")
+                  for compression in ("none", "zlib", "lz4", "zstd")
+                  if available(serializer) and available(compression)]
+    for label, payloads in (("summaries", summaries), ("figures", figures)):
+        # Baseline: what json.dumps stored before this codec
+        baseline = sum(len(json.dumps(payload).encode("utf-8")) for payload in payloads)
+        print(f"\n{label}: {len(payloads)} payloads, json.dumps baseline {baseline / 1024:.1f} KB")
+        print(f"{'codec':<16}{'bytes':>10}{'saved':>8}{'encode ms':>11}{'decode ms':>11}")
+        for name, size, encode_ms, decode_ms in benchmark(payloads, candidates):
+            print(f"{name:<16}{size:>10}{1 - size / baseline:>8.0%}{encode_ms:>11.3f}{decode_ms:>11.3f}")
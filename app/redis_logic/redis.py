@@ -1,4 +1,5 @@
 import logging
+import threading
 import time
 import os
 from pathlib import Path
@@ -8,6 +9,9 @@ import redis
 from redis.exceptions import ConnectionError, TimeoutError
 from tenacity import retry, wait_exponential, stop_after_attempt, before_log, after_log, retry_if_exception_type
 
+from app.redis_logic.breaker import (CircuitBreaker, CircuitOpenError,  # noqa: F401
+                                     PoolExhaustedError, breaker_from_env, is_pool_exhausted)
+
 # --- Configure Logging ---
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -27,33 +31,9 @@ if not REDIS_URL:
 
 logger.info(f"REDIS_URL loaded: {REDIS_URL}")
 
-# --- Circuit Breaker Class ---
-
-
-class CircuitBreaker:
-    def __init__(self, cooldown: int = 60):
-        self.is_open = False
-        self.last_failure_time = 0
-        self.cooldown = cooldown
-
-    def can_execute(self) -> bool:
-        """Check if operations can proceed based on circuit breaker state."""
-        if self.is_open and (time.time() - self.last_failure_time) < self.cooldown:
-            logger.warning("Circuit breaker is open, skipping operation")
-            return False
-        return True
-
-    def record_failure(self):
-        """Mark the circuit breaker as open after a failure."""
-        self.is_open = True
-        self.last_failure_time = time.time()
-        logger.error("Circuit breaker opened due to Redis failure")
-
-    def record_success(self):
-        """Mark the circuit breaker as closed after a successful operation."""
-        if self.is_open:
-            self.is_open = False
-            logger.info("Circuit breaker closed after successful operation")
+# --- Circuit Breaker ---
+# Lives in app.redis_logic.breaker, which request-path clients import
+# without this module's REDIS_URL check.
 
 # --- Redis Client Wrapper ---
 
@@ -61,16 +41,35 @@ class CircuitBreaker:
 class RedisClient:
     RETRIABLE_EXCEPTIONS = (ConnectionError, TimeoutError)
 
-    def __init__(self):
+    def __init__(self, decode_responses: bool = True):
         self.redis_url = REDIS_URL
+        # False for readers of binary payloads (see app.redis_logic.codec)
+        self.decode_responses = decode_responses
         self.client: Optional[redis.Redis] = None
-        self.circuit_breaker = CircuitBreaker(cooldown=60)
+        self.circuit_breaker = breaker_from_env()
+        # Set after a connection error; the next command PINGs before running
+        self._needs_check = False
+        self._client_lock = threading.Lock()
+
+    def _build_pool(self) -> redis.BlockingConnectionPool:
+        """
+        Bounded pool shared by every thread in the process: callers wait up to
+        REDIS_POOL_TIMEOUT for a free connection instead of opening more.
+        """
+        return redis.BlockingConnectionPool.from_url(
+            self.redis_url,
+            decode_responses=self.decode_responses,
+            max_connections=int(os.getenv("REDIS_POOL_SIZE", "20")),
+            timeout=float(os.getenv("REDIS_POOL_TIMEOUT", "5")),
+            socket_connect_timeout=float(os.getenv("REDIS_CONNECT_TIMEOUT", "2")),
+            socket_timeout=float(os.getenv("REDIS_SOCKET_TIMEOUT", "5")),
+            socket_keepalive=True,
+            health_check_interval=30)
 
     def initialize(self) -> None:
         """Initialize the Redis client with connection validation."""
         try:
-            self.client = redis.Redis.from_url(
-                self.redis_url, decode_responses=True)
+            self.client = redis.Redis(connection_pool=self._build_pool())
             self.client.ping()
             logger.info("Successfully connected to Redis")
         except (ConnectionError, TimeoutError) as e:
@@ -78,18 +77,18 @@ class RedisClient:
             raise
 
     def ensure_client(self) -> None:
-        """Ensure the Redis client is initialized and valid."""
-        if self.client is None or not self._check_connection():
-            logger.warning(
-                "Redis client invalid or not initialized, reinitializing")
-            self.initialize()
-
-    def _check_connection(self) -> bool:
-        """Check if the Redis connection is healthy."""
-        try:
-            return self.client.ping()
-        except (ConnectionError, TimeoutError):
-            return False
+        """
+        Ensure the Redis client is initialized and valid. The connection is only
+        re-checked (a PING, raising on failure) after a command has failed, not
+        before every command. The pool is built once and never torn down here,
+        since other threads hold its connections; it reconnects on its own.
+        """
+        with self._client_lock:
+            if self.client is None:
+                self.initialize()
+            elif self._needs_check:
+                self.client.ping()
+            self._needs_check = False
 
     @retry(
         wait=wait_exponential(multiplier=1, min=1, max=10),
@@ -100,22 +99,41 @@ class RedisClient:
         reraise=True
     )
     def execute_command(self, command_func: Callable[..., Any], *args, **kwargs) -> Any:
-        """Execute a Redis command with retry logic."""
-        self.ensure_client()
+        """
+        Execute a Redis command with retry logic. Every attempt, retries
+        included, asks the breaker first; once it opens, retrying stops with
+        CircuitOpenError.
+        """
+        if not self.circuit_breaker.can_execute():
+            raise CircuitOpenError("Circuit breaker is open, skipping operation")
         try:
-            result = command_func(*args, **kwargs)
-            self.circuit_breaker.record_success()
-            return result
-        except self.RETRIABLE_EXCEPTIONS:
+            self.ensure_client()
+            result = command_func(self.client, *args, **kwargs)
+        except self.RETRIABLE_EXCEPTIONS as e:
+            if is_pool_exhausted(e):
+                # Our own threads hold every connection: not an outage, and not retried
+                raise PoolExhaustedError(str(e)) from e
             self.circuit_breaker.record_failure()
+            self._needs_check = True
+            if self.circuit_breaker.is_open:
+                # Not retriable: waiting out the backoff would only hit the open breaker
+                raise CircuitOpenError(f"Circuit breaker opened: {e}") from e
             raise
+        except redis.RedisError:
+            # Redis answered (e.g. a WRONGTYPE error), so the connection is fine
+            self.circuit_breaker.record_success()
+            raise
+        else:
+            self.circuit_breaker.record_success()
+        finally:
+            # No-op unless this call was the half-open probe and ended without a verdict
+            self.circuit_breaker.release_probe()
+        return result
 
     def set(self, key: str, value: str) -> bool:
         """Set a key-value pair in Redis."""
-        if not self.circuit_breaker.can_execute():
-            return False
         try:
-            self.execute_command(self.client.set, key, value)
+            self.execute_command(redis.Redis.set, key, value)
             logger.info(f"Set Redis key: {key}")
             return True
         except redis.RedisError as e:
@@ -124,10 +142,8 @@ class RedisClient:
 
     def get(self, key: str) -> Optional[str]:
         """Get a value from Redis by key."""
-        if not self.circuit_breaker.can_execute():
-            return None
         try:
-            value = self.execute_command(self.client.get, key)
+            value = self.execute_command(redis.Redis.get, key)
             logger.info(
                 f"Retrieved Redis key '{key}'")
             return value
@@ -140,6 +156,7 @@ class RedisClient:
         if self.client:
             try:
                 self.client.close()
+                self.client.connection_pool.disconnect()
                 logger.info("Redis client connection closed")
             except Exception as e:
                 logger.error(f"Error closing Redis client: {e}")
@@ -170,7 +187,7 @@ def main_test():
         try:
             redis_client.client.connection_pool.disconnect()
             redis_client.execute_command(
-                redis_client.client.set, "error_test_key", "error_test_value")
+                redis.Redis.set, "error_test_key", "error_test_value")
         except redis.RedisError as e:
             logger.info(f"Test error handling caught: {e}")
 
@@ -5,7 +5,7 @@ from sqlalchemy import delete
 from sqlalchemy.exc import OperationalError, TimeoutError, StatementError
 from tenacity import retry, wait_exponential, stop_after_attempt, before_log, after_log, retry_if_exception_type
 from app.db_logic.db import engine
-from app.db_logic.models import NewsArticle
+from app.db_logic.models import NewsArticle, NewsDailyRollup
 
 # --- Configure Logging ---
 logging.basicConfig(level=logging.INFO,
@@ -27,6 +27,7 @@ RETRIABLE_DB_EXCEPTIONS = (OperationalError, TimeoutError, StatementError)
 async def delete_old_news_articles():
     """
     Deletes all news articles older than 30 days from the database with retry logic.
+    Rollup rows are dropped by whole days, matching how the dashboard reads them.
 
     Uses exponential backoff for transient database errors (e.g., connection issues, timeouts).
     Logs success or failure for debugging.
@@ -38,6 +39,10 @@ async def delete_old_news_articles():
             result = await session.execute(
                 delete(NewsArticle).where(NewsArticle.pubDate < cutoff)
             )
+            await session.execute(
+                delete(NewsDailyRollup).where(
+                    NewsDailyRollup.day < cutoff.date())
+            )
             await session.commit()
             deleted_count = result.rowcount
             logger.info(
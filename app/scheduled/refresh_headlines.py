@@ -0,0 +1,64 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.feed_cache import get_feed_fetcher
+from app.get_custom_data import feed_headlines
+from app.headline_cache import (COUNTRY_CODES, HEADLINE_CATEGORIES, HEADLINE_TTL,
+                                headline_feed_url, headline_key)
+from app.redis_logic.async_redis import RedisClient
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+async def fetch_headlines(country: str, category: str,
+                          limiter: asyncio.Semaphore) -> Optional[List[Dict[str, str]]]:
+    """Download and parse one feed; None on any failure so the old entry stays cached."""
+    url = headline_feed_url(country, category)
+    try:
+        async with limiter:
+            feed = await get_feed_fetcher().afetch(url)
+        return feed_headlines(feed, url) or None
+    except Exception as e:
+        logger.warning(f"Headline refresh failed for {country}/{category}: {e}")
+        return None
+
+
+async def refresh_all_headlines() -> int:
+    """Refresh every COUNTRY_CODES x HEADLINE_CATEGORIES feed concurrently; returns feeds stored."""
+    started = time.monotonic()
+    limiter = asyncio.Semaphore(int(os.getenv("HEADLINE_REFRESH_CONCURRENCY", "10")))
+    feeds: List[Tuple[str, str]] = [(country, category)
+                                    for country in COUNTRY_CODES
+                                    for category in HEADLINE_CATEGORIES]
+    results = await asyncio.gather(*(
+        fetch_headlines(country, category, limiter) for country, category in feeds
+    ))
+
+    # Failed feeds are left out so their previous entry stays cached
+    values = {headline_key(country, category): json.dumps(headlines)
+              for (country, category), headlines in zip(feeds, results)
+              if headlines is not None}
+
+    client = RedisClient(os.getenv("REDIS_URL"))
+    await client.initialize()
+    try:
+        # Independent keys, so a plain pipeline without MULTI/EXEC
+        stored = len(values) if await client.set_many(
+            values, ex=HEADLINE_TTL, transaction=False) else 0
+    finally:
+        await client.close()
+
+    logger.info(f"Refreshed {stored} of {len(feeds)} headline feeds "
+                f"in {time.monotonic() - started:.2f}s")
+    get_feed_fetcher().log_stats()
+    return stored
+
+if __name__ == "__main__":
+    asyncio.run(refresh_all_headlines())
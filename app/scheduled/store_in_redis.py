@@ -2,27 +2,36 @@ import redis.asyncio as redis
 from dotenv import load_dotenv
 import os
 import json
-from app.data_extraction.line_graph_data import get_daily_avg_sentiment
-from app.data_extraction.pie_chart_data import get_sentiment_pie_data
-from app.data_extraction.top_sources import get_top_sources_with_avg_sentiment
+import asyncio
+from typing import Any, Dict
+from app.data_extraction.summary_aggregation import get_summary_payloads
 from app.data_extraction.top_news import get_news_headlines  # optional if implemented
 from app.redis_logic.async_redis import RedisClient
+from app.figures import build_all_figures
+from app.redis_logic.codec import encode_payload
+from app.summary_snapshot import publish_snapshot
 
 load_dotenv('.env')
 
+# Redis keys are built as f"{period}_{category}", e.g. "weekly_sci_tech"
+SUMMARY_PERIODS = {"monthly": 30, "weekly": 7}
+SUMMARY_CATEGORIES = {
+    "summary": None,
+    "business": "Business",
+    "sports": "Sports",
+    "sci_tech": "Sci/Tech",
+    "world": "World",
+}
 
-async def store_summary_period(client: RedisClient, label: str, days: int, category: str | None = None):
+
+def encode_snapshot(payloads: Dict[str, Dict[str, Any]]) -> Dict[str, bytes]:
     """
-    Helper to store summary for a given period (week/month) and optional category
-    under Redis key: sentiment:{label}
+    Summaries plus their dashboard figures, rendered once here so callbacks
+    only read them back, encoded with the configured payload codec.
     """
-    key = label
-    data = {
-        "line_graph": await get_daily_avg_sentiment(days=days, category=category),
-        "pie_chart": await get_sentiment_pie_data(days=days, category=category),
-        "top_sources": await get_top_sources_with_avg_sentiment(days=days, category=category),
-    }
-    await client.set(key, json.dumps(data))
+    values = dict(payloads)
+    values.update(build_all_figures(payloads))
+    return {key: encode_payload(data) for key, data in values.items()}
 
 
 async def store_data_in_redis():
@@ -30,19 +39,14 @@ async def store_data_in_redis():
     client = RedisClient(REDIS_URL)
     await client.initialize()
 
-    # Monthly summaries
-    await store_summary_period(client, "monthly_summary", days=30)
-    await store_summary_period(client, "monthly_business", days=30, category="Business")
-    await store_summary_period(client, "monthly_sports", days=30, category="Sports")
-    await store_summary_period(client, "monthly_sci_tech", days=30, category="Sci/Tech")
-    await store_summary_period(client, "monthly_world", days=30, category="World")
+    # Every period x category summary comes from one read of the news_daily_rollup table
+    payloads = await get_summary_payloads(SUMMARY_PERIODS, SUMMARY_CATEGORIES)
+
+    # Rendering and compressing are CPU-bound; keep them off the event loop
+    values = await asyncio.to_thread(encode_snapshot, payloads)
 
-    # Weekly summaries
-    await store_summary_period(client, "weekly_summary", days=7)
-    await store_summary_period(client, "weekly_business", days=7, category="Business")
-    await store_summary_period(client, "weekly_sports", days=7, category="Sports")
-    await store_summary_period(client, "weekly_sci_tech", days=7, category="Sci/Tech")
-    await store_summary_period(client, "weekly_world", days=7, category="World")
+    # Readers keep the previous snapshot until every summary and figure is written
+    await publish_snapshot(client, values)
 
     # Headline news (optional if implemented)
     # headlines = {
@@ -57,7 +61,6 @@ async def store_data_in_redis():
 
 # To run directly
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(store_data_in_redis())
 
     # async def test():
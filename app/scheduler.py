@@ -3,9 +3,15 @@ import asyncio
 # import json
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 # from datetime import datetime, timedelta
+from datetime import datetime
 # import pytz  # For timezone-aware scheduling
 
 from app.scheduled.delete_old_news import delete_old_news_articles
+from app.scheduled.refresh_headlines import refresh_all_headlines
+from app.headline_cache import HEADLINE_REFRESH_MINUTES
+from app.http_client import close_http_clients
+from app.models.prediction_cache import close_prediction_cache
+from app.models.worker_pool import shutdown_nlp_pool
 from .store_in_db import NewsProcessor
 
 # --- Configuration ---
@@ -62,20 +68,40 @@ async def main():
     )
     print("Scheduled job: 'My Every 4 Hour Task' every 4 hours.")
 
+    # Job 3: Keep every country x category headline feed warm in Redis so the
+    # dashboard callbacks only read the cache. Runs once at startup as well.
+    scheduler.add_job(
+        refresh_all_headlines,
+        trigger='interval',
+        minutes=HEADLINE_REFRESH_MINUTES,
+        next_run_time=datetime.now(scheduler.timezone),
+        id='refresh_headlines',
+        name='Refresh Headline Cache',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    print(f"Scheduled job: 'Refresh Headline Cache' every {HEADLINE_REFRESH_MINUTES} minutes.")
+
     # Start the scheduler
     scheduler.start()
     print("APScheduler started.")
 
     # Keep the asyncio event loop running indefinitely
     # The scheduler runs in the background within this loop.
-    # try:
-    #     # This prevents the script from exiting immediately
-    #     while True:
-    #         # Sleep for an hour, then re-check (scheduler runs in background)
-    #         await asyncio.sleep(3600)
-    # except (SystemExit, KeyboardInterrupt):
-    #     print("Scheduler stopped.")
-    #     scheduler.shutdown()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await shutdown(scheduler)
+
+
+async def shutdown(scheduler: AsyncIOScheduler):
+    """Stop the jobs, then release the shared clients and the NLP worker processes."""
+    scheduler.shutdown(wait=False)
+    await close_prediction_cache()
+    await close_http_clients()
+    shutdown_nlp_pool()
+    print("Scheduler stopped.")
 
 if __name__ == "__main__":
     # Ensure a proper asyncio event loop is running
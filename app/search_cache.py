@@ -0,0 +1,205 @@
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import redis
+from redis import Redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from app.get_custom_data import get_data
+from app.redis_logic.breaker import BreakerRedis
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SearchResult = Tuple[List[str], List[float], List[int], List[Dict[str, str]]]
+
+# Delete the lock only if we still own it, so a slow holder can't release someone else's
+_RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(str(query).casefold().split())
+
+
+class SearchCache:
+    """
+    Redis cache for custom-search results, shared by every gunicorn worker.
+
+    Entries are fresh for `ttl` seconds. After that, queries searched at least
+    `popular_hits` times in the last hour are served stale for up to
+    `stale_ttl` more seconds while one worker refreshes them in the
+    background; other queries are recomputed.
+
+    A miss is computed by whichever caller takes the per-query lock
+    (SET NX); identical concurrent searches poll for its result instead of
+    calling newsdata.io themselves, and only compute on their own if the
+    holder doesn't finish within `wait_timeout`. The result is written before
+    the lock is released. Searches that found no articles (no matches, or the
+    API failed) are cached too, for `negative_ttl` seconds and never stale.
+    """
+
+    def __init__(self, client: Redis, compute: Callable[[str], SearchResult] = get_data,
+                 ttl: int = 600, stale_ttl: int = 3600, popular_hits: int = 3,
+                 lock_ttl: int = 20, wait_timeout: float = 12.0,
+                 negative_ttl: int = 60, namespace: str = "search:v1"):
+        self.client = client
+        self.compute = compute
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.popular_hits = popular_hits
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.negative_ttl = negative_ttl
+        self.namespace = namespace
+        self._release = client.register_script(_RELEASE_LOCK)
+        self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-refresh")
+
+    def _keys(self, query: str) -> Tuple[str, str, str]:
+        digest = hashlib.sha1(normalize_query(query).encode("utf-8")).hexdigest()
+        return (f"{self.namespace}:result:{digest}",
+                f"{self.namespace}:lock:{digest}",
+                f"{self.namespace}:hits:{digest}")
+
+    # --- Redis helpers ---
+
+    def _read(self, result_key: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(result_key)
+        return json.loads(raw) if raw else None
+
+    def _fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry["created"] < entry.get("ttl", self.ttl)
+
+    def _store(self, result_key: str, result: SearchResult) -> None:
+        entry = {"created": time.time(), "data": list(result)}
+        if result[0]:
+            expires = self.ttl + self.stale_ttl
+        else:
+            # No articles: briefly remember it, so repeats don't all call newsdata.io
+            # again, without pinning what may be an API failure for the full TTL
+            entry["ttl"] = expires = self.negative_ttl
+        try:
+            self.client.set(result_key, json.dumps(entry), ex=expires)
+        except redis.RedisError as e:
+            logger.error(f"Failed to cache search result: {e}")
+
+    def _acquire(self, lock_key: str) -> Optional[str]:
+        token = uuid.uuid4().hex
+        return token if self.client.set(lock_key, token, nx=True, ex=self.lock_ttl) else None
+
+    def _compute_and_store(self, query: str, result_key: str, lock_key: str,
+                           token: str) -> SearchResult:
+        try:
+            result = self.compute(query)
+            # Before releasing: waiters stop polling once the lock is gone
+            self._store(result_key, result)
+        finally:
+            try:
+                self._release(keys=[lock_key], args=[token])
+            except redis.RedisError as e:
+                logger.warning(f"Could not release search lock (expires on its own): {e}")
+        return result
+
+    def _refresh(self, query: str, result_key: str, lock_key: str, token: str) -> None:
+        try:
+            self._compute_and_store(query, result_key, lock_key, token)
+            logger.info(f"Revalidated cached search '{normalize_query(query)}'")
+        except Exception as e:
+            logger.error(f"Background refresh of '{normalize_query(query)}' failed: {e}")
+
+    # --- Public API ---
+
+    def get(self, query: str) -> SearchResult:
+        result_key, lock_key, hits_key = self._keys(query)
+
+        pipe = self.client.pipeline()
+        pipe.get(result_key)
+        pipe.incr(hits_key)
+        pipe.expire(hits_key, 3600)
+        raw, hits, _ = pipe.execute()
+        entry = json.loads(raw) if raw else None
+
+        if entry is not None:
+            age = time.time() - entry["created"]
+            if self._fresh(entry):
+                logger.info(f"Search cache hit for '{normalize_query(query)}'")
+                return tuple(entry["data"])
+            if hits >= self.popular_hits and "ttl" not in entry:
+                # Stale-while-revalidate: answer now, refresh once in the background
+                token = self._acquire(lock_key)
+                if token:
+                    self._refresher.submit(self._refresh, query, result_key, lock_key, token)
+                logger.info(f"Serving stale search for popular query '{normalize_query(query)}' "
+                            f"({age:.0f}s old)")
+                return tuple(entry["data"])
+
+        token = self._acquire(lock_key)
+        if token:
+            return self._compute_and_store(query, result_key, lock_key, token)
+
+        # Another worker is computing this query; wait for its result
+        deadline = time.monotonic() + self.wait_timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+            entry = self._read(result_key)
+            if entry is not None and self._fresh(entry):
+                logger.info(f"Joined in-flight search for '{normalize_query(query)}'")
+                return tuple(entry["data"])
+            if not self.client.exists(lock_key):
+                break
+        logger.warning(f"No shared result for '{normalize_query(query)}', computing locally")
+        return self.compute(query)
+
+
+_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """Process-wide cache, or None when REDIS_URL is not configured."""
+    global _cache
+    redis_url = os.getenv("REDIS_URL")
+    if _cache is None and redis_url:
+        deadline = float(os.getenv("CUSTOM_SEARCH_DEADLINE", "8"))
+        # Request path: short timeouts, no retries and the shared request breaker, like
+        # app.dashboard_cache.get_page_client, so an outage falls through to get_data at once
+        timeout = float(os.getenv("PAGE_REDIS_TIMEOUT", "0.5"))
+        _cache = SearchCache(
+            BreakerRedis.from_url(redis_url, decode_responses=True,
+                           socket_connect_timeout=timeout, socket_timeout=timeout,
+                           retry=Retry(NoBackoff(), 0)),
+            ttl=int(os.getenv("SEARCH_CACHE_TTL", "600")),
+            stale_ttl=int(os.getenv("SEARCH_CACHE_STALE_TTL", "3600")),
+            popular_hits=int(os.getenv("SEARCH_CACHE_POPULAR_HITS", "3")),
+            # The lock must outlive one get_data call, which is bounded by the search deadline
+            lock_ttl=int(deadline) + 10,
+            wait_timeout=deadline + 4,
+            negative_ttl=int(os.getenv("SEARCH_CACHE_NEGATIVE_TTL", "60")),
+        )
+    return _cache
+
+
+def cached_get_data(query: str) -> SearchResult:
+    """`get_data` behind the shared search cache; calls it directly if Redis is unavailable."""
+    cache = get_search_cache()
+    if cache is None:
+        return get_data(query)
+    try:
+        return cache.get(query)
+    except redis.RedisError as e:
+        logger.error(f"Search cache unavailable, searching directly: {e}")
+        return get_data(query)
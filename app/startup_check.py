@@ -0,0 +1,87 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+from typing import Any, Dict
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Worker boot (import) and first page render, measured with every connect refused
+IMPORT_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "5.0"))
+LAYOUT_BUDGET_SECONDS = float(os.getenv("LAYOUT_BUDGET_SECONDS", "1.5"))
+
+# Runs in a fresh interpreter so module caches and warm imports don't flatter the numbers
+_CHILD = r'''
+import importlib, json, socket, sys, time
+
+attempts = []
+
+def _offline(*args, **kwargs):
+    attempts.append(str(args[1] if len(args) > 1 else args[0] if args else kwargs))
+    raise OSError("network unavailable (startup check)")
+
+socket.socket.connect = _offline
+socket.socket.connect_ex = _offline
+socket.create_connection = _offline
+socket.getaddrinfo = _offline
+
+started = time.perf_counter()
+module = importlib.import_module(sys.argv[1])
+import_seconds = time.perf_counter() - started
+import_attempts = list(attempts)
+
+started = time.perf_counter()
+module.serve_layout()
+layout_seconds = time.perf_counter() - started
+
+print(json.dumps({
+    "import_seconds": import_seconds,
+    "import_connects": import_attempts,
+    "layout_seconds": layout_seconds,
+    "layout_connects": len(attempts) - len(import_attempts),
+}))
+'''
+
+
+def measure_startup(module: str = "app.linux_main") -> Dict[str, Any]:
+    """Import `module` and call its serve_layout() offline; returns the timings."""
+    env = dict(os.environ)
+    # Anything that does try to connect must get as far as a socket call
+    env.setdefault("REDIS_URL", "redis://127.0.0.1:6379/0")
+    env.setdefault("NEWS_API_KEY", "startup-check")
+    result = subprocess.run([sys.executable, "-c", _CHILD, module],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def check_startup(module: str = "app.linux_main") -> bool:
+    """Logs the measurements and whether they are within budget."""
+    stats = measure_startup(module)
+    ok = True
+    if stats["import_connects"]:
+        logger.error(f"{module} connects at import time: {stats['import_connects']}")
+        ok = False
+    if stats["import_seconds"] > IMPORT_BUDGET_SECONDS:
+        logger.error(f"{module} imported in {stats['import_seconds']:.2f}s, "
+                     f"budget {IMPORT_BUDGET_SECONDS:.2f}s")
+        ok = False
+    if stats["layout_seconds"] > LAYOUT_BUDGET_SECONDS:
+        logger.error(f"{module} first layout took {stats['layout_seconds']:.2f}s, "
+                     f"budget {LAYOUT_BUDGET_SECONDS:.2f}s")
+        ok = False
+    logger.info(f"{module}: import {stats['import_seconds']:.2f}s "
+                f"({len(stats['import_connects'])} connects), "
+                f"first layout {stats['layout_seconds']:.2f}s "
+                f"({stats['layout_connects']} connects) - {'OK' if ok else 'OVER BUDGET'}")
+    return ok
+
+if __name__ == "__main__":
+    modules = sys.argv[1:] or ["app.linux_main", "app.main"]
+    results = [check_startup(module) for module in modules]
+    sys.exit(0 if all(results) else 1)
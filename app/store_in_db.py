@@ -2,18 +2,23 @@ import logging
 import re
 import asyncio
 from datetime import datetime
-from typing import Optional, List, Dict, Callable, Any
+from functools import partial
+from typing import Optional, List, Dict, Callable, Any, AsyncIterator
 from pathlib import Path
 from dotenv import load_dotenv
 import os
 from sqlalchemy.exc import OperationalError, IntegrityError, StatementError, TimeoutError
 from tenacity import retry, wait_exponential, stop_after_attempt, before_log, after_log, retry_if_exception_type
-from app.models.sentiment import analyze_sentiment
-from app.models.news_classifier import classify_articles
-from app.db_logic.models import NewsArticle, create_tables
+from app.models.prediction_cache import close_prediction_cache, get_prediction_cache, predict_with_cache
+from app.models.worker_pool import shutdown_nlp_pool
+from app.db_logic.models import NewsArticle, NewsDailyRollup, article_dedup_key, sentiment_bucket
+from app.db_logic.migrations import migrate
 from app.db_logic.db import AsyncSessionLocal
 from app.newsapi_fetcher import NewsFetcher
+from app.http_client import close_http_clients
+from app.ingest_pipeline import IngestPipeline, PreparedArticle
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 # --- Configure Logging ---
 logging.basicConfig(level=logging.INFO,
@@ -51,6 +56,10 @@ def is_valid_url(url: str) -> bool:
 # --- Retry Logic for Async Database Operations ---
 RETRIABLE_DB_EXCEPTIONS = (OperationalError, TimeoutError, StatementError)
 
+# asyncpg caps a statement at 32767 bind parameters, so large fetches are
+# split into several multi-row INSERTs inside the same transaction
+BULK_INSERT_CHUNK_SIZE = 1000
+
 
 @retry(
     wait=wait_exponential(multiplier=1, min=1, max=10),
@@ -67,17 +76,55 @@ async def execute_with_retry(async_func: Callable[..., Any], *args, **kwargs) ->
             f"Function {async_func.__name__} must be an async function")
     return await async_func(*args, **kwargs)
 
+# --- Daily Rollup Maintenance ---
+
+
+async def upsert_daily_rollup(session: AsyncSession, articles: List[Dict[str, Any]]) -> None:
+    """
+    Add newly inserted articles to news_daily_rollup inside the caller's transaction.
+    Only pass rows that were actually inserted, otherwise duplicates get counted twice.
+    """
+    increments: Dict[tuple, Dict[str, Any]] = {}
+    for article in articles:
+        key = (article["pubDate"].date(), article["category"], article["source_id"])
+        totals = increments.setdefault(key, {
+            "day": key[0], "category": key[1], "source_id": key[2],
+            "article_count": 0, "sentiment_sum": 0.0,
+            "good_count": 0, "okay_count": 0, "bad_count": 0,
+        })
+        totals["article_count"] += 1
+        totals["sentiment_sum"] += article["sentiment"]
+        totals[f"{sentiment_bucket(article['sentiment'])}_count"] += 1
+
+    if not increments:
+        return
+
+    stmt = pg_insert(NewsDailyRollup).values(list(increments.values()))
+    counters = ("article_count", "sentiment_sum",
+                "good_count", "okay_count", "bad_count")
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["day", "category", "source_id"],
+        set_={name: getattr(NewsDailyRollup, name) + getattr(stmt.excluded, name)
+              for name in counters}
+    )
+    await session.execute(stmt)
+
 # --- News Processor Class ---
 
 
 class NewsProcessor:
-    # def __init__(self, news_url: str):
-    #     self.news_url = news_url
+    def __init__(self, bulk_insert: bool = True):
+        self.bulk_insert = bulk_insert
+        # Per-stage throughput and queue depths of the most recent run
+        self.last_pipeline_stats: Optional[Dict[str, Any]] = None
+
     async def insert_article(self, session: AsyncSession, data: Dict[str, Any]) -> bool:
         """Insert a single article into the database with retry logic."""
         try:
             article = NewsArticle(**data)
             session.add(article)
+            await session.flush()
+            await upsert_daily_rollup(session, [data])
             await session.commit()
             await session.refresh(article)
             logger.info(f"Inserted article: {data['title']}")
@@ -98,49 +145,152 @@ class NewsProcessor:
             await session.rollback()
             return False
 
-    async def process_news_data(self, session: AsyncSession) -> int:
-        """Fetch, process, and store news articles in the database."""
-        news = await NewsFetcher().fetch_news()
-        for value in news.values():
-            if value is None:
-                logger.info("No news fetched")
-                return 0
-
-        classifications = classify_articles(news["descriptions"])
-        inserted_count = 0
+    async def insert_articles(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert a batch of articles in one transaction and return how many rows were written.
+        The daily rollup is updated in the same transaction from the rows actually inserted.
+        """
+        if not rows:
+            return 0
+        try:
+            inserted = []
+            for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                stmt = (
+                    pg_insert(NewsArticle)
+                    .values(rows[start:start + BULK_INSERT_CHUNK_SIZE])
+                    .on_conflict_do_nothing(index_elements=["dedup_key"])
+                    .returning(NewsArticle.pubDate, NewsArticle.category,
+                               NewsArticle.source_id, NewsArticle.sentiment)
+                )
+                result = await session.execute(stmt)
+                inserted.extend(dict(row) for row in result.mappings())
+            await upsert_daily_rollup(session, inserted)
+            await session.commit()
+            inserted_count = len(inserted)
+            logger.info(
+                f"Bulk inserted {inserted_count} of {len(rows)} articles")
+            return inserted_count
+        except IntegrityError as e:
+            # Dedup-key conflicts are skipped by the insert; any other violation
+            # fails the same way on every retry
+            logger.warning(f"Skipping batch of {len(rows)} articles: {e}")
+            await session.rollback()
+            return 0
+        except RETRIABLE_DB_EXCEPTIONS as e:
+            logger.error(f"Retriable error bulk inserting articles: {e}")
+            await session.rollback()
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error bulk inserting articles: {e}")
+            await session.rollback()
+            return 0
 
-        for i, (country, description, pub_date, source_id, link, title) in enumerate(zip(
+    def prepare_articles(self, news: Dict[str, List[str]],
+                         seen_keys: set) -> List[PreparedArticle]:
+        """Parse one fetched page into (description, row) pairs, skipping repeats."""
+        prepared = []
+        for country, description, pub_date, source_id, link, title in zip(
             news['countries'], news['descriptions'], news['pubDates'],
             news['source_ids'], news['links'], news['titles']
-        )):
+        ):
             try:
                 dt = datetime.strptime(pub_date, '%Y-%m-%d %H:%M:%S')
-                sentiment = analyze_sentiment(description)
                 validated_link = link if is_valid_url(link) else None
+                dedup_key = article_dedup_key(validated_link, title, source_id)
+                if dedup_key in seen_keys:
+                    # Same story listed twice in one fetch
+                    continue
+                seen_keys.add(dedup_key)
 
-                data = {
+                prepared.append((description, {
                     "source_id": source_id,
-                    "sentiment": sentiment,
                     "country": country,
                     "pubDate": dt,
-                    "category": classifications[i],
                     "link": validated_link,
-                    "title": title
-                }
+                    "title": title,
+                    "description": description,
+                    "dedup_key": dedup_key
+                }))
+            except Exception as e:
+                logger.error(f"Failed to process article '{title}': {e}")
+        return prepared
+
+    async def write_rows(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+        """Store scored rows and return how many were inserted."""
+        if self.bulk_insert:
+            # One round-trip and one transaction per batch; retries replay the batch
+            try:
+                return await execute_with_retry(self.insert_articles, session, rows)
+            except Exception as e:
+                logger.error(f"Failed to bulk insert articles: {e}")
+                return 0
 
+        inserted_count = 0
+        for data in rows:
+            try:
                 success = await execute_with_retry(self.insert_article, session, data)
                 if success:
                     inserted_count += 1
             except Exception as e:
-                logger.error(f"Failed to process article '{title}': {e}")
+                logger.error(
+                    f"Failed to insert article '{data['title']}': {e}")
+        return inserted_count
+
+    async def _latest_news(self, fetcher: NewsFetcher) -> AsyncIterator[Dict[str, List[str]]]:
+        """The single /latest fetch as a one-page stream."""
+        news = await fetcher.fetch_news()
+        if not news or any(value is None for value in news.values()):
+            logger.info("No news fetched")
+            return
+        yield news
+
+    async def process_news_data(self, session: AsyncSession) -> int:
+        """Fetch, process, and store news articles in the database."""
+        fetcher = NewsFetcher()
+        seen_keys: set = set()
+        if os.getenv("NEWS_FETCH_MODE", "latest") == "paginated":
+            source = fetcher.stream_news
+        else:
+            source = partial(self._latest_news, fetcher)
+
+        # Repeated descriptions come from the prediction cache; the rest are scored
+        # in the NLP worker pool when NLP_POOL_SIZE is set
+        pipeline = IngestPipeline(
+            source=source,
+            parse=lambda page: self.prepare_articles(page, seen_keys),
+            score=predict_with_cache,
+            write=lambda rows: self.write_rows(session, rows),
+            queue_size=int(os.getenv("INGEST_QUEUE_SIZE", "4")),
+            score_batch_size=int(os.getenv("INGEST_SCORE_BATCH", "256")),
+            write_batch_size=int(os.getenv("INGEST_WRITE_BATCH", "500")),
+        )
+        inserted_count = await pipeline.run()
+        self.last_pipeline_stats = pipeline.stats()
 
         logger.info(
-            f"Successfully processed {inserted_count} of {len(news['titles'])} articles")
+            f"Successfully processed {inserted_count} of "
+            f"{self.last_pipeline_stats['stages']['fetch']['items']} articles")
         return inserted_count
 
+    async def attach_shared_prediction_cache(self) -> None:
+        """Back the prediction cache with Redis so every scheduler process shares it."""
+        cache = get_prediction_cache()
+        redis_url = os.getenv("REDIS_URL")
+        if cache.redis_client is not None or not redis_url:
+            return
+        from app.redis_logic.async_redis import RedisClient
+        client = RedisClient(redis_url)
+        try:
+            await client.initialize()
+            cache.redis_client = client
+        except Exception as e:
+            logger.warning(f"Prediction cache running without Redis tier: {e}")
+            await client.close()
+
     async def store_in_db(self) -> None:
         """Main method to create tables, process news, and store in Redis."""
-        await create_tables()
+        await migrate()
+        await self.attach_shared_prediction_cache()
         async with AsyncSessionLocal() as session:
             try:
                 inserted_count = await self.process_news_data(session)
@@ -158,7 +308,12 @@ class NewsProcessor:
 
 async def main_test():
     processor = NewsProcessor()
-    await processor.store_in_db()
+    try:
+        await processor.store_in_db()
+    finally:
+        await close_prediction_cache()
+        await close_http_clients()
+        shutdown_nlp_pool()
 
 if __name__ == "__main__":
     asyncio.run(main_test())
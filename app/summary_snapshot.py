@@ -0,0 +1,72 @@
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+# --- Configure Logging ---
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Holds the version of the last complete snapshot; never expires
+CURRENT_POINTER = "summary:current"
+# Each new version is announced here once the pointer has moved (app.dashboard_cache)
+SNAPSHOT_CHANNEL = "summary:published"
+# The live snapshot never expires, however long it is until the next refresh
+# (store_in_db only refreshes after inserting new rows). A snapshot gets this
+# TTL once it is replaced, which leaves readers still on it time to finish.
+SNAPSHOT_TTL = int(os.getenv("SUMMARY_SNAPSHOT_TTL", str(3 * 24 * 3600)))
+
+
+def new_version() -> str:
+    return datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+
+
+def snapshot_key(version: Optional[str], key: str) -> str:
+    """
+    Where `key` (e.g. "weekly_sports" or "weekly_sports:figures") lives in a
+    snapshot. Without a version, the unversioned key written before snapshots
+    existed, so a deploy keeps serving until the first versioned refresh.
+    """
+    return f"summary:{version}:{key}" if version else key
+
+
+def snapshot_pattern(version: str) -> str:
+    """Glob matching every key of a snapshot."""
+    return f"summary:{version}:*"
+
+
+async def publish_snapshot(client, values: Dict[str, Union[str, bytes]]) -> Optional[str]:
+    """
+    Write `values` under a new version, point CURRENT_POINTER at it, start
+    the previous version's SNAPSHOT_TTL and announce the new one on
+    SNAPSHOT_CHANNEL.
+    `client` is an app.redis_logic.async_redis.RedisClient. Returns the new
+    version, or None if the snapshot could not be written (the pointer is left
+    on the previous, complete one).
+    """
+    version = new_version()
+    previous = await client.get(CURRENT_POINTER)
+    written = await client.set_many(
+        {snapshot_key(version, key): value for key, value in values.items()})
+    if not written or not await client.set(CURRENT_POINTER, version):
+        logger.error(f"Summary snapshot {version} not published")
+        if written:
+            # Nothing points at it, so it must not stay forever
+            await client.expire_matching(snapshot_pattern(version), SNAPSHOT_TTL)
+        return None
+    if previous and previous != version:
+        expiring = await client.expire_matching(snapshot_pattern(previous), SNAPSHOT_TTL)
+        logger.info(f"Summary snapshot {previous} replaced; {expiring} keys expire in {SNAPSHOT_TTL}s")
+    # Dashboards that miss this still pick the version up on their next recheck
+    listeners = await client.publish(SNAPSHOT_CHANNEL, version)
+    logger.info(f"Published summary snapshot {version} ({len(values)} keys, "
+                f"{listeners} dashboard processes notified)")
+    return version
+
+
+def current_version(client) -> Optional[str]:
+    """Snapshot a request should read from; resolve it once and pass it along."""
+    version = client.get(CURRENT_POINTER)
+    # Payload readers use binary clients (see app.redis_logic.codec)
+    return version.decode("ascii") if isinstance(version, bytes) else version
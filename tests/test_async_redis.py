@@ -0,0 +1,99 @@
+import asyncio
+
+from redis.exceptions import ConnectionError
+
+
+def spy_pipelines(client):
+    """Record (transaction, queued command names) for every pipeline the client executes."""
+    executed = []
+    make_pipeline = client.client.pipeline
+
+    def pipeline(transaction=True, **kwargs):
+        pipe = make_pipeline(transaction=transaction, **kwargs)
+        execute = pipe.execute
+
+        async def counted_execute(*args, **execute_kwargs):
+            executed.append((transaction, [str(args[0]).upper() for args, _ in pipe.command_stack]))
+            return await execute(*args, **execute_kwargs)
+
+        pipe.execute = counted_execute
+        return pipe
+
+    client.client.pipeline = pipeline
+    return executed
+
+
+def count_pings(client):
+    pings = []
+    ping = client.client.ping
+
+    async def counted_ping(*args, **kwargs):
+        pings.append(1)
+        return await ping(*args, **kwargs)
+
+    client.client.ping = counted_ping
+    return pings
+
+
+def test_set_many_with_ttl_is_one_transaction(async_client):
+    executed = spy_pipelines(async_client)
+    mapping = {f"summary:v1:key{i}": f"value{i}" for i in range(5)}
+
+    async def scenario():
+        assert await async_client.set_many(mapping, ex=120)
+        return ([await async_client.client.get(key) for key in mapping],
+                [await async_client.client.ttl(key) for key in mapping])
+
+    values, ttls = asyncio.run(scenario())
+
+    assert executed == [(True, ["SET"] * 5)]
+    assert values == list(mapping.values())
+    assert all(0 < ttl <= 120 for ttl in ttls)
+
+
+def test_set_many_without_ttl_is_one_mset(async_client):
+    executed = spy_pipelines(async_client)
+
+    async def scenario():
+        assert await async_client.set_many({"a": "1", "b": "2"}, transaction=False)
+        return await async_client.client.ttl("a"), await async_client.mget(["a", "b"])
+
+    ttl, values = asyncio.run(scenario())
+
+    assert executed == [(False, ["MSET"])]
+    assert ttl == -1
+    assert values == ["1", "2"]
+
+
+def test_commands_do_not_ping(async_client):
+    pings = count_pings(async_client)
+
+    async def scenario():
+        for i in range(5):
+            assert await async_client.set(f"key{i}", str(i))
+            assert await async_client.get(f"key{i}") == str(i)
+        await async_client.set_many({"x": "1", "y": "2"}, ex=60)
+
+    asyncio.run(scenario())
+
+    assert pings == []
+
+
+def test_connection_error_pings_once_before_the_retry(async_client, no_retry_wait):
+    pings = count_pings(async_client)
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ConnectionError("connection reset")
+        return "ok"
+
+    async def scenario():
+        assert await async_client.execute_command(flaky) == "ok"
+        assert await async_client.get("missing") is None
+
+    asyncio.run(scenario())
+
+    assert len(calls) == 2
+    assert pings == [1]
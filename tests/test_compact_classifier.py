@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+
+from app.models.compact_classifier import CompactClassifier
+from app.models.news_classifier import model_path, x
+
+TRAIN = [
+    ("Striker scores twice as United beat City in the derby", "Sports"),
+    ("Coach praises the defence after a narrow cup win", "Sports"),
+    ("Tennis champion reaches the final without dropping a set", "Sports"),
+    ("Shares fall as the central bank raises interest rates", "Business"),
+    ("Retailer reports record quarterly profit and raises guidance", "Business"),
+    ("Oil prices climb on supply fears, lifting energy stocks", "Business"),
+    ("Chipmaker unveils a faster processor for AI data centres", "Sci/Tech"),
+    ("Researchers publish a new model that writes software", "Sci/Tech"),
+    ("Space agency launches a probe to study the outer planets", "Sci/Tech"),
+    ("Leaders meet for ceasefire talks as the war enters a second year", "World"),
+    ("Election results spark protests in the capital", "World"),
+    ("Foreign ministers sign a trade pact at the summit", "World"),
+]
+
+TEXTS = x + [
+    "Bank profit beats forecasts",
+    "STRIKER, STRIKER, striker!",
+    "the and of",
+    "",
+    "Summit talks on processor exports stall as shares fall",
+]
+
+
+def fit(pairs, **vectorizer_options):
+    texts, labels = zip(*pairs)
+    return Pipeline([
+        ("vectorizer", TfidfVectorizer(**vectorizer_options)),
+        ("classifier", LogisticRegression(max_iter=300)),
+    ]).fit(texts, labels)
+
+
+@pytest.mark.parametrize("sublinear_tf", [False, True])
+def test_compact_export_agrees_with_the_pipeline(sublinear_tf):
+    pipeline = fit(TRAIN, sublinear_tf=sublinear_tf)
+    compact = CompactClassifier.from_pipeline(pipeline)
+
+    assert compact.predict(TEXTS).tolist() == pipeline.predict(TEXTS).tolist()
+    np.testing.assert_allclose(compact.decision_function(TEXTS),
+                               pipeline.decision_function(TEXTS), atol=1e-5)
+
+
+def test_binary_pipeline_export():
+    pairs = [(text, "Sports" if label == "Sports" else "Other") for text, label in TRAIN]
+    pipeline = fit(pairs)
+    compact = CompactClassifier.from_pipeline(pipeline)
+
+    assert compact.predict(TEXTS).tolist() == pipeline.predict(TEXTS).tolist()
+
+
+def test_saved_model_predicts_the_same(tmp_path):
+    pipeline = fit(TRAIN)
+    path = str(tmp_path / "compact.npz")
+    CompactClassifier.from_pipeline(pipeline).save(path)
+
+    assert CompactClassifier.load(path).predict(TEXTS).tolist() == pipeline.predict(TEXTS).tolist()
+    assert CompactClassifier.load(path).predict([]).tolist() == []
+
+
+def test_bigram_pipeline_is_rejected():
+    with pytest.raises(ValueError):
+        CompactClassifier.from_pipeline(fit(TRAIN, ngram_range=(1, 2)))
+
+
+@pytest.mark.skipif(not os.path.exists(model_path), reason="ag_news_classifier.pkl not present")
+def test_compact_export_of_the_ag_news_model():
+    from app.models.news_classifier import get_model
+    pipeline = get_model()
+    compact = CompactClassifier.from_pipeline(pipeline)
+
+    assert compact.predict(TEXTS).tolist() == np.asarray(pipeline.predict(TEXTS)).astype(str).tolist()
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import fakeredis
+import pytest
+
+from app.dashboard_cache import DashboardCache
+from app.figures import figures_key
+from app.redis_logic.codec import encode_payload
+from app.summary_snapshot import publish_snapshot
+
+
+def figures(label):
+    return {"line": {"data": [], "layout": {"title": label}}, "pie": {}, "table": []}
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for the dashboard cache")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def cache(server, sync_redis):
+    cache = DashboardCache(sync_redis, fakeredis.FakeRedis(server=server), recheck=300)
+    yield cache
+    cache.stop()
+
+
+def publish(async_client, label):
+    values = {figures_key("monthly_summary"): encode_payload(figures(label))}
+    return asyncio.run(publish_snapshot(async_client, values))
+
+
+def test_figures_are_served_from_memory_until_a_new_snapshot(cache, async_client):
+    first = publish(async_client, "first")
+    cache.start()
+    wait_for(cache._subscribed.is_set)
+
+    assert cache.figures("monthly_summary") == figures("first")
+    assert cache.figures("monthly_summary") == figures("first")
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.version() == first
+
+    second = publish(async_client, "second")
+    wait_for(lambda: cache.stats()["version"] == second)
+
+    assert cache.figures("monthly_summary") == figures("second")
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 2
+
+
+def test_missing_snapshot_is_not_cached(cache):
+    assert cache.figures("weekly_sports") is None
+    assert cache.stats()["entries"] == 0
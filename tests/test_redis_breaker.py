@@ -0,0 +1,201 @@
+import threading
+
+import pytest
+from redis.exceptions import ConnectionError, ResponseError
+
+from app.redis_logic import breaker
+from app.redis_logic.breaker import BreakerRedis
+from app.redis_logic.redis import (CircuitBreaker, CircuitOpenError, PoolExhaustedError,
+                                   RedisClient)
+
+
+@pytest.fixture
+def client(sync_redis, monkeypatch):
+    monkeypatch.setenv("REDIS_BREAKER_THRESHOLD", "2")
+    monkeypatch.setenv("REDIS_BREAKER_COOLDOWN", "60")
+    client = RedisClient(decode_responses=False)
+    client.client = sync_redis
+    return client
+
+
+def test_breaker_opens_at_the_threshold():
+    breaker = CircuitBreaker(cooldown=60, failure_threshold=2)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.can_execute()
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.can_execute()
+
+
+def test_half_open_allows_a_single_probe():
+    breaker = CircuitBreaker(cooldown=0, failure_threshold=1)
+    breaker.record_failure()
+
+    assert breaker.can_execute()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.can_execute()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.can_execute() and breaker.can_execute()
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(cooldown=60, failure_threshold=3)
+    for _ in range(3):
+        breaker.record_failure()
+    breaker.cooldown = 0
+    assert breaker.can_execute()
+
+    breaker.cooldown = 60
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.can_execute()
+
+
+def test_probe_is_released_by_its_own_thread_only():
+    breaker = CircuitBreaker(cooldown=0, failure_threshold=1)
+    breaker.record_failure()
+    assert breaker.can_execute()
+
+    other = threading.Thread(target=breaker.release_probe)
+    other.start()
+    other.join()
+    assert not breaker.can_execute()
+
+    breaker.release_probe()
+    assert breaker.can_execute()
+
+
+def test_open_breaker_skips_redis(client, no_retry_wait):
+    calls = []
+
+    def down(redis_client):
+        calls.append(1)
+        raise ConnectionError("connection refused")
+
+    with pytest.raises(CircuitOpenError):
+        client.execute_command(down)
+    assert len(calls) == 2
+
+    with pytest.raises(CircuitOpenError):
+        client.execute_command(down)
+    assert len(calls) == 2
+    assert client.get("anything") is None
+
+
+def test_probe_ending_in_an_unrelated_error_frees_the_breaker(client):
+    client.circuit_breaker.cooldown = 0
+    client.circuit_breaker.failure_threshold = 1
+    client.circuit_breaker.record_failure()
+
+    def broken(redis_client):
+        raise ValueError("bug in the caller")
+
+    with pytest.raises(ValueError):
+        client.execute_command(broken)
+
+    assert client.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+    assert client.set("key", "value")
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_pool_exhaustion_is_not_an_outage(client):
+    calls = []
+
+    def exhausted(redis_client):
+        calls.append(1)
+        raise ConnectionError("No connection available.")
+
+    for _ in range(3):
+        with pytest.raises(PoolExhaustedError):
+            client.execute_command(exhausted)
+
+    assert len(calls) == 3
+    assert client.circuit_breaker.failures == 0
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+    assert not client._needs_check
+
+
+def test_commands_do_not_ping(client, monkeypatch):
+    pings = []
+    monkeypatch.setattr(client.client, "ping", lambda: pings.append(1) or True)
+
+    for i in range(5):
+        assert client.set(f"key{i}", str(i))
+        assert client.get(f"key{i}") == str(i).encode()
+
+    assert pings == []
+
+
+def test_reconnect_check_keeps_the_shared_client(client, no_retry_wait, monkeypatch):
+    pings = []
+    monkeypatch.setattr(client.client, "ping", lambda: pings.append(1) or True)
+    shared = client.client
+    calls = []
+
+    def flaky(redis_client):
+        calls.append(1)
+        if len(calls) == 1:
+            raise ConnectionError("connection reset")
+        return "ok"
+
+    assert client.execute_command(flaky) == "ok"
+    assert pings == [1]
+    assert client.client is shared
+
+
+@pytest.fixture
+def request_breaker(monkeypatch):
+    shared = CircuitBreaker(cooldown=60, failure_threshold=2)
+    monkeypatch.setattr(breaker, "_request_breaker", shared)
+    return shared
+
+
+def test_request_path_client_stops_calling_a_dead_redis(server, sync_redis, request_breaker):
+    page_client = BreakerRedis(connection_pool=sync_redis.connection_pool)
+    assert page_client.circuit_breaker is request_breaker
+    page_client.set("key", "value")
+
+    server.connected = False
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            page_client.get("key")
+    assert request_breaker.is_open
+
+    # Back up, but the breaker turns requests away until the cooldown is over
+    server.connected = True
+    with pytest.raises(CircuitOpenError):
+        page_client.get("key")
+
+    request_breaker.cooldown = 0
+    assert page_client.get("key") == b"value"
+    assert request_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_redis_errors_from_a_live_server_keep_the_breaker_closed(sync_redis, request_breaker):
+    page_client = BreakerRedis(connection_pool=sync_redis.connection_pool)
+    page_client.set("key", "value")
+
+    for _ in range(3):
+        with pytest.raises(ResponseError):
+            page_client.lpush("key", "x")
+    assert request_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_pipelines_go_through_the_breaker(server, sync_redis, request_breaker):
+    page_client = BreakerRedis(connection_pool=sync_redis.connection_pool)
+
+    server.connected = False
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            page_client.pipeline().get("key").incr("hits").execute()
+    assert request_breaker.is_open
+
+    server.connected = True
+    with pytest.raises(CircuitOpenError):
+        page_client.pipeline().get("key").execute()
+
+    request_breaker.cooldown = 0
+    assert page_client.pipeline().set("key", "v").get("key").execute() == [True, b"v"]
+    assert request_breaker.state == CircuitBreaker.CLOSED
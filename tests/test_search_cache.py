@@ -0,0 +1,88 @@
+import threading
+import time
+
+import fakeredis
+import pytest
+
+from app.search_cache import SearchCache
+
+RESULT = (["2025-06-01 10:00:00"], [0.4], [1, 0, 0],
+          [{"title": "Headline", "link": "https://example.com/a"}])
+NO_ARTICLES = ([], [], [0, 0, 0], [{"title": "Headline", "link": "https://example.com/a"}])
+
+
+class CountingSearch:
+    def __init__(self, result=RESULT, delay=0.0):
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, query):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self.result
+
+
+@pytest.fixture
+def text_redis(server):
+    return fakeredis.FakeRedis(server=server, decode_responses=True)
+
+
+def test_concurrent_identical_searches_compute_once(text_redis):
+    search = CountingSearch(delay=0.3)
+    cache = SearchCache(text_redis, compute=search, wait_timeout=5)
+    results = []
+
+    def run():
+        results.append(cache.get("  Climate   Change "))
+
+    threads = [threading.Thread(target=run) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert search.calls == 1
+    assert [list(result) for result in results] == [list(RESULT)] * 6
+
+
+def test_result_is_stored_before_the_lock_is_released(text_redis):
+    cache = SearchCache(text_redis, compute=CountingSearch())
+    result_key, _, _ = cache._keys("climate change")
+    release = cache._release
+    stored_at_release = []
+
+    def checked_release(keys, args):
+        stored_at_release.append(text_redis.exists(result_key))
+        return release(keys=keys, args=args)
+
+    cache._release = checked_release
+    cache.get("climate change")
+
+    assert stored_at_release == [1]
+
+
+def test_searches_without_articles_are_cached_briefly(text_redis):
+    search = CountingSearch(result=NO_ARTICLES)
+    cache = SearchCache(text_redis, compute=search, ttl=600, negative_ttl=30)
+
+    assert list(cache.get("no such thing")) == list(NO_ARTICLES)
+    assert list(cache.get("No such  thing")) == list(NO_ARTICLES)
+
+    result_key, _, _ = cache._keys("no such thing")
+    assert search.calls == 1
+    assert 0 < text_redis.ttl(result_key) <= 30
+
+
+def test_expired_negative_entry_is_recomputed(text_redis):
+    search = CountingSearch(result=NO_ARTICLES)
+    cache = SearchCache(text_redis, compute=search, negative_ttl=30)
+    cache.get("no such thing")
+
+    result_key, _, _ = cache._keys("no such thing")
+    text_redis.delete(result_key)
+    cache.get("no such thing")
+
+    assert search.calls == 2
@@ -0,0 +1,30 @@
+from app.models.sentiment import analyze_sentiment, analyze_sentiments
+
+TEXTS = [
+    "Everyone in the world is sad",
+    "The match was GREAT, but the food was awful!!",
+    "Markets are not doing well this quarter",
+    "Stocks rally as inflation cools???",
+    "It was kind of a disappointing launch",
+    "Officials are extremely worried about the flooding",
+    "Fans celebrate the win 😀 🎉",
+    "Quarterly earnings report released",
+    "",
+    "   ",
+    "Never so happy, never so good! Amazing!!!!!",
+    "The deal wasn't bad at all, but nobody expected it to be GOOD",
+    "Everyone in the world is sad",
+]
+
+
+def test_batch_scores_match_single_text_scores():
+    assert analyze_sentiments(TEXTS) == [analyze_sentiment(text) for text in TEXTS]
+
+
+def test_each_text_scores_the_same_alone_and_in_a_batch():
+    batch = analyze_sentiments(TEXTS)
+    assert [analyze_sentiments([text])[0] for text in TEXTS] == batch
+
+
+def test_empty_batch():
+    assert analyze_sentiments([]) == []
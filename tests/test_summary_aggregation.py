@@ -0,0 +1,105 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.data_extraction.summary_aggregation import build_summary_payloads
+from app.db_logic.models import sentiment_bucket
+
+NOW = datetime(2025, 6, 30, 15, 0)
+
+# (pubDate, category, source_id, sentiment)
+ARTICLES = [
+    (datetime(2025, 6, 30, 9, 0), "Sports", "bbc", 0.8),
+    (datetime(2025, 6, 30, 11, 0), "Sports", "bbc", -0.5),
+    (datetime(2025, 6, 29, 8, 0), "Business", "reuters", 0.1),
+    (datetime(2025, 6, 29, 20, 0), "Sports", "espn", 0.6),
+    (datetime(2025, 6, 23, 0, 0), "Business", "bbc", -0.9),
+    (datetime(2025, 6, 22, 23, 0), "World", "reuters", 0.3),
+    (datetime(2025, 6, 10, 12, 0), "Sports", "espn", -0.2),
+    (datetime(2025, 5, 31, 12, 0), "World", "aljazeera", 0.5),
+    (datetime(2025, 5, 20, 12, 0), "World", "aljazeera", 0.9),
+]
+
+PERIODS = {"monthly": 30, "weekly": 7}
+CATEGORIES = {"summary": None, "sports": "Sports", "world": "World"}
+
+
+def rollup(articles):
+    """Daily rollup rows as upsert_daily_rollup accumulates them."""
+    rows = {}
+    for pub_date, category, source_id, sentiment in articles:
+        key = (pub_date.date(), category, source_id)
+        row = rows.setdefault(key, SimpleNamespace(
+            day=key[0], category=category, source_id=source_id, article_count=0,
+            sentiment_sum=0.0, good_count=0, okay_count=0, bad_count=0))
+        row.article_count += 1
+        row.sentiment_sum += sentiment
+        bucket = f"{sentiment_bucket(sentiment)}_count"
+        setattr(row, bucket, getattr(row, bucket) + 1)
+    return list(rows.values())
+
+
+def expected_payload(articles, since, category):
+    """The payload computed straight from articles, as the per-article queries did."""
+    selected = [a for a in articles
+                if a[0].date() >= since and (category is None or a[1] == category)]
+    by_day, by_source = defaultdict(list), defaultdict(list)
+    pie = {"good": 0, "okay": 0, "bad": 0}
+    for pub_date, _, source_id, sentiment in selected:
+        by_day[pub_date.date()].append(sentiment)
+        by_source[source_id].append(sentiment)
+        pie[sentiment_bucket(sentiment)] += 1
+    return {
+        "line_graph": {day.strftime("%Y-%m-%d %H:%M:%S"): pytest.approx(sum(s) / len(s))
+                       for day, s in sorted(by_day.items())},
+        "pie_chart": pie,
+        "counts": {source: len(s) for source, s in by_source.items()},
+        "averages": {source: pytest.approx(sum(s) / len(s), abs=1e-4)
+                     for source, s in by_source.items()},
+    }
+
+
+def test_payloads_match_the_per_article_aggregation():
+    payloads = build_summary_payloads(rollup(ARTICLES), PERIODS, CATEGORIES, now=NOW)
+
+    assert set(payloads) == {f"{p}_{c}" for p in PERIODS for c in CATEGORIES}
+    for period, days in PERIODS.items():
+        since = (NOW - timedelta(days=days)).date()
+        for label, category in CATEGORIES.items():
+            payload = payloads[f"{period}_{label}"]
+            expected = expected_payload(ARTICLES, since, category)
+
+            assert payload["line_graph"] == expected["line_graph"]
+            assert payload["pie_chart"] == expected["pie_chart"]
+            assert {s["source"]: s["article_count"] for s in payload["top_sources"]} \
+                == expected["counts"]
+            assert {s["source"]: s["avg_sentiment"] for s in payload["top_sources"]} \
+                == expected["averages"]
+
+
+def test_oldest_day_of_a_period_is_counted_in_full():
+    payloads = build_summary_payloads(rollup(ARTICLES), {"weekly": 7}, {"summary": None},
+                                      now=NOW)
+    # 2025-06-23 00:00 and 2025-06-22 23:00 sit on either side of the day boundary
+    assert "2025-06-23 00:00:00" in payloads["weekly_summary"]["line_graph"]
+    assert "2025-06-22 00:00:00" not in payloads["weekly_summary"]["line_graph"]
+
+
+def test_top_sources_are_ordered_and_capped():
+    articles = [(datetime(2025, 6, 30), "World", f"source{i}", 0.1)
+                for i in range(12) for _ in range(i + 1)]
+    payload = build_summary_payloads(rollup(articles), {"weekly": 7}, {"summary": None},
+                                     now=NOW)["weekly_summary"]
+
+    counts = [source["article_count"] for source in payload["top_sources"]]
+    assert counts == sorted(counts, reverse=True)
+    assert [source["source"] for source in payload["top_sources"]] == \
+        [f"source{i}" for i in range(11, 1, -1)]
+
+
+def test_no_rows_gives_empty_payloads():
+    payloads = build_summary_payloads([], PERIODS, {"summary": None}, now=NOW)
+    assert payloads["monthly_summary"] == {
+        "line_graph": {}, "pie_chart": {"good": 0, "okay": 0, "bad": 0}, "top_sources": []}
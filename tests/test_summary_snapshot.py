@@ -0,0 +1,64 @@
+import asyncio
+
+import redis
+
+from app.summary_snapshot import (CURRENT_POINTER, SNAPSHOT_CHANNEL, SNAPSHOT_TTL,
+                                  current_version, publish_snapshot, snapshot_key)
+
+
+def test_publish_moves_the_pointer_and_announces_the_version(async_client, sync_redis):
+    pubsub = sync_redis.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(SNAPSHOT_CHANNEL)
+
+    version = asyncio.run(publish_snapshot(async_client, {"weekly_world": "{}"}))
+
+    assert version is not None
+    assert current_version(sync_redis) == version
+    assert sync_redis.get(snapshot_key(version, "weekly_world")) == b"{}"
+    # The first read only consumes the subscribe confirmation
+    messages = [pubsub.get_message(timeout=1.0) for _ in range(2)]
+    assert [m["data"] for m in messages if m] == [version.encode("ascii")]
+
+
+def test_failed_write_leaves_the_pointer_on_the_previous_snapshot(async_client, sync_redis,
+                                                                  monkeypatch):
+    sync_redis.set(CURRENT_POINTER, "previous")
+
+    async def failing_pipeline(*args, **kwargs):
+        raise redis.ResponseError("OOM command not allowed when used memory > 'maxmemory'")
+
+    monkeypatch.setattr(async_client, "_write_pipeline", failing_pipeline)
+
+    assert asyncio.run(publish_snapshot(async_client, {"weekly_world": "{}"})) is None
+    assert current_version(sync_redis) == "previous"
+    assert sync_redis.keys("summary:*:weekly_world") == []
+
+
+def test_live_snapshot_never_expires_and_the_replaced_one_does(async_client, sync_redis):
+    first = asyncio.run(publish_snapshot(async_client, {"weekly_world": "{}", "monthly_summary": "{}"}))
+    assert sync_redis.ttl(snapshot_key(first, "weekly_world")) == -1
+
+    second = asyncio.run(publish_snapshot(async_client, {"weekly_world": "{}"}))
+
+    assert current_version(sync_redis) == second
+    assert sync_redis.ttl(snapshot_key(second, "weekly_world")) == -1
+    for key in ("weekly_world", "monthly_summary"):
+        assert 0 < sync_redis.ttl(snapshot_key(first, key)) <= SNAPSHOT_TTL
+
+
+def test_unpublished_snapshot_expires(async_client, sync_redis, monkeypatch):
+    sync_redis.set(CURRENT_POINTER, "previous")
+    set_pointer = async_client.set
+
+    async def pointer_write_fails(key, value, ex=None):
+        if key == CURRENT_POINTER:
+            return False
+        return await set_pointer(key, value, ex=ex)
+
+    monkeypatch.setattr(async_client, "set", pointer_write_fails)
+
+    assert asyncio.run(publish_snapshot(async_client, {"weekly_world": "{}"})) is None
+    assert current_version(sync_redis) == "previous"
+    orphans = sync_redis.keys("summary:*:weekly_world")
+    assert len(orphans) == 1
+    assert 0 < sync_redis.ttl(orphans[0]) <= SNAPSHOT_TTL